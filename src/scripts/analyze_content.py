@@ -1,6 +1,13 @@
 import sys
 import json
 import os
+import re
+import hashlib
+import base64
+import asyncio
+import sqlite3
+from contextlib import redirect_stdout
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple, Any
 
 # 필요한 라이브러리 동적 설치
@@ -9,58 +16,224 @@ def ensure_installed(package: str) -> None:
         __import__(package)
     except ImportError:
         import subprocess
-        subprocess.check_call([sys.executable, "-m", "pip", "install", package])
+        # stdout은 JSON 결과 전용이므로 pip 출력은 stderr로 보냄 (워커 모드 응답 순서가 어긋나지 않도록)
+        subprocess.check_call([sys.executable, "-m", "pip", "install", package], stdout=sys.stderr)
 
 # 필요한 패키지 설치
 ensure_installed("openai")
 ensure_installed("numpy")
-ensure_installed("tiktoken")
+ensure_installed("orjson")
 
 # 설치 후 임포트
 import openai
 import numpy as np
-import tiktoken
-from openai import OpenAI
+import orjson
+from openai import AsyncOpenAI
+
+# 선택적 가속 라이브러리 (설치되지 않은 경우 순수 Python 경로 사용)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+try:
+    import simsimd
+except ImportError:
+    simsimd = None
 
 # API 키 설정
 openai.api_key = os.environ.get("OPENAI_API_KEY", "")
 
-# 명령줄 인자로 전달된 데이터 처리
-try:
-    input_data = {
+# 명령줄 인자로 전달된 데이터 처리 (단일 실행 모드)
+def parse_cli_input() -> Dict[str, Any]:
+    return {
         "content": sys.argv[1],
         "categories": json.loads(sys.argv[2]),
         "llmProvider": sys.argv[3],
         "model": sys.argv[4]
     }
-except (IndexError, json.JSONDecodeError) as e:
-    print(f"입력 인자 처리 오류: {str(e)}")
-    sys.exit(1)
+
+# 토크나이저는 첫 사용 시 한 번만 생성 (설치되지 않은 경우 길이 기반 추정 사용)
+# 임베딩 모델(text-embedding-3-small)과 같은 cl100k_base 사용, rs-bpe 우선 / 없으면 tiktoken
+_ENC = None
+_ENC_LOADED = False
+
+def get_encoding():
+    global _ENC, _ENC_LOADED
+    if not _ENC_LOADED:
+        _ENC_LOADED = True
+        try:
+            from rs_bpe.bpe import openai as rs_bpe_openai
+            _ENC = rs_bpe_openai.cl100k_base()
+        except ImportError:
+            try:
+                import tiktoken
+                _ENC = tiktoken.get_encoding("cl100k_base")
+            except Exception:
+                _ENC = None
+    return _ENC
+
+# 임베딩 차원 (text-embedding-3 계열은 차원 축소 지원, 카테고리 분류에는 512차원으로 충분)
+EMBEDDING_DIMENSIONS = 512
+
+# 카테고리 임베딩 디스크 캐시 (모델 + 설명 해시 기준)
+CATEGORY_EMBEDDING_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "category_embeddings_cache.json"
+)
+
+# 워커 모드에서는 한 번 읽은 캐시를 요청 간에 재사용
+category_embedding_cache = None
+
+def load_category_embedding_cache() -> Dict[str, list]:
+    global category_embedding_cache
+    if category_embedding_cache is None:
+        try:
+            with open(CATEGORY_EMBEDDING_CACHE_PATH, "r", encoding="utf-8") as f:
+                category_embedding_cache = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            category_embedding_cache = {}
+    return category_embedding_cache
+
+def save_category_embedding_cache(cache: Dict[str, list]) -> None:
+    try:
+        with open(CATEGORY_EMBEDDING_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except OSError:
+        # 캐시 저장 실패는 분석 결과에 영향을 주지 않음
+        pass
+
+def category_cache_key(description: str, model: str) -> str:
+    return hashlib.sha256(f"{model}:{EMBEDDING_DIMENSIONS}:{description}".encode("utf-8")).hexdigest()
+
+# 임베딩을 벡터별 스케일과 함께 int8로 양자화 (캐시 크기 1/4)
+def quantize_embedding(embedding: list) -> Dict[str, Any]:
+    vector = np.asarray(embedding, dtype=np.float32)
+    max_abs = float(np.max(np.abs(vector))) or 1.0
+    scale = 127.0 / max_abs
+    quantized = np.round(vector * scale).astype(np.int8)
+    return {"q": base64.b64encode(quantized.tobytes()).decode("ascii"), "scale": scale}
+
+def dequantize_embedding(entry: Any) -> np.ndarray:
+    if isinstance(entry, dict):
+        quantized = np.frombuffer(base64.b64decode(entry["q"]), dtype=np.int8)
+        return quantized.astype(np.float32) / entry["scale"]
+    # 양자화 이전 형식의 캐시 항목
+    return np.asarray(entry, dtype=np.float32)
+
+# 콘텐츠 임베딩 디스크 캐시 (콘텐츠 해시 + 모델 기준, float32 바이트로 저장)
+CONTENT_EMBEDDING_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "content_embeddings_cache.db"
+)
+
+content_embedding_db = None
+
+def get_content_embedding_db() -> Optional[sqlite3.Connection]:
+    global content_embedding_db
+    if content_embedding_db is None:
+        try:
+            content_embedding_db = sqlite3.connect(CONTENT_EMBEDDING_CACHE_PATH)
+            content_embedding_db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (hash TEXT NOT NULL, model TEXT NOT NULL, vector BLOB NOT NULL, PRIMARY KEY (hash, model))"
+            )
+        except sqlite3.Error:
+            # 캐시를 사용할 수 없으면 매번 API 호출
+            content_embedding_db = None
+    return content_embedding_db
+
+def load_content_embedding(text_hash: str, model: str) -> Optional[list]:
+    db = get_content_embedding_db()
+    if db is None:
+        return None
+    try:
+        row = db.execute("SELECT vector FROM embeddings WHERE hash = ? AND model = ?", (text_hash, model)).fetchone()
+    except sqlite3.Error:
+        return None
+    return np.frombuffer(row[0], dtype=np.float32).tolist() if row else None
+
+def save_content_embedding(text_hash: str, model: str, embedding: list) -> None:
+    db = get_content_embedding_db()
+    if db is None:
+        return
+    try:
+        with db:
+            db.execute(
+                "INSERT OR REPLACE INTO embeddings (hash, model, vector) VALUES (?, ?, ?)",
+                (text_hash, model, np.asarray(embedding, dtype=np.float32).tobytes())
+            )
+    except sqlite3.Error:
+        # 캐시 저장 실패는 분석 결과에 영향을 주지 않음
+        pass
 
 # 콘텐츠 텍스트 토큰화
 def count_tokens(text: str) -> int:
+    encoding = get_encoding()
     try:
-        encoding = tiktoken.encoding_for_model("gpt-4o")
+        if hasattr(encoding, "count"):
+            # rs-bpe는 토큰 ID 생성 없이 개수만 계산
+            return encoding.count(text)
         return len(encoding.encode(text))
     except:
         # 단순 추정 (토큰화 실패 시)
         return len(text) // 4
 
-# 임베딩 생성
-def get_embedding(text: str, model: str = "text-embedding-3-small") -> list:
-    # 토큰 제한 확인 (8191 토큰으로 제한)
+# 임베딩 입력 길이 제한 (8191 토큰으로 제한)
+MAX_EMBEDDING_TOKENS = 8000
+# 토큰화 전 문자 수 상한 (혼합 문자 기준 약 8k 토큰)
+MAX_EMBEDDING_CHARS = 32000
+
+def truncate_for_embedding(text: str) -> str:
+    # 긴 입력에 대한 토큰화 비용을 제한하기 위해 먼저 문자 단위로 자름
+    text = text[:MAX_EMBEDDING_CHARS]
+    encoding = get_encoding()
+    if encoding is not None:
+        try:
+            if count_tokens(text) <= MAX_EMBEDDING_TOKENS:
+                return text
+            # 실제 토큰 경계 기준으로 축소
+            # (rs-bpe는 멀티바이트 문자 중간에서 잘리면 None을 반환하므로 최대 3토큰까지 물러남)
+            tokens = encoding.encode(text)
+            for end in range(MAX_EMBEDDING_TOKENS, MAX_EMBEDDING_TOKENS - 4, -1):
+                truncated = encoding.decode(tokens[:end])
+                if truncated is not None:
+                    return truncated
+        except Exception:
+            pass
+    
     token_count = count_tokens(text)
-    if token_count > 8000:
+    if token_count > MAX_EMBEDDING_TOKENS:
         # 토큰 수가 너무 많으면 텍스트 축소
-        ratio = 8000 / token_count
+        ratio = MAX_EMBEDDING_TOKENS / token_count
         text = text[:int(len(text) * ratio)]
-    
-    client = OpenAI()
-    response = client.embeddings.create(
-        input=text,
-        model=model
+    return text
+
+# 비동기 OpenAI 클라이언트 (첫 사용 시 생성 후 재사용)
+client = None
+
+def get_client() -> AsyncOpenAI:
+    global client
+    if client is None:
+        client = AsyncOpenAI()
+    return client
+
+# 임베딩 생성
+async def get_embedding(text: str, model: str = "text-embedding-3-small") -> list:
+    # 동일한 콘텐츠는 재실행 시 캐시된 임베딩 사용
+    text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    cache_model = f"{model}:{EMBEDDING_DIMENSIONS}"
+    embedding = load_content_embedding(text_hash, cache_model)
+    if embedding is None:
+        embedding = (await get_embeddings([text], model))[0]
+        save_content_embedding(text_hash, cache_model, embedding)
+    return embedding
+
+# 여러 텍스트의 임베딩을 한 번의 요청으로 생성
+async def get_embeddings(texts: List[str], model: str = "text-embedding-3-small") -> List[list]:
+    response = await get_client().embeddings.create(
+        input=[truncate_for_embedding(text) for text in texts],
+        model=model,
+        dimensions=EMBEDDING_DIMENSIONS
     )
-    return response.data[0].embedding
+    # 응답 순서는 index 필드 기준으로 정렬
+    return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
 
 # 카테고리별 대표 키워드
 category_keywords = {
@@ -102,25 +275,79 @@ category_keywords = {
     ]
 }
 
-# 사용자 정의 카테고리가 있는 경우 적용
-custom_categories = input_data.get("categories", [])
-if custom_categories:
-    # 사용자 정의 카테고리에 맞게 키워드 맵 조정
-    for category in custom_categories:
-        if category not in category_keywords:
-            # 새 카테고리의 경우 기본 키워드 생성
-            category_keywords[category] = [category, category.lower()] + category.split()
-
-# 콘텐츠에서 카테고리별 키워드 매칭 점수 계산
-def get_keyword_matches(content: str) -> Dict[str, Dict[str, int]]:
-    content_lower = content.lower()
+# 카테고리의 키워드 (기본 카테고리가 아니면 카테고리 이름으로 기본 키워드 생성)
+def get_category_keywords(category: str) -> List[str]:
+    if category in category_keywords:
+        return category_keywords[category]
+    return [category, category.lower()] + category.split()
+
+# 임베딩에 사용할 카테고리 설명
+def get_category_description(category: str) -> str:
+    return f"{category}. {', '.join(get_category_keywords(category))}"
+
+# 요청 카테고리 목록별 키워드 맵과 키워드 첫 글자 집합
+# (전역 키워드 목록을 바꾸지 않으므로 워커 모드에서 이전 요청의 카테고리가 섞이지 않음)
+@lru_cache(maxsize=32)
+def get_category_index(categories: Tuple[str, ...]) -> Tuple[Dict[str, List[str]], Dict[str, set]]:
+    keyword_map = {category: get_category_keywords(category) for category in categories}
+    # 콘텐츠에 없는 글자로만 시작하는 카테고리는 건너뛰기 위한 첫 글자 집합 (대소문자 모두 포함)
+    first_chars = {
+        category: {char for keyword in keywords for char in (keyword[:1].lower(), keyword[:1].upper())}
+        for category, keywords in keyword_map.items()
+    }
+    return keyword_map, first_chars
+
+# 키워드별 대소문자 무시 패턴 (콘텐츠 전체를 소문자로 복사하지 않고 검색)
+@lru_cache(maxsize=1024)
+def get_keyword_pattern(keyword: str) -> re.Pattern:
+    return re.compile(re.escape(keyword), re.IGNORECASE)
+
+# 요청 카테고리 키워드로 구성한 Aho-Corasick 오토마톤
+@lru_cache(maxsize=32)
+def get_keyword_automaton(categories: Tuple[str, ...]):
+    keyword_map, _ = get_category_index(categories)
+    automaton = ahocorasick.Automaton()
+    for keywords in keyword_map.values():
+        for keyword in keywords:
+            keyword_lower = keyword.lower()
+            automaton.add_word(keyword_lower, keyword_lower)
+    automaton.make_automaton()
+    return automaton
+
+# 콘텐츠에서 카테고리별 키워드 매칭 점수 계산 (요청한 카테고리만)
+def get_keyword_matches(content: str, categories: Tuple[str, ...]) -> Dict[str, Dict[str, int]]:
     results = {}
+    keyword_map, category_first_chars = get_category_index(categories)
     
-    for category, keywords in category_keywords.items():
+    if ahocorasick is not None:
+        # 콘텐츠를 한 번만 스캔하며 모든 키워드 등장 횟수 집계
+        # (pyahocorasick은 대소문자 무시 검색을 지원하지 않으므로 이 경로에서만 소문자 사본을 만듦)
+        counts = {}
+        last_ends = {}
+        for end, keyword_lower in get_keyword_automaton(categories).iter(content.lower()):
+            # str.count와 같이 같은 키워드의 겹치는 등장은 한 번만 셈
+            if end - len(keyword_lower) < last_ends.get(keyword_lower, -1):
+                continue
+            last_ends[keyword_lower] = end
+            counts[keyword_lower] = counts.get(keyword_lower, 0) + 1
+        
+        # 카테고리/키워드 정의 순서 유지
+        for category, keywords in keyword_map.items():
+            category_matches = {keyword: counts[keyword.lower()] for keyword in keywords if keyword.lower() in counts}
+            if category_matches:
+                results[category] = category_matches
+        return results
+    
+    # 키워드마다 따로 센다 (다른 키워드에 포함된 짧은 키워드도 각각 집계)
+    content_chars = set(content)
+    for category, keywords in keyword_map.items():
+        first_chars = category_first_chars[category]
+        if '' not in first_chars and first_chars.isdisjoint(content_chars):
+            continue
+        
         category_matches = {}
         for keyword in keywords:
-            keyword_lower = keyword.lower()
-            count = content_lower.count(keyword_lower)
+            count = sum(1 for _ in get_keyword_pattern(keyword).finditer(content))
             if count > 0:
                 category_matches[keyword] = count
         
@@ -129,29 +356,102 @@ def get_keyword_matches(content: str) -> Dict[str, Dict[str, int]]:
     
     return results
 
-# 콘텐츠와 카테고리 간의 의미적 유사성 계산
-def calculate_semantic_similarity(content_embedding: list, categories: list) -> Dict[str, float]:
-    # 각 카테고리에 대한 임베딩 생성
-    category_embeddings = {}
+# 카테고리 임베딩 조회 (캐시에 없는 것만 API 호출)
+# 프로세스 내 역양자화된 카테고리 임베딩 (캐시 키 기준)
+category_embedding_vectors = {}
+
+async def get_category_embeddings(categories: list, model: str = "text-embedding-3-small") -> Dict[str, np.ndarray]:
+    category_keys = {}
+    missing_keys = []
     for category in categories:
-        # 카테고리 설명 생성
-        category_description = f"{category}. {', '.join(category_keywords.get(category, [category]))}"
-        category_embedding = get_embedding(category_description)
-        category_embeddings[category] = category_embedding
+        category_description = get_category_description(category)
+        key = category_cache_key(category_description, model)
+        category_keys[category] = key
+        if key not in category_embedding_vectors:
+            missing_keys.append((key, category_description))
     
-    # 콘텐츠와 각 카테고리 간의 코사인 유사도 계산
-    similarities = {}
-    for category, embedding in category_embeddings.items():
-        similarity = np.dot(content_embedding, embedding) / (np.linalg.norm(content_embedding) * np.linalg.norm(embedding))
-        similarities[category] = float(similarity)
+    if not missing_keys:
+        return {category: category_embedding_vectors[key] for category, key in category_keys.items()}
     
-    return similarities
+    cache = load_category_embedding_cache()
+    # 동일한 설명은 한 번만 임베딩
+    missing_descriptions = {key: description for key, description in missing_keys if key not in cache}
+    
+    # 캐시에 없는 카테고리 설명은 한 번의 배치 요청으로 임베딩
+    if missing_descriptions:
+        embeddings = await get_embeddings(list(missing_descriptions.values()), model)
+        cache.update(zip(missing_descriptions.keys(), map(quantize_embedding, embeddings)))
+        save_category_embedding_cache(cache)
+    
+    for key, _ in missing_keys:
+        category_embedding_vectors[key] = dequantize_embedding(cache[key])
+    return {category: category_embedding_vectors[key] for category, key in category_keys.items()}
 
-# LLM을 사용한 고급 카테고리 분석
-def analyze_with_llm(content: str, categories: list) -> Dict[str, Any]:
-    client = OpenAI()
-    model = input_data.get("model", "gpt-4o-mini")
+# 콘텐츠와 카테고리 간의 의미적 유사성 계산
+async def calculate_semantic_similarity(content: str, categories: list, model: str = "text-embedding-3-small") -> Dict[str, float]:
+    # 콘텐츠 임베딩과 카테고리 임베딩을 동시에 요청
+    content_embedding, category_embeddings = await asyncio.gather(
+        get_embedding(content, model),
+        get_category_embeddings(categories, model)
+    )
+    
+    category_matrix = np.asarray(list(category_embeddings.values()), dtype=np.float32)
+    content_vector = np.asarray(content_embedding, dtype=np.float32)
     
+    if simsimd is not None:
+        # 내적과 노름을 한 번에 계산하는 SIMD 코사인 커널 사용
+        distances = np.asarray(simsimd.cdist(content_vector[None, :], category_matrix, metric="cosine"))
+        similarities = 1.0 - distances[0]
+    else:
+        # 콘텐츠와 각 카테고리 간의 코사인 유사도를 한 번의 행렬 곱으로 계산
+        category_matrix /= np.linalg.norm(category_matrix, axis=1, keepdims=True)
+        content_vector /= np.linalg.norm(content_vector)
+        similarities = category_matrix @ content_vector
+    
+    return dict(zip(category_embeddings.keys(), similarities.tolist()))
+
+# 이 확신도 이상이면 분류 결과만 사용하고 상세 분석(하위 카테고리, 이유) 생략
+LLM_CLASSIFICATION_CONFIDENCE_THRESHOLD = 0.8
+
+# 카테고리 이름으로 제한된 구조화 출력 + logprobs를 사용한 저비용 분류
+async def classify_with_llm(content: str, categories: list, model: str = "gpt-4o-mini") -> Optional[Dict[str, Any]]:
+    try:
+        response = await get_client().chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": "당신은 AI 및 기계학습 관련 콘텐츠를 분류하는 전문가입니다. 가장 적합한 카테고리 하나를 선택하세요."},
+                {"role": "user", "content": content[:4000]}
+            ],
+            temperature=0,
+            max_tokens=50,
+            logprobs=True,
+            response_format={
+                "type": "json_schema",
+                "json_schema": {
+                    "name": "category_classification",
+                    "strict": True,
+                    "schema": {
+                        "type": "object",
+                        "properties": {"mainCategory": {"type": "string", "enum": list(categories)}},
+                        "required": ["mainCategory"],
+                        "additionalProperties": False
+                    }
+                }
+            }
+        )
+        
+        choice = response.choices[0]
+        main_category = json.loads(choice.message.content)["mainCategory"]
+        # 스키마로 고정된 구조 토큰의 확률은 1에 가까우므로 전체 토큰 확률의 곱이 곧 카테고리 확률
+        token_logprobs = [token.logprob for token in (choice.logprobs.content or [])] if choice.logprobs else []
+        confidence = float(np.exp(sum(token_logprobs))) if token_logprobs else 0.0
+        return {"mainCategory": main_category, "confidence": confidence}
+    except Exception as e:
+        print(f"LLM 분류 오류: {str(e)}", file=sys.stderr)
+        return None
+
+# LLM을 사용한 고급 카테고리 분석
+async def analyze_with_llm(content: str, categories: list, model: str = "gpt-4o-mini") -> Dict[str, Any]:
     # 프롬프트 구성
     categories_str = ', '.join(categories)
     prompt = f"""다음 콘텐츠를 분석하고 가장 적합한 카테고리를 결정해주세요. 
@@ -178,7 +478,7 @@ def analyze_with_llm(content: str, categories: list) -> Dict[str, Any]:
 """
     
     try:
-        response = client.chat.completions.create(
+        response = await get_client().chat.completions.create(
             model=model,
             messages=[
                 {"role": "system", "content": "당신은 AI 및 기계학습 관련 콘텐츠를 분석하고 분류하는 전문가입니다."},
@@ -192,7 +492,7 @@ def analyze_with_llm(content: str, categories: list) -> Dict[str, Any]:
         result = json.loads(response_text)
         return result
     except Exception as e:
-        print(f"LLM 분석 오류: {str(e)}")
+        print(f"LLM 분석 오류: {str(e)}", file=sys.stderr)
         return {
             "mainCategory": categories[0] if categories else "General",
             "confidence": 0.5,
@@ -201,37 +501,74 @@ def analyze_with_llm(content: str, categories: list) -> Dict[str, Any]:
             "reasoning": "LLM 분석 중 오류 발생"
         }
 
+# 확신도가 높은 분류는 그대로 사용하고, 애매한 경우에만 상세 분석 수행
+async def run_llm_analysis(content: str, categories: list, model: str = "gpt-4o-mini") -> Dict[str, Any]:
+    classification = await classify_with_llm(content, categories, model)
+    if classification and classification["confidence"] >= LLM_CLASSIFICATION_CONFIDENCE_THRESHOLD:
+        return classification
+    return await analyze_with_llm(content, categories, model)
+
+# 키워드+임베딩 결합 점수가 이 조건을 만족하면 LLM 호출 생략
+AGREEMENT_MIN_SCORE = 0.7
+AGREEMENT_MIN_MARGIN = 0.2
+
+# 임베딩 유사도(0.6)와 정규화된 키워드 점수(0.4)가 한 카테고리를 뚜렷하게 가리키는지 확인
+def find_agreed_category(semantic_similarities: Dict[str, float], keyword_score: Dict[str, int], categories: list) -> Optional[Tuple[str, float]]:
+    if len(categories) < 2:
+        return None
+    max_keyword_score = max((keyword_score.get(category, 0) for category in categories), default=0) or 1
+    combined = sorted(
+        ((0.6 * semantic_similarities.get(category, 0.0) + 0.4 * keyword_score.get(category, 0) / max_keyword_score, category)
+         for category in categories),
+        reverse=True
+    )
+    (top1_score, top1_category), (top2_score, _) = combined[0], combined[1]
+    if top1_score > AGREEMENT_MIN_SCORE and top1_score - top2_score > AGREEMENT_MIN_MARGIN:
+        return top1_category, float(top1_score)
+    return None
+
 # 주요 분석 함수
-def analyze_content():
+async def analyze_content(input_data: Dict[str, Any]) -> Dict[str, Any]:
     content = input_data["content"]
     categories_to_analyze = input_data.get("categories", list(category_keywords.keys()))
     
     if not categories_to_analyze:
         categories_to_analyze = ["General"]
     
-    # 1. 콘텐츠에서 키워드 매칭 확인
-    keyword_matches = get_keyword_matches(content)
+    # 1. 콘텐츠에서 키워드 매칭 확인 (기존 출력과 같이 기본 카테고리 + 요청의 사용자 정의 카테고리)
+    keyword_categories = tuple(category_keywords) + tuple(
+        category for category in dict.fromkeys(categories_to_analyze) if category not in category_keywords
+    )
+    keyword_matches = get_keyword_matches(content, keyword_categories)
+    
+    # 키워드 매칭 점수 반영
+    keyword_score = {}
+    for category, matches in keyword_matches.items():
+        keyword_score[category] = sum(matches.values())
     
     # 2. 임베딩 기반 의미론적 유사성 분석
+    agreed = None
     try:
-        content_embedding = get_embedding(content)
-        semantic_similarities = calculate_semantic_similarity(content_embedding, categories_to_analyze)
+        semantic_similarities = await calculate_semantic_similarity(content, categories_to_analyze)
+        agreed = find_agreed_category(semantic_similarities, keyword_score, categories_to_analyze)
     except Exception as e:
-        print(f"임베딩 분석 오류: {str(e)}")
+        print(f"임베딩 분석 오류: {str(e)}", file=sys.stderr)
         semantic_similarities = {category: 0.5 for category in categories_to_analyze}
     
-    # 3. LLM 기반 고급 분석
-    llm_analysis = analyze_with_llm(content, categories_to_analyze)
+    # 3. 키워드와 임베딩이 뚜렷하게 일치하지 않는 경우에만 LLM 기반 고급 분석 수행
+    if agreed:
+        llm_analysis = {
+            "mainCategory": agreed[0],
+            "confidence": agreed[1],
+            "reasoning": "keyword+embedding agreement"
+        }
+    else:
+        llm_analysis = await run_llm_analysis(content, categories_to_analyze, input_data.get("model") or "gpt-4o-mini")
     
     # 4. 결과 결합
     main_category = llm_analysis.get("mainCategory", categories_to_analyze[0])
     confidence = llm_analysis.get("confidence", 0.7)
     
-    # 키워드 매칭 점수 반영
-    keyword_score = {}
-    for category, matches in keyword_matches.items():
-        keyword_score[category] = sum(matches.values())
-    
     # 최종 결과 구성
     final_result = {
         "category": main_category,
@@ -245,18 +582,54 @@ def analyze_content():
     
     return final_result
 
-# 메인 실행
-try:
-    result = analyze_content()
-    print(json.dumps(result, ensure_ascii=False))
-except Exception as e:
-    # 오류 발생 시 기본 카테고리 반환 (JavaScript에서 처리 가능)
-    error_result = {
+# 오류 발생 시 기본 카테고리 반환 (JavaScript에서 처리 가능)
+def build_error_result(error: Exception) -> Dict[str, Any]:
+    return {
         "category": "연구 동향",
         "confidence": 0.5,
         "subCategories": [],
         "relatedTopics": [],
-        "error": str(e)
+        "error": str(error)
     }
-    print(json.dumps(error_result, ensure_ascii=False))
-    sys.exit(1) 
\ No newline at end of file
+
+# 워커 모드: stdin의 JSONL 요청을 순서대로 처리하고 stdout에 JSONL 응답 출력
+# 인터프리터, 토크나이저, OpenAI 클라이언트, 카테고리 임베딩 캐시를 모든 요청에서 재사용
+async def run_worker() -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        line = await loop.run_in_executor(None, sys.stdin.readline)
+        if not line:
+            break
+        line = line.strip()
+        if not line:
+            continue
+        # 요청 처리 중 다른 출력이 stdout에 섞이면 응답 한 줄씩 대응하는 프로토콜이 깨지므로 stderr로 돌림
+        try:
+            with redirect_stdout(sys.stderr):
+                result = await analyze_content(json.loads(line))
+        except Exception as e:
+            result = build_error_result(e)
+        sys.stdout.write(orjson.dumps(result).decode("utf-8") + "\n")
+        sys.stdout.flush()
+
+# 메인 실행
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--worker":
+        # 한글 카테고리 이름이 그대로 오가도록 파이프 인코딩을 UTF-8로 고정 (Windows 기본 코드 페이지 대신)
+        sys.stdin.reconfigure(encoding="utf-8")
+        sys.stdout.reconfigure(encoding="utf-8")
+        asyncio.run(run_worker())
+        sys.exit(0)
+    
+    try:
+        input_data = parse_cli_input()
+    except (IndexError, json.JSONDecodeError) as e:
+        print(f"입력 인자 처리 오류: {str(e)}")
+        sys.exit(1)
+    
+    try:
+        result = asyncio.run(analyze_content(input_data))
+        print(orjson.dumps(result).decode("utf-8"))
+    except Exception as e:
+        print(orjson.dumps(build_error_result(e)).decode("utf-8"))
+        sys.exit(1)
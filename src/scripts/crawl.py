@@ -16,6 +16,12 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 import re
 
+# orjson이 있으면 결과 직렬화에 사용 (없으면 표준 json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # 인코딩 설정
 import io
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
@@ -39,6 +45,33 @@ except Exception as e:
     print(f"crawl4ai 초기화 오류: {str(e)}")
     sys.exit(1)
 
+# 상대 시간 표현 ("3 days ago", "5 hours ago", "10 mins ago") 패턴
+RELATIVE_TIME_PATTERN = re.compile(r'(\d+)\s*(days?|hours?|minutes?|mins?)\s*ago', re.IGNORECASE)
+
+# ISO 8601 이외의 날짜 형식 (ISO 형식은 datetime.fromisoformat으로 처리)
+ABSOLUTE_DATE_FORMATS = ('%Y/%m/%d', '%b %d, %Y', '%B %d, %Y')
+
+# 알 수 없는 결과 구조에서 가져올 본문 최대 길이
+MAX_FALLBACK_CONTENT_CHARS = 50000
+
+def parse_absolute_date(date_str: str) -> Optional[datetime]:
+    """절대 날짜 문자열을 로컬 시간 기준 naive datetime으로 변환"""
+    try:
+        parsed = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+    except ValueError:
+        for date_format in ABSOLUTE_DATE_FORMATS:
+            try:
+                parsed = datetime.strptime(date_str, date_format)
+                break
+            except ValueError:
+                continue
+        else:
+            return None
+    
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
+
 def setup_argparse() -> argparse.Namespace:
     """커맨드 라인 인자 설정"""
     parser = argparse.ArgumentParser(description="crawl4ai를 사용한 웹 크롤링")
@@ -73,6 +106,12 @@ def setup_argparse() -> argparse.Namespace:
         default=48,
         help="현재 시간으로부터 몇 시간 내의 컨텐츠만 가져올지 설정"
     )
+    parser.add_argument(
+        "--max_concurrency", 
+        type=int, 
+        default=3,
+        help="동시에 크롤링할 최대 소스 수"
+    )
     return parser.parse_args()
 
 def setup_crawl4ai(llm_provider: str = "openai") -> AsyncWebCrawler:
@@ -181,11 +220,16 @@ async def crawl_source(crawler: AsyncWebCrawler, source: str, max_items: int = 1
         else:
             # 다른 구조인 경우
             print(f"알 수 없는 결과 구조: {type(result)}")
+            print(f"결과 속성: {[name for name in dir(result) if not name.startswith('_')]}")
+            # 결과 객체 전체 repr 대신 html/text 필드만 길이 제한하여 사용
+            content = getattr(result, 'html', None) or getattr(result, 'text', None) or ""
+            if not isinstance(content, str):
+                content = ""
             story = {
                 "headline": "제목 추출 실패",
                 "link": source,
                 "date_posted": datetime.now().isoformat(),
-                "fullContent": str(result),
+                "fullContent": content[:MAX_FALLBACK_CONTENT_CHARS],
                 "imageUrls": [],
                 "videoUrls": [],
                 "popularity": "N/A"
@@ -200,48 +244,32 @@ async def crawl_source(crawler: AsyncWebCrawler, source: str, max_items: int = 1
             try:
                 date_str = story["date_posted"]
                 
-                # "X days ago" 패턴 처리
-                days_ago_match = re.search(r'(\d+)\s*days?\s*ago', date_str, re.IGNORECASE)
-                if days_ago_match:
-                    days = int(days_ago_match.group(1))
-                    print(f"날짜 '{date_str}'는 {days}일 전으로 파싱됨")
-                    # timeframe_hours (예: 48시간) 이내인지 확인 (days * 24 <= timeframe_hours)
-                    is_recent = days * 24 <= timeframe_hours 
-                    if not is_recent:
-                        print(f"{timeframe_hours}시간 초과 게시물 필터링: {story['headline']} ({date_str})")
-                        continue
-                
-                # "X hours ago", "X minutes ago" 패턴 처리
-                time_ago_match = re.search(r'(\d+)\s*(hour|hours|minute|minutes|min|mins)\s*ago', date_str, re.IGNORECASE)
-                if time_ago_match:
-                    amount = int(time_ago_match.group(1))
-                    unit = time_ago_match.group(2).lower()
+                # "X days ago", "X hours ago", "X minutes ago" 패턴 처리 (한 번의 검색)
+                relative_match = RELATIVE_TIME_PATTERN.search(date_str)
+                if relative_match:
+                    amount = int(relative_match.group(1))
+                    unit = relative_match.group(2).lower()
                     
-                    if 'hour' in unit:
+                    if unit.startswith('day'):
+                        print(f"날짜 '{date_str}'는 {amount}일 전으로 파싱됨")
+                        # timeframe_hours (예: 48시간) 이내인지 확인 (days * 24 <= timeframe_hours)
+                        is_recent = amount * 24 <= timeframe_hours
+                    elif unit.startswith('hour'):
                         is_recent = amount <= timeframe_hours
                     else:  # minutes
                         is_recent = True  # 분 단위는 항상 최근
                     
                     if not is_recent:
-                        print(f"시간 초과 게시물 필터링: {story['headline']} ({date_str})")
+                        print(f"{timeframe_hours}시간 초과 게시물 필터링: {story['headline']} ({date_str})")
                         continue
-                
-                # 날짜 형식 직접 파싱 시도
-                try:
-                    # 다양한 날짜 형식 시도
-                    for date_format in [
-                        '%Y-%m-%d', '%Y/%m/%d', '%b %d, %Y', '%B %d, %Y',
-                        '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d %H:%M:%S'
-                    ]:
-                        try:
-                            story_date = datetime.strptime(date_str, date_format)
-                            if (now - story_date).total_seconds() <= timeframe_hours * 3600:
-                                is_recent = True
-                            break
-                        except ValueError:
-                            continue
-                except Exception as date_error:
-                    print(f"날짜 파싱 오류: {date_error}")
+                else:
+                    # 날짜 형식 직접 파싱 시도
+                    try:
+                        story_date = parse_absolute_date(date_str)
+                        if story_date and (now - story_date).total_seconds() <= timeframe_hours * 3600:
+                            is_recent = True
+                    except Exception as date_error:
+                        print(f"날짜 파싱 오류: {date_error}")
                 
                 # 날짜 확인 불가 또는 충분히 최근이 아닌 경우
                 if not is_recent:
@@ -296,25 +324,25 @@ async def main_async():
         # crawl4ai 크롤러 설정
         crawler = setup_crawl4ai(args.llm_provider)
         
-        # 모든 소스 결과를 저장할 배열
-        all_results = []
+        # 소스를 동시에 처리하되 세마포어로 동시 실행 수 제한
+        semaphore = asyncio.Semaphore(max(1, int(args.max_concurrency)))
         
-        # 모든 소스를 순차적으로 처리
-        for source in sources:
-            print(f"\n===== 소스 처리 중: {source} =====")
-            result = await crawl_source(crawler, source, max_items, timeframe_hours)
-            all_results.append(result)
-            
-            # 소스 사이에 약간의 지연 추가
-            if source != sources[-1]:  # 마지막 소스가 아니면
-                delay = 5  # 5초 지연
-                print(f"다음 소스 처리 전 {delay}초 대기...")
-                await asyncio.sleep(delay)
+        async def crawl_source_bounded(source: str) -> Dict[str, Any]:
+            async with semaphore:
+                print(f"\n===== 소스 처리 중: {source} =====")
+                return await crawl_source(crawler, source, max_items, timeframe_hours)
+        
+        # 모든 소스 결과를 저장할 배열 (입력 순서 유지)
+        all_results = await asyncio.gather(*(crawl_source_bounded(source) for source in sources))
         
         # 결과 저장
         output_path = args.output
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(all_results, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(all_results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(all_results, f, ensure_ascii=False, indent=2)
         
         print(f"크롤링 완료! 결과가 {output_path}에 저장되었습니다.")
         
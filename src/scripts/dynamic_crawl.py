@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import asyncio
 import json
 import os
@@ -5,40 +7,67 @@ import sys
 import time
 import re
 from datetime import datetime, timezone, timedelta
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Tuple, Union, Callable, TYPE_CHECKING
 import argparse
+import heapq
+import importlib.util
+import sqlite3
+from dataclasses import dataclass, field, asdict
+from contextlib import asynccontextmanager, redirect_stdout
+from functools import lru_cache
 import urllib.parse # URL 정규화를 위해 추가
 
 # Windows에서 유니코드 출력을 위한 설정
 import io
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
-# 필요한 라이브러리 동적 설치
-def ensure_installed(package: str) -> None:
+# 필요한 라이브러리 동적 설치 (패키지명과 모듈명이 다른 경우 module 지정)
+def ensure_installed(package: str, module: Optional[str] = None) -> None:
     try:
-        __import__(package)
+        __import__(module or package)
     except ImportError:
         import subprocess
-        print(f"Installing {package}...")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", package])
+        # 워커 모드(--serve)의 stdout은 작업별 JSON 응답 전용이므로 설치 출력은 stderr로 보냄
+        print(f"Installing {package}...", file=sys.stderr)
+        subprocess.check_call([sys.executable, "-m", "pip", "install", package], stdout=sys.stderr)
 
-# 필요한 패키지 설치
-ensure_installed("playwright")
-ensure_installed("beautifulsoup4")
-ensure_installed("openai")
-ensure_installed("python-dateutil")
+# 스크립트로 직접 실행할 때만 누락된 패키지 설치 (requirements.txt 참고)
+if __name__ == "__main__":
+    ensure_installed("playwright")
+    ensure_installed("beautifulsoup4", "bs4")
+    ensure_installed("lxml")
+    ensure_installed("python-dateutil", "dateutil")
 
-# 설치 후 임포트
-from playwright.async_api import async_playwright, Page, Browser, BrowserContext
-from bs4 import BeautifulSoup
-import openai
-from dateutil import parser as date_parser
+# playwright와 dateutil은 실제로 사용할 때 임포트 (날짜 처리만 필요한 경우 시작 시간 단축)
+if TYPE_CHECKING:
+    from playwright.async_api import Page, Browser, BrowserContext
 
-# 사이트 설정 시스템 임포트
-# from site_configs import site_config_manager, SiteConfig
+_date_parser = None
+
+def get_date_parser():
+    global _date_parser
+    if _date_parser is None:
+        from dateutil import parser as date_parser
+        _date_parser = date_parser
+    return _date_parser
+
+# 선택적 가속 라이브러리 (설치되지 않은 경우 dateutil 경로 사용)
+try:
+    import ciso8601
+except ImportError:
+    ciso8601 = None
+
+# orjson이 있으면 결과 직렬화/설정 파싱에 사용 (없으면 표준 json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-# OpenAI API 키 설정
-openai.api_key = os.environ.get("OPENAI_API_KEY", "")
+# HTML 파서: C 구현 lxml 우선, 없으면 내장 html.parser (설치 여부만 확인하고 임포트는 bs4에 맡김)
+HTML_PARSER = 'lxml' if importlib.util.find_spec("lxml") is not None else 'html.parser'
+
+# 사이트 설정 시스템 임포트
+from site_configs import site_config_manager
 
 # JSON 설정 로더
 class JSONConfigLoader:
@@ -72,30 +101,39 @@ class SiteDetector:
                     }
                 };
                 
-                // HTML과 head 정보 분석
-                const html = document.documentElement.outerHTML.toLowerCase();
-                const headContent = document.head ? document.head.innerHTML.toLowerCase() : '';
+                // 존재 여부만 필요하므로 querySelector로 첫 일치에서 멈춤 (전체 목록을 만들지 않음)
+                const exists = (selector) => {
+                    try {
+                        return document.querySelector(selector) !== null;
+                    } catch (e) {
+                        return false;
+                    }
+                };
+                const hostname = window.location.hostname;
+                const generatorMeta = document.querySelector('meta[name="generator"]');
+                const generator = ((generatorMeta && generatorMeta.content) || '').toLowerCase();
                 
-                // CMS 감지
-                if (html.includes('wp-content') || html.includes('wordpress') || html.includes('/wp-includes/')) {
+                // CMS 감지 (전체 HTML 문자열을 만들지 않고 generator 메타와 리소스 경로로 판단)
+                if (generator.includes('wordpress') || exists('link[href*="/wp-content/"], script[src*="/wp-content/"], script[src*="/wp-includes/"], img[src*="/wp-content/"]')) {
                     result.cms = 'wordpress';
                     result.platform = 'blog';
-                } else if (html.includes('medium-feed') || window.location.hostname.includes('medium')) {
+                } else if (hostname.includes('medium') || exists('[class*="medium-feed"]')) {
                     result.cms = 'medium';
                     result.platform = 'blog';
-                } else if (html.includes('reddit') || window.location.hostname.includes('reddit')) {
+                } else if (hostname.includes('reddit')) {
                     result.cms = 'reddit';
                     result.platform = 'social';
-                } else if (html.includes('ghost') || document.querySelector('meta[name="generator"][content*="Ghost"]')) {
+                } else if (generator.includes('ghost') || exists('script[src*="ghost"], link[href*="ghost"]')) {
                     result.cms = 'ghost';
                     result.platform = 'blog';
-                } else if (html.includes('drupal') || document.querySelector('meta[name="generator"][content*="Drupal"]')) {
+                } else if (generator.includes('drupal') || exists('[data-drupal-selector], script[src*="drupal"]')) {
                     result.cms = 'drupal';
                     result.platform = 'news';
                 }
                 
-                // 플랫폼 유형 감지
-                const titleAndMeta = (document.title + ' ' + headContent).toLowerCase();
+                // 플랫폼 유형 감지 (제목과 meta 태그 값만 사용)
+                const metaText = Array.from(document.querySelectorAll('head meta[content]'), el => el.content).join(' ');
+                const titleAndMeta = (document.title + ' ' + metaText).toLowerCase();
                 if (titleAndMeta.includes('news') || titleAndMeta.includes('journal') || titleAndMeta.includes('press')) {
                     result.platform = 'news';
                 } else if (titleAndMeta.includes('blog') || titleAndMeta.includes('diary')) {
@@ -105,79 +143,44 @@ class SiteDetector:
                 }
                 
                 // 구조 분석
-                const hasArticleTag = document.querySelectorAll('article').length > 0;
-                const hasMainTag = document.querySelectorAll('main').length > 0;
-                const hasPostClass = document.querySelectorAll('[class*="post"]').length > 0;
-                const hasNewsClass = document.querySelectorAll('[class*="news"]').length > 0;
-                
-                if (hasArticleTag) {
+                if (exists('article')) {
                     result.structure = 'semantic';
                     result.features.push('html5-semantic');
-                } else if (hasPostClass || hasNewsClass) {
+                } else if (exists('[class*="post"], [class*="news"]')) {
                     result.structure = 'content-based';
                 }
                 
-                // 동적 선택자 생성
-                const potentialArticleSelectors = [];
-                const potentialContentSelectors = [];
-                const potentialDateSelectors = [];
-                
-                // 기사 링크가 있을 만한 요소들 찾기
+                // 동적 선택자 생성 (순서는 기존과 동일)
                 const linkContainers = ['article', 'h1', 'h2', 'h3', '.post', '.news', '.story', '.entry', '.item'];
-                linkContainers.forEach(selector => {
-                    try {
-                        const elements = document.querySelectorAll(selector + ' a');
-                        if (elements.length > 0) {
-                            potentialArticleSelectors.push(selector + ' a');
-                        }
-                    } catch (e) {}
-                });
-                
-                // 클래스 기반 선택자 생성
                 const classPatterns = ['title', 'headline', 'post', 'article', 'news', 'story', 'entry'];
+                const articleCandidates = linkContainers.map(selector => selector + ' a');
                 classPatterns.forEach(pattern => {
-                    try {
-                        const classSelector = '.' + pattern + ' a';
-                        if (document.querySelectorAll(classSelector).length > 0) {
-                            potentialArticleSelectors.push(classSelector);
-                        }
-                        const classOnlySelector = '.' + pattern + '-title a';
-                        if (document.querySelectorAll(classOnlySelector).length > 0) {
-                            potentialArticleSelectors.push(classOnlySelector);
-                        }
-                    } catch (e) {}
+                    articleCandidates.push('.' + pattern + ' a', '.' + pattern + '-title a');
                 });
                 
-                // 콘텐츠 선택자 생성
                 const contentContainers = ['article', 'main', '.content', '.post-content', '.entry-content', '.article-body'];
-                contentContainers.forEach(selector => {
-                    try {
-                        if (document.querySelectorAll(selector).length > 0) {
-                            potentialContentSelectors.push(selector);
-                        }
-                    } catch (e) {}
-                });
-                
-                // 날짜 선택자 생성
                 const dateContainers = ['time', '.date', '.published', '.timestamp', '.post-date', '.entry-date'];
-                dateContainers.forEach(selector => {
-                    try {
-                        if (document.querySelectorAll(selector).length > 0) {
-                            potentialDateSelectors.push(selector);
+                
+                // 후보마다 문서 전체를 탐색하지 않고, 링크를 한 번만 순회하며 일치하는 후보를 표시
+                const matchedCandidates = new Set();
+                for (const anchor of document.getElementsByTagName('a')) {
+                    for (const candidate of articleCandidates) {
+                        if (!matchedCandidates.has(candidate) && anchor.matches(candidate)) {
+                            matchedCandidates.add(candidate);
                         }
-                    } catch (e) {}
-                });
+                    }
+                    if (matchedCandidates.size === articleCandidates.length) break;
+                }
                 
-                result.selectors.articles = potentialArticleSelectors;
-                result.selectors.content = potentialContentSelectors;
-                result.selectors.dates = potentialDateSelectors;
+                result.selectors.articles = articleCandidates.filter(candidate => matchedCandidates.has(candidate));
+                result.selectors.content = contentContainers.filter(exists);
+                result.selectors.dates = dateContainers.filter(exists);
                 
                 // 메타 정보 수집
                 const ogSiteName = document.querySelector('meta[property="og:site_name"]');
                 if (ogSiteName) result.meta_info.site_name = ogSiteName.content;
                 
-                const generator = document.querySelector('meta[name="generator"]');
-                if (generator) result.meta_info.generator = generator.content;
+                if (generatorMeta) result.meta_info.generator = generatorMeta.content;
                 
                 return result;
             }''')
@@ -190,48 +193,142 @@ class SiteDetector:
             return {'platform': 'unknown', 'cms': 'unknown', 'structure': 'unknown', 'features': [], 'selectors': {'articles': [], 'content': [], 'dates': []}}
 
 # 스토리 인터페이스 정의
+@dataclass(slots=True)
 class Story:
-    def __init__(self):
-        self.headline = ""
-        self.link = ""
-        self.date_posted = ""
-        self.fullContent = ""
-        self.imageUrls = []
-        self.videoUrls = []
-        self.popularity = ""
-        self.summary = ""  # 요약 추가
-        self.tags = []     # 태그 추가
-        self.source = ""   # 소스 사이트 추가
+    headline: str = ""
+    link: str = ""
+    date_posted: str = ""
+    fullContent: str = ""
+    imageUrls: List[str] = field(default_factory=list)
+    videoUrls: List[str] = field(default_factory=list)
+    popularity: str = ""
+    summary: str = ""  # 요약 추가
+    tags: List[str] = field(default_factory=list)     # 태그 추가
+    source: str = ""   # 소스 사이트 추가
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "headline": self.headline,
-            "link": self.link,
-            "date_posted": self.date_posted,
-            "fullContent": self.fullContent,
-            "imageUrls": self.imageUrls,
-            "videoUrls": self.videoUrls,
-            "popularity": self.popularity,
-            "summary": self.summary,
-            "tags": self.tags,
-            "source": self.source
-        }
+        return asdict(self)
 
-# 크롤링 결과 클래스
+# 크롤링 결과 클래스 (orjson은 데이터클래스를 직접 직렬화)
+@dataclass(slots=True)
 class CrawlResult:
-    def __init__(self, source: str):
-        self.source = source
-        self.stories = []
-        self.error = None
-        self.site_info = {}  # 사이트 정보 추가
+    source: str
+    stories: List[Story] = field(default_factory=list)
+    error: Optional[str] = None
+    site_info: Dict[str, Any] = field(default_factory=dict)  # 사이트 정보 추가
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "source": self.source,
-            "stories": [story.to_dict() for story in self.stories],
-            "error": self.error,
-            "site_info": self.site_info
-        }
+        return asdict(self)
+
+# 날짜 파싱/필터링 및 본문 정리에 쓰는 패턴 (모듈 로드 시 한 번만 컴파일)
+_TODAY_PATTERNS = ('today', '오늘', 'just now', 'now', 'a moment ago', '방금', '지금')
+_YESTERDAY_PATTERNS = ('yesterday', '어제')
+_RELATIVE_DATE_PATTERNS = [
+    (re.compile(r'(\d+)\s*(초|second)s?\s*(전|ago)'), 'seconds'),
+    (re.compile(r'(\d+)\s*(분|minute|min)s?\s*(전|ago)'), 'minutes'),
+    (re.compile(r'(\d+)\s*(시간|hour|hr)s?\s*(전|ago)'), 'hours'),
+    (re.compile(r'(\d+)\s*(일|day)s?\s*(전|ago)'), 'days'),
+    (re.compile(r'(\d+)\s*(주|week)s?\s*(전|ago)'), 'weeks'),
+    (re.compile(r'(\d+)\s*(달|month)s?\s*(전|ago)'), 'months'),
+    (re.compile(r'(\d+)\s*(년|year)s?\s*(전|ago)'), 'years'),
+]
+_DAYS_AGO_RE = re.compile(r'(\d+)\s*day')
+_MAX_DATE_STR_LEN = 64
+_ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+_ISO_PREFIX_RE = re.compile(r'^\d{4}-\d{2}-\d{2}')
+_MULTISPACE_RE = re.compile(r'\s{3,}')
+
+_DATE_FORMATS = (
+    # 기본 형식들
+    '%Y-%m-%d %H:%M:%S', '%Y/%m/%d %H:%M:%S', '%Y.%m.%d %H:%M:%S',
+    '%Y-%m-%d', '%Y/%m/%d', '%d-%m-%Y', '%d/%m/%Y', '%m/%d/%Y',
+    '%Y.%m.%d', '%d.%m.%Y', '%m.%d.%Y',
+    
+    # 영어 월 이름
+    '%b %d, %Y', '%B %d, %Y', '%d %b %Y', '%d %B %Y',
+    '%b %d %Y', '%B %d %Y', '%Y %b %d', '%Y %B %d',
+    
+    # 한국어 형식
+    '%Y년 %m월 %d일', '%Y. %m. %d.', '%Y. %m. %d', '%y.%m.%d', '%Y년%m월%d일',
+    
+    # 특수 형식들
+    '%Y%m%d', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%dT%H:%M:%SZ',
+    '%Y. %m. %d. %H:%M', '%Y/%m/%d %H:%M', '%d/%m/%Y %H:%M',
+    
+    # 추가 영어 형식
+    '%a, %d %b %Y', '%A, %B %d, %Y', '%d-%b-%Y',
+    
+    # 숫자만으로 구성된 형식
+    '%Y%m%d%H%M%S', '%Y%m%d%H%M',
+)
+# 형식별 "모양" (영문 월/요일로 시작하면 'alpha', 숫자로 시작하면 첫 구분자, 숫자만이면 '')
+# strptime은 구분자를 그대로 비교하므로 모양이 다른 형식은 시도할 필요가 없음
+def _date_shape(first_is_alpha: bool, separator: str) -> str:
+    if first_is_alpha:
+        return 'alpha'
+    return ' ' if separator.isspace() else separator
+
+_DATE_FORMATS_BY_SHAPE: Dict[str, tuple] = {}
+for _fmt in _DATE_FORMATS:
+    _shape = _date_shape(_fmt[1] in 'aAbB', '' if _fmt[2:3] in ('', '%') else _fmt[2])
+    _DATE_FORMATS_BY_SHAPE[_shape] = _DATE_FORMATS_BY_SHAPE.get(_shape, ()) + (_fmt,)
+del _fmt, _shape
+
+def _date_formats_for(date_str: str):
+    """문자열의 모양(시작 문자와 첫 구분자)과 일치하는 strptime 형식만 반환"""
+    if not date_str:
+        return ()
+    if not date_str[0].isdigit():
+        return _DATE_FORMATS_BY_SHAPE.get('alpha', ())
+    for ch in date_str:
+        if not ch.isdigit():
+            return _DATE_FORMATS_BY_SHAPE.get(_date_shape(False, ch), ())
+    return _DATE_FORMATS_BY_SHAPE.get('', ())
+
+# 크롤링 결과를 완료되는 즉시 JSON 배열 파일에 추가 (매 기록 후에도 파일은 유효한 JSON)
+class ResultWriter:
+    def __init__(self, output_path: str):
+        self.output_path = output_path
+        self.count = 0
+        self.error: Optional[Exception] = None
+        self._file = open(output_path, 'wb')
+        self._file.write(b'[]')
+        self._file.flush()
+    
+    def write(self, result: CrawlResult) -> None:
+        """결과 하나를 배열 끝에 추가 (실패하면 오류를 기록하고 이후 기록은 건너뜀)"""
+        if self.error is not None:
+            return
+        try:
+            if orjson is not None:
+                data = orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            else:
+                data = json.dumps(asdict(result), ensure_ascii=False, indent=2).encode('utf-8')
+            # 닫는 괄호를 덮어쓰고 새 항목 뒤에 다시 닫음
+            self._file.seek(-1, os.SEEK_END)
+            self._file.write((b',\n' if self.count else b'\n') + data + b'\n]')
+            self._file.flush()
+            self.count += 1
+        except Exception as e:
+            self.error = e
+            print(f"❌ 결과 기록 실패: {e}")
+    
+    def close(self) -> None:
+        self._file.close()
+    
+    def __enter__(self) -> "ResultWriter":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+# 크롤링 결과 JSON 파일 저장 (한 번에 기록)
+def write_results(output_path: str, results: List[CrawlResult]) -> None:
+    with ResultWriter(output_path) as writer:
+        for result in results:
+            writer.write(result)
+    if writer.error is not None:
+        raise writer.error
 
 # 향상된 날짜 파싱 함수
 def parse_date(date_str: str) -> str:
@@ -239,32 +336,25 @@ def parse_date(date_str: str) -> str:
         return ""
 
     original_date_str = date_str.strip()
+    # 공백만 있는 문자열은 빈 날짜로 처리
+    if not original_date_str:
+        return ""
     now = datetime.now()
 
+    lowered_date_str = original_date_str.lower()
+
     # 1. "오늘", "Today", "just now" 처리
-    today_patterns = ['today', '오늘', 'just now', 'now', 'a moment ago', '방금', '지금']
-    if any(pattern in original_date_str.lower() for pattern in today_patterns):
+    if any(pattern in lowered_date_str for pattern in _TODAY_PATTERNS):
         return now.strftime('%Y-%m-%d')
 
     # 2. "어제", "Yesterday" 처리
-    yesterday_patterns = ['yesterday', '어제']
-    if any(pattern in original_date_str.lower() for pattern in yesterday_patterns):
+    if any(pattern in lowered_date_str for pattern in _YESTERDAY_PATTERNS):
         yesterday = now - timedelta(days=1)
         return yesterday.strftime('%Y-%m-%d')
 
-    # 3. 상대적 시간 표현 처리 (더 많은 패턴)
-    relative_patterns = [
-        (r'(\d+)\s*(초|second)s?\s*(전|ago)', 'seconds'),
-        (r'(\d+)\s*(분|minute|min)s?\s*(전|ago)', 'minutes'),
-        (r'(\d+)\s*(시간|hour|hr)s?\s*(전|ago)', 'hours'),
-        (r'(\d+)\s*(일|day)s?\s*(전|ago)', 'days'),
-        (r'(\d+)\s*(주|week)s?\s*(전|ago)', 'weeks'),
-        (r'(\d+)\s*(달|month)s?\s*(전|ago)', 'months'),
-        (r'(\d+)\s*(년|year)s?\s*(전|ago)', 'years'),
-    ]
-    
-    for pattern, unit in relative_patterns:
-        match = re.search(pattern, original_date_str, re.IGNORECASE)
+    # 3. 상대적 시간 표현 처리 (더 많은 패턴, 소문자로 바꾼 문자열에 대소문자 구분 매칭)
+    for pattern, unit in _RELATIVE_DATE_PATTERNS:
+        match = pattern.search(lowered_date_str)
         if match:
             value = int(match.group(1))
             
@@ -289,41 +379,36 @@ def parse_date(date_str: str) -> str:
             
             return target_date.strftime('%Y-%m-%d')
     
+    return _parse_absolute_date(original_date_str)
+
+# 절대 날짜 문자열 파싱 (현재 시각과 무관하므로 결과를 캐싱)
+@lru_cache(maxsize=4096)
+def _parse_absolute_date(original_date_str: str) -> str:
     # 4. ISO 8601 및 유사 형식 처리
-    try:
-        # T와 Z가 포함된 ISO 형식
-        iso_cleaned = original_date_str.replace(' ', 'T')
-        dt_obj = date_parser.isoparse(iso_cleaned)
-        return dt_obj.strftime('%Y-%m-%d')
-    except (ValueError, TypeError):
-        pass
+    if _ISO_PREFIX_RE.match(original_date_str):
+        # 이미 YYYY-MM-DD 형식이면 파싱 없이 그대로 사용
+        if len(original_date_str) == 10:
+            return original_date_str
+        # C 구현 ISO 8601 파서 우선 사용 (없으면 표준 라이브러리의 C 구현 fromisoformat)
+        try:
+            if ciso8601 is not None:
+                return ciso8601.parse_datetime(original_date_str).strftime('%Y-%m-%d')
+            return datetime.fromisoformat(original_date_str).strftime('%Y-%m-%d')
+        except ValueError:
+            pass
     
-    # 5. 다양한 날짜 형식 시도 (더 많은 형식 추가)
-    formats = [
-        # 기본 형식들
-        '%Y-%m-%d %H:%M:%S', '%Y/%m/%d %H:%M:%S', '%Y.%m.%d %H:%M:%S',
-        '%Y-%m-%d', '%Y/%m/%d', '%d-%m-%Y', '%d/%m/%Y', '%m/%d/%Y',
-        '%Y.%m.%d', '%d.%m.%Y', '%m.%d.%Y',
-        
-        # 영어 월 이름
-        '%b %d, %Y', '%B %d, %Y', '%d %b %Y', '%d %B %Y',
-        '%b %d %Y', '%B %d %Y', '%Y %b %d', '%Y %B %d',
-        
-        # 한국어 형식
-        '%Y년 %m월 %d일', '%Y. %m. %d.', '%Y. %m. %d', '%y.%m.%d', '%Y년%m월%d일',
-        
-        # 특수 형식들
-        '%Y%m%d', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%dT%H:%M:%SZ',
-        '%Y. %m. %d. %H:%M', '%Y/%m/%d %H:%M', '%d/%m/%Y %H:%M',
-        
-        # 추가 영어 형식
-        '%a, %d %b %Y', '%A, %B %d, %Y', '%d-%b-%Y',
-        
-        # 숫자만으로 구성된 형식
-        '%Y%m%d%H%M%S', '%Y%m%d%H%M',
-    ]
+    # isoparse는 연도 4자리로 시작하는 문자열만 처리할 수 있으므로 나머지는 시도하지 않음
+    if original_date_str[:4].isdigit():
+        try:
+            # T와 Z가 포함된 ISO 형식
+            iso_cleaned = original_date_str.replace(' ', 'T')
+            dt_obj = get_date_parser().isoparse(iso_cleaned)
+            return dt_obj.strftime('%Y-%m-%d')
+        except (ValueError, TypeError):
+            pass
     
-    for fmt in formats:
+    # 5. 문자열 모양과 일치하는 날짜 형식만 시도
+    for fmt in _date_formats_for(original_date_str):
         try:
             date_obj = datetime.strptime(original_date_str, fmt)
             return date_obj.strftime('%Y-%m-%d')
@@ -332,12 +417,73 @@ def parse_date(date_str: str) -> str:
     
     # 6. dateutil.parser로 최종 시도 (더 관대한 설정)
     try:
-        parsed_date = date_parser.parse(original_date_str, fuzzy=True, dayfirst=False, yearfirst=True)
+        parsed_date = get_date_parser().parse(original_date_str, fuzzy=True, dayfirst=False, yearfirst=True)
         return parsed_date.strftime('%Y-%m-%d')
     except (ValueError, TypeError, OverflowError) as e:
         print(f"날짜 파싱 최종 실패: '{original_date_str}' ({e})")
         return original_date_str
 
+# 상대 링크를 절대 URL로 변환 (메뉴/내비게이션 링크가 페이지마다 반복되므로 결과 캐싱)
+@lru_cache(maxsize=4096)
+def absolute_url(base: str, href: str) -> str:
+    return urllib.parse.urljoin(base, href)
+
+# 캐시 키용 URL 정규화 (utm_* 추적 파라미터와 #fragment 제거)
+def canonicalize_url(url: str) -> str:
+    parsed = urllib.parse.urlparse(url)
+    query = [(key, value) for key, value in urllib.parse.parse_qsl(parsed.query, keep_blank_values=True)
+             if not key.lower().startswith('utm_')]
+    return urllib.parse.urlunparse(parsed._replace(query=urllib.parse.urlencode(query), fragment=''))
+
+# 기사 추출 결과 디스크 캐시 (정규화된 URL 기준, 실행 간 재사용)
+ARTICLE_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "article_cache.db"
+)
+
+article_cache_db = None
+
+def get_article_cache_db() -> Optional[sqlite3.Connection]:
+    global article_cache_db
+    if article_cache_db is None:
+        try:
+            article_cache_db = sqlite3.connect(ARTICLE_CACHE_PATH)
+            article_cache_db.execute(
+                "CREATE TABLE IF NOT EXISTS articles (url TEXT PRIMARY KEY, fetched_at REAL NOT NULL, content BLOB NOT NULL)"
+            )
+        except sqlite3.Error:
+            # 캐시를 사용할 수 없으면 매번 페이지를 로드
+            article_cache_db = None
+    return article_cache_db
+
+def load_cached_article(url: str, max_age_seconds: float) -> Optional[Dict[str, Any]]:
+    db = get_article_cache_db()
+    if db is None:
+        return None
+    try:
+        row = db.execute(
+            "SELECT content FROM articles WHERE url = ? AND fetched_at >= ?", (url, time.time() - max_age_seconds)
+        ).fetchone()
+    except sqlite3.Error:
+        return None
+    return json.loads(row[0]) if row else None
+
+def save_cached_article(url: str, content: Dict[str, Any]) -> None:
+    db = get_article_cache_db()
+    if db is None:
+        return
+    # 원본 HTML은 캐시 적중 시 사용하지 않으므로 저장하지 않음
+    content = {key: value for key, value in content.items() if key != 'html'}
+    try:
+        data = orjson.dumps(content) if orjson is not None else json.dumps(content, ensure_ascii=False).encode('utf-8')
+        with db:
+            db.execute(
+                "INSERT OR REPLACE INTO articles (url, fetched_at, content) VALUES (?, ?, ?)",
+                (url, time.time(), data)
+            )
+    except (sqlite3.Error, TypeError):
+        # 캐시 저장 실패는 크롤링 결과에 영향을 주지 않음
+        pass
+
 # 향상된 날짜 관련성 확인
 def is_relevant_date(date_str: str, target_date: Optional[str] = None, timeframe_hours: int = 48) -> bool:
     if not date_str:
@@ -349,18 +495,40 @@ def is_relevant_date(date_str: str, target_date: Optional[str] = None, timeframe
     
     print(f"📅 날짜 확인: '{date_str}', 기준: {timeframe_hours}시간 이내")
     
+    # 숫자도 오늘/어제 표현도 없는 문자열(또는 지나치게 긴 문구)은 파싱 시도 없이 바로 포함
+    # (이런 문자열은 기존에도 파싱에 실패해 포함되었으므로 제외하지 않고 같은 결과를 빠르게 반환)
+    if len(date_str) > _MAX_DATE_STR_LEN or not (
+        any(c.isdigit() for c in date_str)
+        or any(pattern in date_str.lower() for pattern in _TODAY_PATTERNS + _YESTERDAY_PATTERNS)
+    ):
+        print(f"📅 날짜 형식이 아니지만 포함: {date_str}")
+        return True
+    
     try:
-        # 다양한 형식의 날짜 처리
-        parsed_date_str = parse_date(date_str)
-        if not parsed_date_str or parsed_date_str == date_str:
-            # 파싱 실패 시 더 관대하게 처리
-            print(f"📅 날짜 파싱 실패하지만 포함: {date_str}")
-            return True
+        date_obj = None
         
-        # YYYY-MM-DD 형식으로 파싱된 경우
-        if re.match(r'\d{4}-\d{2}-\d{2}', parsed_date_str):
-            date_obj = datetime.strptime(parsed_date_str, '%Y-%m-%d').replace(tzinfo=timezone.utc)
-            
+        # <time datetime="..."> 같은 ISO 일시 문자열은 parse_date를 거치지 않고 바로 변환
+        # (YYYY-MM-DD만 있는 문자열은 기존처럼 parse_date 경로로 처리)
+        if len(date_str) > 10 and _ISO_PREFIX_RE.match(date_str):
+            try:
+                iso_dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+                date_obj = datetime(iso_dt.year, iso_dt.month, iso_dt.day, tzinfo=timezone.utc)
+            except ValueError:
+                pass
+        
+        if date_obj is None:
+            # 다양한 형식의 날짜 처리
+            parsed_date_str = parse_date(date_str)
+            if not parsed_date_str or parsed_date_str == date_str:
+                # 파싱 실패 시 더 관대하게 처리
+                print(f"📅 날짜 파싱 실패하지만 포함: {date_str}")
+                return True
+            
+            # YYYY-MM-DD 형식으로 파싱된 경우
+            if _ISO_DATE_RE.match(parsed_date_str):
+                date_obj = datetime.strptime(parsed_date_str, '%Y-%m-%d').replace(tzinfo=timezone.utc)
+        
+        if date_obj is not None:
             # target_date가 있으면 해당 날짜 이후인지 확인
             if target_date:
                 target_date_obj = datetime.strptime(target_date, '%Y-%m-%d').replace(tzinfo=timezone.utc)
@@ -391,20 +559,448 @@ def is_relevant_date(date_str: str, target_date: Optional[str] = None, timeframe
         print(f"📅 날짜 처리 중 오류: {str(e)} - 포함함")
         return True
 
+# 브라우저/컨텍스트 설정 (스크래핑에 불필요한 Chromium 기능은 끔)
+_BROWSER_LAUNCH_ARGS = (
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-blink-features=AutomationControlled',
+    '--disable-extensions',
+    '--disable-sync',
+    '--disable-background-networking',
+    '--disable-features=TranslateUI',
+    '--blink-settings=imagesEnabled=false',
+    '--mute-audio',
+    '--no-first-run',
+    '--no-default-browser-check',
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding',
+)
+_VIEWPORT = {'width': 1920, 'height': 1080}
+_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+_EXTRA_HTTP_HEADERS = {
+    'Accept-Language': 'en-US,en;q=0.9,ko;q=0.8',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
+}
+
+# 크롤링에 필요 없는 리소스 (이미지 URL은 src 속성에서 읽으므로 바이트를 받을 필요 없음)
+# 스타일시트는 요소 가시성/레이아웃 판단에 쓰이므로 차단하지 않음
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media', 'websocket'})
+_BLOCKED_HOSTS_RE = re.compile(
+    r'(^|\.)(google-analytics\.com|googletagmanager\.com|doubleclick\.net|facebook\.net|'
+    r'scorecardresearch\.com|hotjar\.com|segment\.(io|com)|quantserve\.com)$'
+)
+
+# 팝업/쿠키 배너 닫기 버튼 후보
+_POPUP_SELECTORS = (
+    # 쿠키 관련
+    "button:has-text('Accept')", "button:has-text('Agree')",
+    "button:has-text('Accept Cookies')", "button:has-text('Allow Cookies')",
+    "button:has-text('Accept All')", "button:has-text('Got it')",
+    "button:has-text('OK')", "button:has-text('확인')",
+    "button[id*='cookie'][id*='accept']", "button[class*='cookie'][class*='accept']",
+    
+    # GDPR 관련
+    "button:has-text('I Understand')", "button:has-text('Understood')",
+    "button:has-text('Continue')", "button:has-text('Proceed')",
+    
+    # 뉴스레터/구독 관련
+    "button:has-text('Maybe Later')", "button:has-text('No Thanks')",
+    "button:has-text('Skip')", "button:has-text('Close')",
+    "[aria-label*='close']", "[aria-label*='dismiss']",
+    
+    # 일반적인 닫기 버튼
+    ".close", ".dismiss", ".popup-close", ".modal-close",
+    "[data-dismiss]", "[data-close]",
+    
+    # 특정 사이트 패턴
+    "div[role='dialog'] button", "div[aria-modal='true'] button",
+)
+_MAX_POPUP_CLICKS = 10
+
+# 브라우저에서 직접 검사할 수 있도록 Playwright 전용 :has-text()를 (CSS 선택자, 포함 텍스트)로 분리
+_HAS_TEXT_RE = re.compile(r"^(.*):has-text\('(.*)'\)$")
+_POPUP_TARGETS = [
+    [match.group(1), match.group(2).lower()] if (match := _HAS_TEXT_RE.match(selector)) else [selector, None]
+    for selector in _POPUP_SELECTORS
+]
+
+# 팝업 닫기 버튼 클릭과 오버레이 숨김을 한 번의 evaluate로 처리
+_DISMISS_POPUPS_JS = r'''([targets, maxClicks]) => {
+    const clicked = [];
+    const isClickable = (el) => {
+        if (el.disabled) return false;
+        const rect = el.getBoundingClientRect();
+        if (rect.width === 0 || rect.height === 0) return false;
+        return window.getComputedStyle(el).visibility !== 'hidden';
+    };
+    
+    // 선택자마다 보이는 첫 번째 버튼만 클릭 (Playwright :has-text처럼 대소문자 무시 부분 일치)
+    for (const [css, text] of targets) {
+        if (clicked.length >= maxClicks) break;
+        let elements;
+        try {
+            elements = document.querySelectorAll(css);
+        } catch (e) {
+            continue;
+        }
+        for (const el of elements) {
+            if (text !== null && !(el.textContent || '').toLowerCase().includes(text)) continue;
+            if (!isClickable(el)) continue;
+            try {
+                el.click();
+                clicked.push(text !== null ? `${css}:has-text('${text}')` : css);
+            } catch (e) {}
+            break;
+        }
+    }
+    
+    // 고정 위치 오버레이 제거
+    const overlays = document.querySelectorAll('[style*="position: fixed"], [style*="position:fixed"]');
+    overlays.forEach(el => {
+        const zIndex = window.getComputedStyle(el).zIndex;
+        if (parseInt(zIndex) > 1000) {
+            el.style.display = 'none';
+        }
+    });
+    
+    // 일반적인 오버레이 클래스 제거
+    document.querySelectorAll('.overlay, .modal-backdrop, .popup-overlay, .cookie-banner')
+        .forEach(el => el.style.display = 'none');
+    
+    return clicked;
+}'''
+
+@lru_cache(maxsize=64)
+def _substring_matcher(patterns: tuple) -> Optional[re.Pattern]:
+    """부분 문자열 목록 중 하나라도 포함되는지 한 번에 검사하는 정규식 (패턴이 없으면 None)"""
+    if not patterns:
+        return None
+    return re.compile('|'.join(map(re.escape, patterns)))
+
+# 링크 필터링 기본 제외 URL 패턴과 비콘텐츠 링크 표시 (제한적으로 유지)
+_BASIC_EXCLUDED_URL_PATTERNS = (
+    '/login', '/register', '/signup', '/subscribe', '/account',
+    '/profile', '/settings', '/privacy', '/terms', '/contact',
+    '/about', '/search', '/feed/', '/rss/', '/xml', '/sitemap',
+    '/wp-admin', '/admin', '/ads/', '/advertisement'
+)
+_NON_CONTENT_HREF_KEYWORDS = ('javascript:', 'mailto:', 'tel:', '#top', '#bottom', 'void(0)')
+_NON_CONTENT_HREF_RE = _substring_matcher(_NON_CONTENT_HREF_KEYWORDS)
+
+# 링크 관련성 점수에 쓰는 기술/뉴스 키워드 (긴 키워드 우선)
+_TECH_KEYWORDS_RE = re.compile(
+    r'artificial intelligence|machine learning|deep learning|technology|innovation|'
+    r'hardware|software|startup|digital|neural|tech|llm|gpt|ai',
+    re.IGNORECASE
+)
+
+# 페이지 로드 후 본문이 준비되었는지 판단하는 선택자
+_CONTENT_READY_SELECTOR = 'article, main, [role=main], h1'
+
+# 본문에서 제거할 요소 (텍스트 정리와 미디어 필터링에 공통 사용)
+_CONTENT_REMOVE_SELECTORS = (
+    'script', 'style', 'nav', 'footer', 'header', 'aside',
+    '.sidebar', '.nav', '.footer', '.menu', '.navigation',
+    '.comments', '.comment-section', '.reply-form', '.comment-form',
+    '.related-posts', '.related-articles', '.related-content',
+    '.advertisement', '.ads', '.ad-container', '.ad-banner',
+    '.social-media', '.share-buttons', '.social-share',
+    '.author-bio', '.author-box', '.author-info',
+    '.tags', '.categories', '.meta', '.breadcrumb',
+    '.popup', '.modal', '.overlay', '.newsletter',
+    'form', 'input', 'textarea', 'button', 'select',
+    '[aria-hidden="true"]', '.hidden', '[style*="display:none"]',
+    '.cookie-banner', '.gdpr', '.newsletter-signup'
+)
+_CONTENT_REMOVE_SELECTOR = ', '.join(_CONTENT_REMOVE_SELECTORS)
+
+# 기사 페이지에서 본문, 미디어 URL, 메타데이터, 제목을 한 번의 evaluate로 추출하는 스크립트
+_PAGE_EXTRACT_JS = r'''([selector, removeSelector]) => {
+    // CMS 감지 (본문 선택자 결정용, 전체 HTML 직렬화 없이 요소 조회로 판별)
+    const siteType = { platform: 'unknown', cms: 'unknown' };
+    if (document.querySelector('link[href*="wp-content"], script[src*="wp-content"], script[src*="/wp-includes/"], meta[name="generator"][content*="WordPress"]')) {
+        siteType.cms = 'wordpress';
+        siteType.platform = 'blog';
+    } else if (window.location.hostname.includes('medium') || document.querySelector('.medium-feed')) {
+        siteType.cms = 'medium';
+        siteType.platform = 'blog';
+    }
+    
+    let mainElement = null;
+    
+    // 1. 사이트별 맞춤 선택자 시도
+    if (siteType.cms === 'wordpress') {
+        const wpSelectors = ['.entry-content', '.post-content', 'article .content'];
+        for (const sel of wpSelectors) {
+            mainElement = document.querySelector(sel);
+            if (mainElement) break;
+        }
+    } else if (siteType.cms === 'medium') {
+        const mediumSelectors = ['article section', '.postArticle-content'];
+        for (const sel of mediumSelectors) {
+            mainElement = document.querySelector(sel);
+            if (mainElement) break;
+        }
+    }
+    
+    // 2. 제공된 선택자 시도
+    if (!mainElement && selector) {
+        const selectors = selector.split(',').map(s => s.trim());
+        for (const sel of selectors) {
+            try {
+                mainElement = document.querySelector(sel);
+                if (mainElement) break;
+            } catch (e) {}
+        }
+    }
+    
+    // 3. 시맨틱 태그 시도
+    if (!mainElement) {
+        const semanticSelectors = ['article', 'main', '[role="main"]', '[role="article"]'];
+        for (const sel of semanticSelectors) {
+            mainElement = document.querySelector(sel);
+            if (mainElement) break;
+        }
+    }
+    
+    // 4. 텍스트 밀도 기반 자동 감지
+    if (!mainElement) {
+        let bestElement = null;
+        let maxScore = 0;
+        
+        const candidates = document.querySelectorAll('div, section, article');
+        candidates.forEach(el => {
+            if (el.offsetHeight === 0) return; // 숨겨진 요소 제외
+            
+            const textLength = (el.textContent || '').length;
+            const linkCount = el.querySelectorAll('a').length;
+            const imgCount = el.querySelectorAll('img').length;
+            
+            // 점수 계산 (텍스트 많음, 링크 적음이 좋음)
+            let score = textLength;
+            score -= linkCount * 50; // 링크가 많으면 감점
+            score += imgCount * 20;  // 이미지는 약간 가점
+            
+            // 클래스명으로 가점/감점
+            const className = el.className.toLowerCase();
+            if (className.includes('content') || className.includes('article') || className.includes('post')) {
+                score += 100;
+            }
+            if (className.includes('sidebar') || className.includes('nav') || className.includes('footer') || className.includes('header')) {
+                score -= 200;
+            }
+            
+            if (score > maxScore && textLength > 200) {
+                maxScore = score;
+                bestElement = el;
+            }
+        });
+        
+        mainElement = bestElement;
+    }
+    
+    // 5. 최후의 수단
+    if (!mainElement) {
+        mainElement = document.body;
+    }
+    
+    // 메타데이터 추출
+    const extractMetadata = () => {
+        const meta = {};
+    
+        // meta 태그를 한 번만 순회해 property/name -> content 맵 구성 (먼저 나온 값 우선)
+        const metaContent = {};
+        document.querySelectorAll('meta[content]').forEach(el => {
+            const key = el.getAttribute('property') || el.getAttribute('name');
+            if (key && !(key in metaContent)) metaContent[key] = el.getAttribute('content');
+        });
+        const metaValue = (...keys) => {
+            for (const key of keys) {
+                const value = metaContent[key];
+                if (value && value.trim()) return value.trim();
+            }
+            return '';
+        };
+    
+        // 날짜 정보 추출 (meta 태그 우선, 없으면 본문 날짜 요소)
+        let dateStr = metaValue('article:published_time', 'date', 'publish-date', 'publication-date');
+        if (!dateStr) {
+            const dateSelectors = [
+                'time[datetime]',
+                'time',
+                '.date', '.published', '.timestamp',
+                '.post-date', '.article-date', '.entry-date'
+            ];
+        
+            for (const selector of dateSelectors) {
+                const el = document.querySelector(selector);
+                if (el) {
+                    const content = el.getAttribute('content') || 
+                                   el.getAttribute('datetime') || 
+                                   el.textContent;
+                    if (content && content.trim()) {
+                        dateStr = content.trim();
+                        break;
+                    }
+                }
+            }
+        }
+    
+        meta.date = dateStr;
+    
+        // 기타 메타데이터
+        meta.og_title = metaContent['og:title'] || '';
+        meta.og_description = metaContent['og:description'] || '';
+        meta.author = metaContent['author'] || metaContent['article:author'] || '';
+        meta.keywords = metaContent['keywords'] || '';
+    
+        return meta;
+    };
+    
+    // 제목 추출
+    const extractHeadline = () => {
+        // 우선순위: og:title > h1 > title
+        const ogTitle = document.querySelector('meta[property="og:title"]');
+        if (ogTitle && ogTitle.content && ogTitle.content.trim().length > 5) {
+            return ogTitle.content.trim();
+        }
+    
+        const twitterTitle = document.querySelector('meta[name="twitter:title"]');
+        if (twitterTitle && twitterTitle.content && twitterTitle.content.trim().length > 5) {
+            return twitterTitle.content.trim();
+        }
+
+        // 메인 콘텐츠 영역에서 h1 찾기
+        const contentAreas = ['article', 'main', '.content', '.post', '.entry'];
+        for (const area of contentAreas) {
+            const container = document.querySelector(area);
+            if (container) {
+                const h1 = container.querySelector('h1');
+                if (h1 && h1.textContent && h1.textContent.trim().length > 5) {
+                    return h1.textContent.trim();
+                }
+            }
+        }
+    
+        // 일반 h1
+        const h1 = document.querySelector('h1');
+        if (h1 && h1.textContent) {
+            const h1Text = h1.textContent.trim();
+            if (h1Text.length > 5 && h1Text.length < 200) {
+                return h1Text;
+            }
+        }
+    
+        // title 태그에서 사이트명 제거
+        const titleTag = document.querySelector('title');
+        if (titleTag && titleTag.textContent) {
+            let titleText = titleTag.textContent.trim();
+        
+            // 일반적인 구분자로 분리
+            const separators = ['|', '-', '–', '—', ':', '»', '«'];
+            for (const sep of separators) {
+                if (titleText.includes(sep)) {
+                    const parts = titleText.split(sep).map(p => p.trim());
+                    // 가장 긴 부분을 제목으로 선택
+                    parts.sort((a, b) => b.length - a.length);
+                    if (parts[0] && parts[0].length > 5) {
+                        titleText = parts[0];
+                        break;
+                    }
+                }
+            }
+        
+            if (titleText.length > 5 && titleText.length < 200) {
+                return titleText;
+            }
+        }
+    
+        return '';
+    };
+    
+    // 본문 사본에서 불필요한 요소를 브라우저 선택자 엔진으로 한 번에 제거
+    const cleaned = mainElement ? mainElement.cloneNode(true) : document.createDocumentFragment();
+    cleaned.querySelectorAll(removeSelector).forEach(el => el.remove());
+    
+    // 미디어 URL 추출 (정리된 본문 기준, src는 문서 URL 기준 절대 경로로 해석됨)
+    const isHttpUrl = (url) => url.startsWith('http://') || url.startsWith('https://');
+    const mediaRoot = cleaned;
+    
+    // 이미지: 작은 이미지, 아이콘/로고/프로필 이미지, 데이터 URL 제외
+    const excludeImagePattern = /icon|logo|avatar|profile|badge|button|emoji/i;
+    const imageUrls = new Set();  // 수집하면서 중복 제거 (삽입 순서 유지)
+    mediaRoot.querySelectorAll('img[src]').forEach(img => {
+        const width = parseInt(img.getAttribute('width'), 10);
+        const height = parseInt(img.getAttribute('height'), 10);
+        if ((!isNaN(width) && width < 150) || (!isNaN(height) && height < 150)) return;
+        // class, id, alt를 이어 붙여 한 번만 검사
+        const attrs = (img.getAttribute('class') || '') + ' ' + img.id + ' ' + (img.getAttribute('alt') || '');
+        if (excludeImagePattern.test(attrs)) return;
+        if (isHttpUrl(img.src)) imageUrls.add(img.src);
+    });
+    
+    // 비디오: 알려진 비디오 서비스 iframe과 video/source 태그
+    const videoDomainPattern = /youtube\.com|youtu\.be|vimeo\.com|dailymotion\.com|player\.twitch\.tv|ted\.com|wistia\.com|brightcove\.com/i;
+    const videoUrls = new Set();
+    mediaRoot.querySelectorAll('iframe[src]').forEach(iframe => {
+        if (videoDomainPattern.test(iframe.src) && isHttpUrl(iframe.src)) videoUrls.add(iframe.src);
+    });
+    mediaRoot.querySelectorAll('video').forEach(video => {
+        if (video.getAttribute('src') && isHttpUrl(video.src)) videoUrls.add(video.src);
+        video.querySelectorAll('source[src]').forEach(source => {
+            if (isHttpUrl(source.src)) videoUrls.add(source.src);
+        });
+    });
+    
+    return {
+        html: mainElement ? cleaned.innerHTML : '',
+        selector_used: mainElement ? mainElement.tagName + (mainElement.className ? '.' + mainElement.className.split(' ')[0] : '') : 'body',
+        imageUrls: Array.from(imageUrls),
+        videoUrls: Array.from(videoUrls),
+        siteType: siteType,
+        metadata: extractMetadata(),
+        headline: extractHeadline()
+    };
+}'''
+
 # Playwright를 사용한 동적 크롤링 클래스 (대폭 개선)
 class DynamicCrawler:
     def __init__(self, 
                  llm_provider: str = 'openai', 
                  headless: bool = True, 
-                 target_date: Optional[str] = None):
+                 target_date: Optional[str] = None,
+                 max_concurrency: int = 3,
+                 user_data_dir: Optional[str] = None,
+                 article_cache_hours: float = 0,
+                 storage_state_path: Optional[str] = None):
         self.llm_provider = llm_provider
         self.headless = headless
         self.target_date = target_date
+        self.max_concurrency = max(1, max_concurrency)
+        # 지정하면 디스크 캐시/쿠키를 실행 간에 유지하는 영구 컨텍스트 사용
+        self.user_data_dir = user_data_dir
+        # 지정하면 쿠키/localStorage 스냅샷을 종료 시 저장하고 다음 실행에서 복원
+        self.storage_state_path = storage_state_path
+        # 이 시간 안에 추출한 기사는 디스크 캐시에서 재사용 (기본값 0: 사용 안 함, 캐시 내용은 재검증하지 않음)
+        self.article_cache_hours = article_cache_hours
         self.browser = None
         self.context = None
         self.base_host = None
-        # 사이트 감지 결과 캐싱
+        # 마지막으로 구조를 분석한 페이지의 사이트 설정
+        self.current_site_config = None
+        # 재사용할 페이지 풀 (initialize에서 max_concurrency개 생성)
+        self.page_pool = None
+        # 정규화된 기사 URL별 추출 결과와 처리 중인 요청
+        self._page_cache: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # 사이트 감지 결과 캐싱 (도메인 기준)
         self.site_detection_cache = {}
+        # 호스트별 팝업 처리 결과 (쿠키 동의는 컨텍스트에 유지되므로 호스트당 한 번만 처리)
+        # 처리 중에도 등록해 두어 같은 호스트의 다른 페이지는 그 결과를 기다림 (True: 성공)
+        self._popup_done: Dict[str, asyncio.Future] = {}
         
         print("🚀 간소화된 사이트별 특화 크롤러 초기화")
     
@@ -428,9 +1024,20 @@ class DynamicCrawler:
         print(f"⚠️ 간소화된 버전: 커스텀 설정 비활성화됨 ({domain})")
         return
     
-    def _extract_domain_name(self, url: str) -> str:
-        """URL에서 도메인명 추출"""
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _extract_domain_name(url: str) -> str:
+        """URL에서 도메인명 추출 (같은 사이트의 URL이 반복되므로 결과 캐싱)"""
         try:
+            # 일반적인 "scheme://host/path" 형식은 문자열 분리만으로 호스트를 얻음
+            scheme_end = url.find('://')
+            if scheme_end != -1:
+                domain = url[scheme_end + 3:].split('/', 1)[0]
+                # 사용자 정보, 쿼리, 프래그먼트가 호스트에 붙어 있으면 urlparse로 처리
+                if not any(c in domain for c in '@?#\\'):
+                    domain = domain.lower()
+                    return domain[4:] if domain.startswith('www.') else domain
+            
             parsed = urllib.parse.urlparse(url)
             domain = parsed.netloc.lower()
             # www. 제거
@@ -448,52 +1055,128 @@ class DynamicCrawler:
     async def initialize(self):
         """브라우저 초기화 (더 안정적인 설정)"""
         try:
+            from playwright.async_api import async_playwright
             self.playwright = await async_playwright().start()
             
-            # 더 안정적인 브라우저 설정
-            self.browser = await self.playwright.chromium.launch(
-                headless=self.headless,
-                args=[
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-web-security',
-                    '--disable-extensions',
-                    '--no-first-run',
-                    '--no-default-browser-check',
-                    '--disable-background-timer-throttling',
-                    '--disable-backgrounding-occluded-windows',
-                    '--disable-renderer-backgrounding'
-                ]
-            )
-            
             # 컨텍스트 설정 개선
-            self.context = await self.browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            context_options = dict(
+                viewport=_VIEWPORT,
+                user_agent=_USER_AGENT,
                 java_script_enabled=True,
                 accept_downloads=False,
                 ignore_https_errors=True,
                 bypass_csp=True,  # CSP 우회
-                extra_http_headers={
-                    'Accept-Language': 'en-US,en;q=0.9,ko;q=0.8',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
-                }
+                extra_http_headers=_EXTRA_HTTP_HEADERS
             )
             
+            if self.user_data_dir:
+                # 영구 컨텍스트: HTTP 캐시와 쿠키(쿠키 동의 등)를 다음 실행에서 재사용
+                self.context = await self.playwright.chromium.launch_persistent_context(
+                    self.user_data_dir,
+                    headless=self.headless,
+                    args=list(_BROWSER_LAUNCH_ARGS),
+                    **context_options
+                )
+            else:
+                # 더 안정적인 브라우저 설정
+                self.browser = await self.playwright.chromium.launch(
+                    headless=self.headless,
+                    args=list(_BROWSER_LAUNCH_ARGS)
+                )
+                if self.storage_state_path and os.path.exists(self.storage_state_path):
+                    # 이전 실행의 쿠키(쿠키 동의 등) 복원
+                    context_options['storage_state'] = self.storage_state_path
+                self.context = await self.browser.new_context(**context_options)
+            
+            # 이미지/폰트/미디어와 분석 도구 요청 차단
+            await self.context.route("**/*", self._route_request)
+            
             # 타임아웃 설정
             self.context.set_default_navigation_timeout(90000)  # 90초
             self.context.set_default_timeout(45000)  # 45초
             
+            # 페이지 풀 생성 (페이지 생성/종료 비용을 크롤링 전체에서 한 번만 부담)
+            # 영구 컨텍스트가 처음 열어 둔 페이지도 풀에 포함
+            self.page_pool = asyncio.Queue()
+            initial_pages = list(self.context.pages)[:self.max_concurrency]
+            for page in initial_pages:
+                await self.page_pool.put(page)
+            for _ in range(self.max_concurrency - len(initial_pages)):
+                await self.page_pool.put(await self.context.new_page())
+            
             print("브라우저 및 컨텍스트 초기화 완료")
             
         except Exception as e:
             print(f"브라우저 초기화 오류: {str(e)}")
             raise
     
+    def reset_run_cache(self) -> None:
+        """실행 단위 캐시 초기화 (워커 모드에서 작업마다 호출)"""
+        self._page_cache.clear()
+        self.site_detection_cache.clear()
+        # 연도/일자가 빠진 날짜는 dateutil이 오늘 날짜로 채우므로 작업마다 비움
+        _parse_absolute_date.cache_clear()
+    
+    async def _route_request(self, route) -> None:
+        """불필요한 리소스 요청은 중단하고 나머지는 그대로 진행"""
+        request = route.request
+        host = urllib.parse.urlparse(request.url).hostname or ''
+        if request.resource_type in _BLOCKED_RESOURCE_TYPES or _BLOCKED_HOSTS_RE.search(host):
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    async def _wait_for_content(self, page: Page, selector: str = _CONTENT_READY_SELECTOR, timeout: int = 8000) -> None:
+        """고정 대기 대신 본문 요소가 나타날 때까지만 대기"""
+        try:
+            await page.wait_for_selector(selector, timeout=timeout)
+        except Exception:
+            pass
+        
+        # DOM 로드 후에도 본문이 비어 있으면 JS 렌더링 페이지로 보고 네트워크 안정까지 짧게 대기
+        try:
+            has_text = await page.evaluate("() => !!(document.body && document.body.innerText.trim())")
+            if not has_text:
+                await page.wait_for_load_state('networkidle', timeout=5000)
+        except Exception:
+            pass
+    
+    async def _acquire_page(self) -> Page:
+        """풀에서 페이지를 가져옴 (모두 사용 중이면 반환될 때까지 대기)"""
+        return await self.page_pool.get()
+    
+    async def _release_page(self, page: Page) -> None:
+        """페이지 상태를 비운 뒤 풀에 반환 (닫혔거나 초기화에 실패하면 새 페이지로 교체)"""
+        try:
+            if page.is_closed():
+                raise RuntimeError("page closed")
+            await page.goto('about:blank')
+        except Exception:
+            try:
+                if not page.is_closed():
+                    await page.close()
+                page = await self.context.new_page()
+            except Exception as e:
+                print(f"⚠️ 페이지 풀 복구 실패: {e}")
+                return
+        await self.page_pool.put(page)
+    
+    @asynccontextmanager
+    async def _page_cm(self):
+        """풀 페이지를 빌려 쓰고 자동으로 반환하는 컨텍스트 매니저"""
+        page = await self._acquire_page()
+        try:
+            yield page
+        finally:
+            await self._release_page(page)
+    
     async def close(self):
         """리소스 정리"""
+        if self.context and self.storage_state_path and not self.user_data_dir:
+            try:
+                await self.context.storage_state(path=self.storage_state_path)
+            except Exception as e:
+                print(f"⚠️ 브라우저 상태 저장 실패: {e}")
         if self.context:
             await self.context.close()
         if self.browser:
@@ -503,87 +1186,49 @@ class DynamicCrawler:
     
     async def handle_popups_and_overlays(self, page: Page) -> None:
         """향상된 팝업 및 오버레이 처리"""
+        host = urllib.parse.urlparse(page.url).netloc
+        # 같은 호스트의 다른 페이지가 처리 중이면 끝날 때까지 기다리고, 성공했으면 다시 처리하지 않음
+        # (기다리는 페이지가 취소되어도 공유 결과는 취소되지 않도록 shield 사용)
+        while host in self._popup_done:
+            if await asyncio.shield(self._popup_done[host]):
+                return
+        
+        popup_done = asyncio.get_running_loop().create_future()
+        self._popup_done[host] = popup_done
         try:
-            # 일반적인 팝업 선택자들
-            popup_selectors = [
-                # 쿠키 관련
-                "button:has-text('Accept')", "button:has-text('Agree')", 
-                "button:has-text('Accept Cookies')", "button:has-text('Allow Cookies')",
-                "button:has-text('Accept All')", "button:has-text('Got it')",
-                "button:has-text('OK')", "button:has-text('확인')",
-                "button[id*='cookie'][id*='accept']", "button[class*='cookie'][class*='accept']",
-                
-                # GDPR 관련
-                "button:has-text('I Understand')", "button:has-text('Understood')",
-                "button:has-text('Continue')", "button:has-text('Proceed')",
-                
-                # 뉴스레터/구독 관련
-                "button:has-text('Maybe Later')", "button:has-text('No Thanks')",
-                "button:has-text('Skip')", "button:has-text('Close')",
-                "[aria-label*='close']", "[aria-label*='dismiss']",
-                
-                # 일반적인 닫기 버튼
-                ".close", ".dismiss", ".popup-close", ".modal-close",
-                "[data-dismiss]", "[data-close]",
-                
-                # 특정 사이트 패턴
-                "div[role='dialog'] button", "div[aria-modal='true'] button"
-            ]
-            
-            # ESC 키 시도
+            # ESC 키 시도 (고정 대기 없이 바로 선택자 확인)
             await page.keyboard.press('Escape')
-            await page.wait_for_timeout(1000)
             
-            # 각 선택자 시도
-            for selector in popup_selectors:
-                try:
-                    elements = page.locator(selector)
-                    count = await elements.count()
-                    
-                    for i in range(min(count, 3)):  # 최대 3개까지만 시도
-                        element = elements.nth(i)
-                        if await element.is_visible() and await element.is_enabled():
-                            await element.click(timeout=3000)
-                            print(f"팝업 버튼 클릭: {selector}")
-                            await page.wait_for_timeout(1000)
-                            break
-                except Exception:
-                    continue
+            # 버튼 검사/클릭과 오버레이 제거를 한 번의 evaluate로 처리 (요소마다 CDP 왕복하지 않음)
+            clicked = await page.evaluate(_DISMISS_POPUPS_JS, [_POPUP_TARGETS, _MAX_POPUP_CLICKS])
+            for selector in clicked:
+                print(f"팝업 버튼 클릭: {selector}")
             
-            # 오버레이 제거 (JavaScript)
-            await page.evaluate(r'''() => {
-                // 고정 위치 오버레이 제거
-                const overlays = document.querySelectorAll('[style*="position: fixed"], [style*="position:fixed"]');
-                overlays.forEach(el => {
-                    const zIndex = window.getComputedStyle(el).zIndex;
-                    if (parseInt(zIndex) > 1000) {
-                        el.style.display = 'none';
-                    }
-                });
-                
-                // 일반적인 오버레이 클래스 제거
-                const overlayClasses = ['.overlay', '.modal-backdrop', '.popup-overlay', '.cookie-banner'];
-                overlayClasses.forEach(className => {
-                    const elements = document.querySelectorAll(className);
-                    elements.forEach(el => el.style.display = 'none');
-                });
-            }''')
+            popup_done.set_result(True)
             
         except Exception as e:
             print(f"팝업 처리 중 오류: {e}")
+        finally:
+            if not popup_done.done():
+                # 실패하면 기록을 지워 다음 페이지가 다시 시도
+                del self._popup_done[host]
+                popup_done.set_result(False)
     
     async def analyze_page_structure(self, page: Page, url: str) -> Dict[str, Any]:
         """향상된 페이지 구조 분석"""
         try:
             # 사이트 감지 (캐싱 사용)
-            if url not in self.site_detection_cache:
-                self.site_detection_cache[url] = await SiteDetector.detect_site_type(page)
+            # 사이트 유형은 도메인 단위로 같으므로 전체 URL 대신 도메인으로 캐싱
+            site_key = self._extract_domain_name(url)
+            if site_key not in self.site_detection_cache:
+                self.site_detection_cache[site_key] = await SiteDetector.detect_site_type(page)
             
-            site_detection = self.site_detection_cache[url]
+            site_detection = self.site_detection_cache[site_key]
             
-            # 사이트별 설정 가져오기
-            self.current_site_config = site_config_manager.get_config(url)
-            print(f"사이트 설정 적용: {self.current_site_config.domain} (감지된 유형: {site_detection['platform']}/{site_detection['cms']})")
+            # 사이트별 설정 가져오기 (여러 사이트를 동시에 분석하므로 지역 변수 사용)
+            site_config = site_config_manager.get_config(url)
+            self.current_site_config = site_config
+            print(f"사이트 설정 적용: {site_config.domain} (감지된 유형: {site_detection['platform']}/{site_detection['cms']})")
             
             # 동적으로 감지된 선택자와 기존 설정 결합
             universal_selectors = site_config_manager.get_universal_selectors()
@@ -591,7 +1236,7 @@ class DynamicCrawler:
             
             # 선택자 우선순위: 사이트별 > 감지된 것 > 범용
             article_selectors = (
-                self.current_site_config.article_selectors +
+                site_config.article_selectors +
                 detected_selectors['articles'] +
                 universal_selectors['article_selectors']
             )
@@ -600,227 +1245,254 @@ class DynamicCrawler:
             article_selectors = list(dict.fromkeys(article_selectors))
             
             # 페이지에서 링크 추출 (더 스마트한 방식)
-            links = await page.evaluate(r'''(selectors, siteType) => {
+            # 링크 정보는 객체 배열 대신 필드별 배열로 받아 직렬화 크기를 줄임
+            link_arrays = await page.evaluate(r'''([selectors, siteType]) => {
                 console.log('🔍 사용할 선택자들:', selectors);
                 console.log('🏛️ 사이트 유형:', siteType);
                 
-                let allLinks = [];
+                const hrefs = [];
+                const texts = [];
+                const dates = [];
+                const containerTags = [];
                 const processedHrefs = new Set();
                 let totalElements = 0;
                 
-                // 각 선택자에 대해 링크 수집
-                for (const selector of selectors) {
+                // 링크마다 다시 만들지 않도록 선택자 목록과 정규식은 한 번만 생성
+                const containers = [
+                    'article', '.post', '.entry', '.news-item', '.story', '.item',
+                    '[role="listitem"]', '[role="article"]', '.content-item', 
+                    '.blog-post', '.post-item', '.news-post', 'li', '.card'  // 추가 컨테이너
+                ];
+                
+                // 날짜 선택자들 (확장됨)
+                const dateSelectors = [
+                    'time', '[datetime]', '.date', '.published', '.timestamp',
+                    '.post-date', '.article-date', '.entry-date', '.published-date',
+                    '.byline time', '.meta time', '[data-date]', '.age', '.subtext',
+                    'span[title*="20"]', 'span[aria-label*="20"]', 'abbr.published',
+                    '.timestamp-text', 'span[class*="date"]'  // 추가 선택자
+                ];
+                
+                // 날짜 패턴 확인 (더 관대하게)
+                const DATE_TEXT_RE = new RegExp([
+                    '\\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\\b',
+                    '\\b(\\d{1,2})\\s*(hour|day|week|month|year)s?\\s*(ago|전)\\b',
+                    '\\b(today|yesterday|오늘|어제|방금|now|지금)\\b',
+                    '\\d{4}-\\d{2}-\\d{2}',
+                    '\\d{1,2}\\s*(시간|일|주|개월)\\s*(전|ago)'
+                ].join('|'), 'i');
+                
+                // 백업: 텍스트에서 날짜 패턴 찾기 (첫 번째 일치만 필요하므로 g 플래그 없음)
+                const DATE_RES = [
+                    /\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},?\s+\d{4}\b/,
+                    /\b\d{1,2}\s*(hour|day|week|month)s?\s*ago\b/,
+                    /\b(today|yesterday|방금|지금|오늘|어제)\b/,
+                    /\d{4}-\d{2}-\d{2}/,
+                    /\d{1,2}\s*(시간|일|주|개월)\s*전/
+                ];
+                
+                // 선택자마다 문서를 다시 탐색하지 않고 한 번의 querySelectorAll로 후보를 모은 뒤,
+                // 각 요소를 처음 일치하는 선택자 버킷에 넣어 기존의 선택자 우선순위 순서를 유지
+                const validSelectors = selectors.filter(selector => {
                     try {
-                        const elements = document.querySelectorAll(selector);
-                        totalElements += elements.length;
-                        console.log(`🔍 선택자 "${selector}": ${elements.length}개 요소 발견`);
+                        document.createDocumentFragment().querySelector(selector);
+                        return true;
+                    } catch (e) {
+                        console.warn('⚠️ 선택자 처리 오류:', selector, e);
+                        return false;
+                    }
+                });
+                const buckets = validSelectors.map(() => []);
+                
+                if (validSelectors.length > 0) {
+                    const candidates = document.querySelectorAll(validSelectors.join(', '));
+                    totalElements = candidates.length;
+                    for (const element of candidates) {
+                        const bucketIndex = validSelectors.findIndex(selector => element.matches(selector));
+                        if (bucketIndex !== -1) buckets[bucketIndex].push(element);
+                    }
+                }
+                
+                // 각 선택자에 대해 링크 수집
+                validSelectors.forEach((selector, selectorIndex) => {
+                    const elements = buckets[selectorIndex];
+                    console.log(`🔍 선택자 "${selector}": ${elements.length}개 요소 발견`);
+                    
+                    elements.forEach((link, index) => {
+                        const href = link.getAttribute('href');
+                        if (!href || processedHrefs.has(href)) return;
                         
-                        elements.forEach((link, index) => {
-                            const href = link.getAttribute('href');
-                            if (!href || processedHrefs.has(href)) return;
-                            
-                            // 링크 품질 검사 (더 관대하게)
-                            if (href.startsWith('javascript:') || 
-                                href.startsWith('mailto:') || 
-                                href.startsWith('tel:') ||
-                                href === '#' ||
-                                href.length < 3) {
-                                return;
-                            }
-                            
-                            processedHrefs.add(href);
-                            
-                            // 더 정교한 날짜 추출
-                            let dateStr = '';
-                            
-                            // 1. 링크가 속한 컨테이너에서 날짜 찾기
-                            const containers = [
-                                'article', '.post', '.entry', '.news-item', '.story', '.item',
-                                '[role="listitem"]', '[role="article"]', '.content-item', 
-                                '.blog-post', '.post-item', '.news-post', 'li', '.card'  // 추가 컨테이너
-                            ];
-                            
-                            let container = null;
-                            for (const containerSelector of containers) {
-                                container = link.closest(containerSelector);
-                                if (container) break;
-                            }
-                            
-                            if (container) {
-                                // 날짜 선택자들 (확장됨)
-                                const dateSelectors = [
-                                    'time', '[datetime]', '.date', '.published', '.timestamp',
-                                    '.post-date', '.article-date', '.entry-date', '.published-date',
-                                    '.byline time', '.meta time', '[data-date]', '.age', '.subtext',
-                                    'span[title*="20"]', 'span[aria-label*="20"]', 'abbr.published',
-                                    '.timestamp-text', 'span[class*="date"]'  // 추가 선택자
-                                ];
-                                
-                                for (const dateSelector of dateSelectors) {
-                                    const dateEl = container.querySelector(dateSelector);
-                                    if (dateEl) {
-                                        let text = dateEl.getAttribute('datetime') || 
-                                                  dateEl.getAttribute('title') || 
-                                                  dateEl.getAttribute('data-date') ||
-                                                  dateEl.textContent;
-                                        
-                                        if (text && text.trim()) {
-                                            text = text.trim();
-                                            // 날짜 패턴 확인 (더 관대하게)
-                                            if (/\\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\\b/i.test(text) ||
-                                                /\\b(\\d{1,2})\\s*(hour|day|week|month|year)s?\\s*(ago|전)\\b/i.test(text) ||
-                                                /\\b(today|yesterday|오늘|어제|방금|now|지금)\\b/i.test(text) ||
-                                                /\\d{4}-\\d{2}-\\d{2}/.test(text) ||
-                                                /\\d{1,2}\\s*(시간|일|주|개월)\\s*(전|ago)/.test(text)) {
-                                                dateStr = text;
-                                                break;
-                                            }
-                                        }
-                                    }
-                                }
-                                
-                                // 백업: 텍스트에서 날짜 패턴 찾기 (더 많은 패턴)
-                                if (!dateStr) {
-                                    const textContent = container.textContent || '';
-                                                                    const datePatterns = [
-                                    /\\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\\s+\\d{1,2},?\\s+\\d{4}\\b/g,
-                                    /\\b\\d{1,2}\\s*(hour|day|week|month)s?\\s*ago\\b/g,
-                                    /\\b(today|yesterday|방금|지금|오늘|어제)\\b/g,
-                                    /\\d{4}-\\d{2}-\\d{2}/g,
-                                    /\\d{1,2}\\s*(시간|일|주|개월)\\s*전/g
-                                ];
+                        // 링크 품질 검사 (더 관대하게)
+                        if (href.startsWith('javascript:') || 
+                            href.startsWith('mailto:') || 
+                            href.startsWith('tel:') ||
+                            href === '#' ||
+                            href.length < 3) {
+                            return;
+                        }
+                        
+                        processedHrefs.add(href);
+                        
+                        // 더 정교한 날짜 추출
+                        let dateStr = '';
+                        
+                        // 1. 링크가 속한 컨테이너에서 날짜 찾기
+                        let container = null;
+                        for (const containerSelector of containers) {
+                            container = link.closest(containerSelector);
+                            if (container) break;
+                        }
+                        
+                        if (container) {
+                            for (const dateSelector of dateSelectors) {
+                                const dateEl = container.querySelector(dateSelector);
+                                if (dateEl) {
+                                    let text = dateEl.getAttribute('datetime') || 
+                                              dateEl.getAttribute('title') || 
+                                              dateEl.getAttribute('data-date') ||
+                                              dateEl.textContent;
                                     
-                                    for (const pattern of datePatterns) {
-                                        const match = textContent.match(pattern);
-                                        if (match) {
-                                            dateStr = match[0];
+                                    if (text && text.trim()) {
+                                        text = text.trim();
+                                        if (DATE_TEXT_RE.test(text)) {
+                                            dateStr = text;
                                             break;
                                         }
                                     }
                                 }
                             }
                             
-                            // 링크 텍스트 추출 (더 스마트하게)
-                            let linkText = (link.innerText || link.textContent || '').trim();
-                            if (!linkText) {
-                                // 이미지 alt 텍스트나 title 속성도 확인
-                                const img = link.querySelector('img');
-                                if (img) {
-                                    linkText = img.getAttribute('alt') || img.getAttribute('title') || '';
-                                }
-                                if (!linkText) {
-                                    linkText = link.getAttribute('title') || link.getAttribute('aria-label') || '';
+                            // 백업: 텍스트에서 날짜 패턴 찾기 (더 많은 패턴)
+                            if (!dateStr) {
+                                const textContent = container.textContent || '';
+                                for (const pattern of DATE_RES) {
+                                    const match = pattern.exec(textContent);
+                                    if (match) {
+                                        dateStr = match[0];
+                                        break;
+                                    }
                                 }
                             }
-                            
-                            // 링크 정보 생성
-                            const linkData = {
-                                href: href,
-                                text: linkText,
-                                classes: link.className || '',
-                                id: link.id || '',
-                                date: dateStr,
-                                selector_used: selector,
-                                container_tag: container ? container.tagName.toLowerCase() : 'none'
-                            };
-                            
-                            // 텍스트 길이 필터링 (더 관대하게)
-                            if (linkData.text.length >= 2 && linkData.text.length <= 300) {  // 5자에서 2자로, 200자에서 300자로
-                                allLinks.push(linkData);
+                        }
+                        
+                        // 링크 텍스트 추출 (더 스마트하게)
+                        let linkText = (link.innerText || link.textContent || '').trim();
+                        if (!linkText) {
+                            // 이미지 alt 텍스트나 title 속성도 확인
+                            const img = link.querySelector('img');
+                            if (img) {
+                                linkText = img.getAttribute('alt') || img.getAttribute('title') || '';
                             }
-                        });
-                    } catch (e) {
-                        console.warn('⚠️ 선택자 처리 오류:', selector, e);
-                    }
-                }
+                            if (!linkText) {
+                                linkText = link.getAttribute('title') || link.getAttribute('aria-label') || '';
+                            }
+                        }
+                        
+                        // 텍스트 길이 필터링 (더 관대하게)
+                        if (linkText.length >= 2 && linkText.length <= 300) {  // 5자에서 2자로, 200자에서 300자로
+                            hrefs.push(href);
+                            texts.push(linkText);
+                            dates.push(dateStr);
+                            containerTags.push(container ? container.tagName.toLowerCase() : 'none');
+                        }
+                    });
+                });
                 
-                console.log(`📊 통계: 총 ${totalElements}개 요소 검사, ${allLinks.length}개 유효 링크 추출`);
+                console.log(`📊 통계: 총 ${totalElements}개 요소 검사, ${hrefs.length}개 유효 링크 추출`);
                 
                 // 백업: 기본 링크 추출 (아무것도 찾지 못한 경우)
-                if (allLinks.length === 0) {
+                if (hrefs.length === 0) {
                     console.log('🔄 백업 링크 추출 시도...');
-                    const fallbackSelectors = ['a[href]', 'a'];
-                    
-                    for (const selector of fallbackSelectors) {
-                        const links = document.querySelectorAll(selector);
-                        console.log(`🔄 백업 선택자 "${selector}": ${links.length}개 링크`);
+                    // 노드 목록 스냅샷을 만들지 않는 라이브 컬렉션 사용
+                    // (href 없는 a는 어차피 제외되므로 'a' 선택자로 다시 시도할 필요 없음)
+                    const links = document.getElementsByTagName('a');
+                    console.log(`🔄 백업 링크 추출: ${links.length}개 링크`);
+                    
+                    let examined = 0;
+                    for (let i = 0; i < links.length && examined < 50; i++) {  // href가 있는 링크 최대 50개만
+                        const link = links[i];
+                        const href = link.getAttribute('href');
+                        if (href === null) continue;
+                        examined++;
                         
-                        Array.from(links).slice(0, 50).forEach(link => {  // 최대 50개만
-                            const href = link.getAttribute('href');
-                            const text = (link.textContent || '').trim();
-                            
-                            if (href && href.length > 3 && text.length > 2 && 
-                                !href.startsWith('javascript:') && 
-                                !href.startsWith('mailto:') && 
-                                !processedHrefs.has(href)) {
-                                
-                                processedHrefs.add(href);
-                                allLinks.push({
-                                    href: href,
-                                    text: text,
-                                    classes: link.className || '',
-                                    id: link.id || '',
-                                    date: '',
-                                    selector_used: 'fallback:' + selector,
-                                    container_tag: 'fallback'
-                                });
-                            }
-                        });
+                        const text = (link.textContent || '').trim();
                         
-                        if (allLinks.length > 0) break;
+                        if (href.length > 3 && text.length > 2 && 
+                            !href.startsWith('javascript:') && 
+                            !href.startsWith('mailto:') && 
+                            !processedHrefs.has(href)) {
+                            
+                            processedHrefs.add(href);
+                            hrefs.push(href);
+                            texts.push(text);
+                            dates.push('');
+                            containerTags.push('fallback');
+                        }
                     }
                 }
                 
                 // 품질 점수 계산 및 정렬
-                allLinks.forEach(link => {
+                const scores = hrefs.map((href, i) => {
                     let score = 0;
                     
                     // 날짜가 있으면 가점
-                    if (link.date) score += 5;
+                    if (dates[i]) score += 5;
                     
                     // 제목 품질 점수
-                    const titleWords = link.text.split(/\\s+/).length;
+                    const titleWords = texts[i].split(/\s+/).length;
                     if (titleWords >= 2 && titleWords <= 20) score += 3;  // 3에서 2로 완화
                     
                     // URL 품질 점수
-                    if (link.href.includes('/article/') || 
-                        link.href.includes('/post/') || 
-                        link.href.includes('/story/') ||
-                        link.href.includes('/blog/') ||
-                        link.href.includes('/news/') ||
-                        link.href.includes('/discover/') ||
-                        link.href.includes('/item?id=')) {
+                    if (href.includes('/article/') || 
+                        href.includes('/post/') || 
+                        href.includes('/story/') ||
+                        href.includes('/blog/') ||
+                        href.includes('/news/') ||
+                        href.includes('/discover/') ||
+                        href.includes('/item?id=')) {
                         score += 2;
                     }
                     
                     // 컨테이너 품질 점수
-                    if (link.container_tag === 'article' || 
-                        link.container_tag === 'li' ||
-                        link.container_tag === 'div') {
+                    if (containerTags[i] === 'article' || 
+                        containerTags[i] === 'li' ||
+                        containerTags[i] === 'div') {
                         score += 1;
                     }
                     
-                    link.quality_score = score;
+                    return score;
                 });
                 
-                // 품질 점수와 날짜 기준 정렬
-                return allLinks
-                    .sort((a, b) => {
-                        // 먼저 품질 점수로 정렬
-                        if (b.quality_score !== a.quality_score) {
-                            return b.quality_score - a.quality_score;
-                        }
-                        // 같은 품질이면 날짜로 정렬
-                        if (a.date && b.date) {
-                            try {
-                                return new Date(b.date) - new Date(a.date);
-                            } catch (e) {
-                                return 0;
-                            }
-                        }
-                        return a.date ? -1 : (b.date ? 1 : 0);
-                    });
-            }''', article_selectors, site_detection['platform'])
+                // 비교할 때마다 날짜 문자열을 다시 파싱하지 않도록 타임스탬프를 미리 계산 (파싱 실패 시 NaN)
+                const timestamps = dates.map(dateStr => dateStr ? Date.parse(dateStr) : NaN);
+                
+                // 품질 점수와 날짜 기준 정렬 (인덱스만 정렬한 뒤 필드별 배열로 반환)
+                const order = hrefs.map((_, i) => i).sort((a, b) => {
+                    // 먼저 품질 점수로 정렬
+                    if (scores[b] !== scores[a]) {
+                        return scores[b] - scores[a];
+                    }
+                    // 같은 품질이면 날짜로 정렬 (파싱할 수 없는 날짜는 같은 순위)
+                    if (dates[a] && dates[b]) {
+                        return (timestamps[b] - timestamps[a]) || 0;
+                    }
+                    return dates[a] ? -1 : (dates[b] ? 1 : 0);
+                });
+                
+                return {
+                    hrefs: order.map(i => hrefs[i]),
+                    texts: order.map(i => texts[i]),
+                    dates: order.map(i => dates[i]),
+                    scores: order.map(i => scores[i])
+                };
+            }''', [article_selectors, site_detection['platform']])
+            
+            links = [
+                {'href': href, 'text': text, 'date': date_str, 'quality_score': score}
+                for href, text, date_str, score in zip(
+                    link_arrays['hrefs'], link_arrays['texts'], link_arrays['dates'], link_arrays['scores']
+                )
+            ]
             
             print(f"🔍 분석 완료: {len(links)}개 링크 추출 (사이트 유형: {site_detection['platform']})")
             
@@ -834,12 +1506,12 @@ class DynamicCrawler:
                     return {
                         title: document.title,
                         url: window.location.href,
-                        totalLinks: document.querySelectorAll('a').length,
-                        articles: document.querySelectorAll('article').length,
-                        h1Count: document.querySelectorAll('h1').length,
-                        h2Count: document.querySelectorAll('h2').length,
-                        h3Count: document.querySelectorAll('h3').length,
-                        hasMain: document.querySelectorAll('main').length > 0,
+                        totalLinks: document.getElementsByTagName('a').length,
+                        articles: document.getElementsByTagName('article').length,
+                        h1Count: document.getElementsByTagName('h1').length,
+                        h2Count: document.getElementsByTagName('h2').length,
+                        h3Count: document.getElementsByTagName('h3').length,
+                        hasMain: document.getElementsByTagName('main').length > 0,
                         bodyClass: document.body ? document.body.className : 'none'
                     };
                 }''')
@@ -866,7 +1538,7 @@ class DynamicCrawler:
 
             # 콘텐츠 선택자 결합
             content_selectors = (
-                self.current_site_config.content_selectors +
+                site_config.content_selectors +
                 detected_selectors['content'] +
                 universal_selectors['content_selectors']
             )
@@ -894,19 +1566,29 @@ class DynamicCrawler:
                 }
             }
     
-    async def filter_relevant_links(self, links: List[Dict[str, Any]], content_focus: Optional[str] = None) -> List[Dict[str, Any]]:
+    async def filter_relevant_links(self, links: List[Dict[str, Any]], content_focus: Optional[str] = None, base_host: Optional[str] = None) -> List[Dict[str, Any]]:
         """향상된 링크 필터링 (품질 기반, 더 관대한 정책)"""
         if not links:
             return []
+        
+        # 여러 사이트를 동시에 처리하므로 호출자가 전달한 호스트를 우선 사용
+        base_host = base_host or self.base_host
 
         print(f"🔗 필터링 전 링크 수: {len(links)}")
 
-        # 현재 사이트 설정 사용
-        site_config = self.current_site_config or site_config_manager.get_config(self.base_host or "")
+        # 링크가 속한 사이트의 설정 사용 (호스트를 모르면 마지막으로 분석한 사이트 설정)
+        if base_host:
+            site_config = site_config_manager.get_config(base_host)
+        else:
+            site_config = self.current_site_config or site_config_manager.get_config("")
 
         filtered_links = []
         included_by_pattern = 0
         excluded_by_pattern = 0
+        
+        # 포함/제외 패턴을 각각 하나의 정규식으로 묶어 링크마다 한 번씩만 검사 (사이트 설정별로 캐싱)
+        included_re = _substring_matcher(tuple(site_config.included_url_patterns))
+        excluded_re = _substring_matcher(tuple(site_config.excluded_url_patterns) + _BASIC_EXCLUDED_URL_PATTERNS)
 
         for i, link_data in enumerate(links):
             href = link_data.get('href', '')
@@ -915,8 +1597,8 @@ class DynamicCrawler:
             
             # URL 절대 경로로 변환
             try:
-                if self.base_host and not href.startswith(('http://', 'https://')):
-                    normalized_href = urllib.parse.urljoin(self.base_host, href)
+                if base_host and not href.startswith(('http://', 'https://')):
+                    normalized_href = absolute_url(base_host, href)
                     href = normalized_href
                     link_data['href'] = href
             except Exception as e:
@@ -924,38 +1606,23 @@ class DynamicCrawler:
                 continue
             
             link_text = link_data.get('text', '')
+            href_lower = href.lower()
             
             # 사이트별 포함 패턴 확인 (우선순위)
-            included = False
-            for pattern in site_config.included_url_patterns:
-                if pattern in href.lower():
-                    filtered_links.append(link_data)
-                    included = True
-                    included_by_pattern += 1
-                    print(f"✅ 포함 패턴 매칭 [{i+1}]: {pattern} in {href[:60]}...")
-                    break
-            
-            if included:
+            match = included_re.search(href_lower) if included_re else None
+            if match:
+                filtered_links.append(link_data)
+                included_by_pattern += 1
+                print(f"✅ 포함 패턴 매칭 [{i+1}]: {match.group()} in {href[:60]}...")
                 continue
                 
             # 제외 패턴 확인 (기본 제외 목록을 더 제한적으로)
             excluded = False
-            basic_excluded_patterns = [
-                '/login', '/register', '/signup', '/subscribe', '/account',
-                '/profile', '/settings', '/privacy', '/terms', '/contact',
-                '/about', '/search', '/feed/', '/rss/', '/xml', '/sitemap',
-                '/wp-admin', '/admin', '/ads/', '/advertisement'
-            ]
-            
-            # 사이트별 제외 패턴 + 기본 제외 패턴
-            all_excluded_patterns = site_config.excluded_url_patterns + basic_excluded_patterns
-            
-            for pattern in all_excluded_patterns:
-                if pattern in href.lower():
-                    excluded = True
-                    excluded_by_pattern += 1
-                    print(f"❌ 제외 패턴 매칭 [{i+1}]: {pattern} in {href[:60]}...")
-                    break
+            match = excluded_re.search(href_lower)
+            if match:
+                excluded = True
+                excluded_by_pattern += 1
+                print(f"❌ 제외 패턴 매칭 [{i+1}]: {match.group()} in {href[:60]}...")
             
             # 추가 휴리스틱 필터링 (더 관대하게)
             if not excluded:
@@ -965,8 +1632,7 @@ class DynamicCrawler:
                     continue
                 
                 # 명백히 콘텐츠가 아닌 링크들 (더 제한적으로)
-                non_content_keywords = ['javascript:', 'mailto:', 'tel:', '#top', '#bottom', 'void(0)']
-                if any(keyword in href.lower() for keyword in non_content_keywords):
+                if _NON_CONTENT_HREF_RE.search(href_lower):
                     print(f"⚠️ 비콘텐츠 링크 [{i+1}]: {href[:60]}... - 제외")
                     continue
                 
@@ -978,39 +1644,32 @@ class DynamicCrawler:
         # 콘텐츠 관련성 필터링 (더 관대하게)
         if content_focus and len(filtered_links) > 10:  # 링크가 많을 때만 적용
             print(f"🎯 콘텐츠 관련성 필터링 적용: '{content_focus}'")
-            relevant_keywords = content_focus.lower().split()
+            # 관심 키워드 전체를 하나의 대소문자 무시 정규식으로 컴파일 (긴 키워드 우선)
+            relevant_keywords = sorted(set(content_focus.lower().split()), key=len, reverse=True)
+            relevant_pattern = re.compile('|'.join(map(re.escape, relevant_keywords)), re.IGNORECASE)
             scored_links = []
             
             for link in filtered_links:
                 score = link.get('quality_score', 0)
-                text = link.get('text', '').lower()
-                href = link.get('href', '').lower()
+                text = link.get('text', '')
+                href = link.get('href', '')
                 
-                # 키워드 매칭 점수 추가
-                for keyword in relevant_keywords:
-                    if keyword in text:
-                        score += 5  # 제목에 키워드
-                    if keyword in href:
-                        score += 2  # URL에 키워드
+                # 키워드 매칭 점수 추가 (제목에 키워드 5점, URL에 키워드 2점, 키워드별 한 번)
+                score += 5 * len({match.lower() for match in relevant_pattern.findall(text)})
+                score += 2 * len({match.lower() for match in relevant_pattern.findall(href)})
                 
                 # 기술/뉴스 관련 키워드 추가 점수
-                tech_keywords = ['ai', 'artificial intelligence', 'tech', 'technology', 
-                               'innovation', 'startup', 'digital', 'software', 'hardware', 
-                               'machine learning', 'deep learning', 'neural', 'llm', 'gpt']
-                for keyword in tech_keywords:
-                    if keyword in text or keyword in href:
-                        score += 1
+                score += len({match.lower() for match in _TECH_KEYWORDS_RE.findall(text)} |
+                             {match.lower() for match in _TECH_KEYWORDS_RE.findall(href)})
                 
                 scored_links.append((link, score))
             
-            # 점수 기준 정렬
-            scored_links.sort(key=lambda x: x[1], reverse=True)
-            final_links = [link for link, _ in scored_links[:25]]  # 상위 25개로 확대
+            # 점수 기준 상위 25개만 선택 (전체 정렬 없이)
+            final_links = [link for link, _ in heapq.nlargest(25, scored_links, key=lambda x: x[1])]
             
         else:
-            # 품질 점수 기준으로 정렬
-            filtered_links.sort(key=lambda x: x.get('quality_score', 0), reverse=True)
-            final_links = filtered_links[:20]  # 상위 20개로 확대
+            # 품질 점수 기준 상위 20개 선택
+            final_links = heapq.nlargest(20, filtered_links, key=lambda x: x.get('quality_score', 0))
         
         print(f"🎯 최종 선택된 링크 수: {len(final_links)}")
         
@@ -1023,283 +1682,54 @@ class DynamicCrawler:
         
         return final_links
     
-    async def extract_content(self, page: Page, structure: Dict[str, Any]) -> Dict[str, Any]:
-        """향상된 콘텐츠 추출"""
+    async def extract_page(self, page: Page, content_selector: Optional[str] = None) -> Dict[str, Any]:
+        """본문 HTML, 메타데이터, 제목을 한 번의 evaluate 호출로 가져옴"""
+        return await page.evaluate(_PAGE_EXTRACT_JS, [content_selector, _CONTENT_REMOVE_SELECTOR])
+    
+    async def extract_content(self, page: Page, structure: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """향상된 콘텐츠 추출 (contentSelector가 없으면 JS에서 본문 선택자를 직접 탐색)"""
         try:
-            content_selector = structure.get('contentSelector')
-            page_url = page.url
-            site_type = structure.get('siteType', {})
-
-            # 더 스마트한 콘텐츠 추출
-            content_data = await page.evaluate(f'''(selector, siteType) => {{
-                let mainElement = null;
-                
-                // 1. 사이트별 맞춤 선택자 시도
-                if (siteType.cms === 'wordpress') {{
-                    const wpSelectors = ['.entry-content', '.post-content', 'article .content'];
-                    for (const sel of wpSelectors) {{
-                        mainElement = document.querySelector(sel);
-                        if (mainElement) break;
-                    }}
-                }} else if (siteType.cms === 'medium') {{
-                    const mediumSelectors = ['article section', '.postArticle-content'];
-                    for (const sel of mediumSelectors) {{
-                        mainElement = document.querySelector(sel);
-                        if (mainElement) break;
-                    }}
-                }}
-                
-                // 2. 제공된 선택자 시도
-                if (!mainElement && selector) {{
-                    const selectors = selector.split(',').map(s => s.trim());
-                    for (const sel of selectors) {{
-                        try {{
-                            mainElement = document.querySelector(sel);
-                            if (mainElement) break;
-                        }} catch (e) {{}}
-                    }}
-                }}
-                
-                // 3. 시맨틱 태그 시도
-                if (!mainElement) {{
-                    const semanticSelectors = ['article', 'main', '[role="main"]', '[role="article"]'];
-                    for (const sel of semanticSelectors) {{
-                        mainElement = document.querySelector(sel);
-                        if (mainElement) break;
-                    }}
-                }}
-                
-                // 4. 텍스트 밀도 기반 자동 감지
-                if (!mainElement) {{
-                    let bestElement = null;
-                    let maxScore = 0;
-                    
-                    const candidates = document.querySelectorAll('div, section, article');
-                    candidates.forEach(el => {{
-                        if (el.offsetHeight === 0) return; // 숨겨진 요소 제외
-                        
-                        const textLength = (el.textContent || '').length;
-                        const linkCount = el.querySelectorAll('a').length;
-                        const imgCount = el.querySelectorAll('img').length;
-                        
-                        // 점수 계산 (텍스트 많음, 링크 적음이 좋음)
-                        let score = textLength;
-                        score -= linkCount * 50; // 링크가 많으면 감점
-                        score += imgCount * 20;  // 이미지는 약간 가점
-                        
-                        // 클래스명으로 가점/감점
-                        const className = el.className.toLowerCase();
-                        if (className.includes('content') || className.includes('article') || className.includes('post')) {{
-                            score += 100;
-                        }}
-                        if (className.includes('sidebar') || className.includes('nav') || className.includes('footer') || className.includes('header')) {{
-                            score -= 200;
-                        }}
-                        
-                        if (score > maxScore && textLength > 200) {{
-                            maxScore = score;
-                            bestElement = el;
-                        }}
-                    }});
-                    
-                    mainElement = bestElement;
-                }}
-                
-                // 5. 최후의 수단
-                if (!mainElement) {{
-                    mainElement = document.body;
-                }}
-                
-                return {{
-                    html: mainElement ? mainElement.innerHTML : '',
-                    text: mainElement ? mainElement.textContent : '',
-                    selector_used: mainElement ? mainElement.tagName + (mainElement.className ? '.' + mainElement.className.split(' ')[0] : '') : 'body'
-                }};
-            }}''', content_selector, site_type)
+            content_data = await self.extract_page(page, (structure or {}).get('contentSelector'))
             
             if not content_data['html']:
-                return {'text': '', 'html': '', 'images': [], 'videos': [], 'date': ''}
-            
-            # BeautifulSoup으로 HTML 파싱 및 정리
-            soup = BeautifulSoup(content_data['html'], 'html.parser')
-            
-            # 불필요한 요소 제거 (확장된 목록)
-            selectors_to_remove = [
-                'script', 'style', 'nav', 'footer', 'header', 'aside',
-                '.sidebar', '.nav', '.footer', '.menu', '.navigation',
-                '.comments', '.comment-section', '.reply-form', '.comment-form',
-                '.related-posts', '.related-articles', '.related-content',
-                '.advertisement', '.ads', '.ad-container', '.ad-banner',
-                '.social-media', '.share-buttons', '.social-share',
-                '.author-bio', '.author-box', '.author-info',
-                '.tags', '.categories', '.meta', '.breadcrumb',
-                '.popup', '.modal', '.overlay', '.newsletter',
-                'form', 'input', 'textarea', 'button', 'select',
-                '[aria-hidden="true"]', '.hidden', '[style*="display:none"]',
-                '.cookie-banner', '.gdpr', '.newsletter-signup'
-            ]
-            
-            for selector in selectors_to_remove:
-                for tag in soup.select(selector):
-                    tag.decompose()
+                return {'text': '', 'html': '', 'images': [], 'videos': [], 'date': '', 'headline': content_data.get('headline', '')}
             
-            # 메타데이터 추출
-            metadata = await self.extract_metadata(page)
+            # BeautifulSoup으로 HTML 파싱 (불필요한 요소는 브라우저에서 이미 제거됨)
+            # bs4는 기사 본문을 추출할 때만 필요하므로 첫 사용 시 임포트
+            from bs4 import BeautifulSoup
+            soup = BeautifulSoup(content_data['html'], HTML_PARSER)
             
-            # 이미지 URL 추출 (개선된 필터링)
-            image_urls = self.extract_media_urls(soup, page_url, 'img')
+            # 메타데이터 (본문과 같은 evaluate 결과에 포함)
+            metadata = content_data.get('metadata') or {'date': ''}
             
-            # 비디오 URL 추출
-            video_urls = self.extract_media_urls(soup, page_url, 'video')
+            # 이미지/비디오 URL (브라우저에서 필터링/중복 제거된 결과)
+            image_urls = content_data.get('imageUrls') or []
+            video_urls = content_data.get('videoUrls') or []
             
-            # 텍스트 정리
-            text_content = soup.get_text(separator='\n').strip()
-            text_content = re.sub(r'\n{3,}', '\n\n', text_content)
-            text_content = re.sub(r'\s{3,}', ' ', text_content)
-            
-            print(f"콘텐츠 추출 완료: {len(text_content)}자, 이미지 {len(image_urls)}개, 비디오 {len(video_urls)}개")
-            
-            return {
-                'text': text_content,
-                'html': str(soup),
-                'images': image_urls,
-                'videos': video_urls,
-                'date': metadata['date'],
-                'metadata': metadata,
-                'selector_used': content_data['selector_used']
-            }
+            # 텍스트 정리 (텍스트 노드별로 공백을 제거하고 빈 노드는 건너뛰어 한 줄씩 연결)
+            text_content = _MULTISPACE_RE.sub(' ', soup.get_text(separator='\n', strip=True))
             
-        except Exception as e:
-            print(f"콘텐츠 추출 오류: {str(e)}")
-            return {'text': '', 'html': '', 'images': [], 'videos': [], 'date': ''}
-    
-    def extract_media_urls(self, soup: BeautifulSoup, page_url: str, media_type: str) -> List[str]:
-        """미디어 URL 추출 (이미지/비디오)"""
-        media_urls = []
-        
-        try:
-            if media_type == 'img':
-                # 이미지 추출
-                for img in soup.select('img[src]'):
-                    src = img.get('src')
-                    if not src:
-                        continue
-                    
-                    # URL 정규화
-                    src = urllib.parse.urljoin(page_url, src)
-                    
-                    # 크기 및 품질 필터링
-                    width = img.get('width')
-                    height = img.get('height')
-                    alt = img.get('alt', '').lower()
-                    class_name = ' '.join(img.get('class', [])).lower()
-                    
-                    # 작은 이미지 제외
-                    try:
-                        if width and int(width) < 150: continue
-                        if height and int(height) < 150: continue
-                    except (ValueError, TypeError):
-                        pass
-                    
-                    # 아이콘, 로고, 프로필 이미지 제외
-                    exclude_keywords = ['icon', 'logo', 'avatar', 'profile', 'badge', 'button', 'emoji']
-                    if any(keyword in alt or keyword in class_name for keyword in exclude_keywords):
-                        continue
-                    
-                    # 데이터 URL 제외
-                    if src.startswith('data:'):
-                        continue
-                    
-                    media_urls.append(src)
-                    
-            elif media_type == 'video':
-                # 비디오 추출
-                # iframe 비디오 (YouTube, Vimeo 등)
-                for iframe in soup.select('iframe[src]'):
-                    src = iframe.get('src')
-                    if not src:
-                        continue
-                    
-                    src = urllib.parse.urljoin(page_url, src)
-                    
-                    # 비디오 서비스 감지
-                    video_domains = ['youtube.com', 'youtu.be', 'vimeo.com', 'dailymotion.com', 
-                                   'player.twitch.tv', 'ted.com', 'wistia.com', 'brightcove.com']
-                    
-                    if any(domain in src.lower() for domain in video_domains):
-                        media_urls.append(src)
-                
-                # video 태그
-                for video in soup.select('video'):
-                    src = video.get('src')
-                    if src:
-                        media_urls.append(urllib.parse.urljoin(page_url, src))
-                    
-                    # source 태그
-                    for source in video.select('source[src]'):
-                        src = source.get('src')
-                        if src:
-                            media_urls.append(urllib.parse.urljoin(page_url, src))
-        
-        except Exception as e:
-            print(f"미디어 URL 추출 오류: {e}")
-        
-        # 중복 제거 및 유효한 URL만 반환
-        return list(set([url for url in media_urls if url and url.startswith('http')]))
-    
-    async def extract_metadata(self, page: Page) -> Dict[str, Any]:
-        """메타데이터 추출"""
-        try:
-            metadata = await page.evaluate(r'''() => {
-                const meta = {};
-                
-                // 날짜 정보 추출
-                let dateStr = '';
-                const dateSelectors = [
-                    'meta[property="article:published_time"]',
-                    'meta[name="date"]',
-                    'meta[name="publish-date"]',
-                    'meta[name="publication-date"]',
-                    'time[datetime]',
-                    'time',
-                    '.date', '.published', '.timestamp',
-                    '.post-date', '.article-date', '.entry-date'
-                ];
-                
-                for (const selector of dateSelectors) {
-                    const el = document.querySelector(selector);
-                    if (el) {
-                        const content = el.getAttribute('content') || 
-                                       el.getAttribute('datetime') || 
-                                       el.textContent;
-                        if (content && content.trim()) {
-                            dateStr = content.trim();
-                            break;
-                        }
-                    }
-                }
-                
-                meta.date = dateStr;
-                
-                // 기타 메타데이터
-                const ogTitle = document.querySelector('meta[property="og:title"]');
-                meta.og_title = ogTitle ? ogTitle.content : '';
-                
-                const ogDescription = document.querySelector('meta[property="og:description"]');
-                meta.og_description = ogDescription ? ogDescription.content : '';
-                
-                const author = document.querySelector('meta[name="author"]') || 
-                              document.querySelector('meta[property="article:author"]');
-                meta.author = author ? author.content : '';
-                
-                const keywords = document.querySelector('meta[name="keywords"]');
-                meta.keywords = keywords ? keywords.content : '';
-                
-                return meta;
-            }''')
+            print(f"콘텐츠 추출 완료: {len(text_content)}자, 이미지 {len(image_urls)}개, 비디오 {len(video_urls)}개")
             
-            return metadata
+            return {
+                'text': text_content,
+                'html': str(soup),
+                'images': image_urls,
+                'videos': video_urls,
+                'date': metadata.get('date', ''),
+                'metadata': metadata,
+                'headline': content_data.get('headline', ''),
+                'selector_used': content_data['selector_used']
+            }
             
+        except Exception as e:
+            print(f"콘텐츠 추출 오류: {str(e)}")
+            return {'text': '', 'html': '', 'images': [], 'videos': [], 'date': ''}
+    
+    async def extract_metadata(self, page: Page) -> Dict[str, Any]:
+        """메타데이터 추출"""
+        try:
+            return (await self.extract_page(page)).get('metadata') or {'date': ''}
         except Exception as e:
             print(f"메타데이터 추출 오류: {e}")
             return {'date': ''}
@@ -1307,68 +1737,7 @@ class DynamicCrawler:
     async def extract_headline(self, page: Page) -> str:
         """향상된 제목 추출"""
         try:
-            headline = await page.evaluate(r'''() => {
-                // 우선순위: og:title > h1 > title
-                const ogTitle = document.querySelector('meta[property="og:title"]');
-                if (ogTitle && ogTitle.content && ogTitle.content.trim().length > 5) {
-                    return ogTitle.content.trim();
-                }
-                
-                const twitterTitle = document.querySelector('meta[name="twitter:title"]');
-                if (twitterTitle && twitterTitle.content && twitterTitle.content.trim().length > 5) {
-                    return twitterTitle.content.trim();
-                }
-
-                // 메인 콘텐츠 영역에서 h1 찾기
-                const contentAreas = ['article', 'main', '.content', '.post', '.entry'];
-                for (const area of contentAreas) {
-                    const container = document.querySelector(area);
-                    if (container) {
-                        const h1 = container.querySelector('h1');
-                        if (h1 && h1.textContent && h1.textContent.trim().length > 5) {
-                            return h1.textContent.trim();
-                        }
-                    }
-                }
-                
-                // 일반 h1
-                const h1 = document.querySelector('h1');
-                if (h1 && h1.textContent) {
-                    const h1Text = h1.textContent.trim();
-                    if (h1Text.length > 5 && h1Text.length < 200) {
-                        return h1Text;
-                    }
-                }
-                
-                // title 태그에서 사이트명 제거
-                const titleTag = document.querySelector('title');
-                if (titleTag && titleTag.textContent) {
-                    let titleText = titleTag.textContent.trim();
-                    
-                    // 일반적인 구분자로 분리
-                    const separators = ['|', '-', '–', '—', ':', '»', '«'];
-                    for (const sep of separators) {
-                        if (titleText.includes(sep)) {
-                            const parts = titleText.split(sep).map(p => p.trim());
-                            // 가장 긴 부분을 제목으로 선택
-                            parts.sort((a, b) => b.length - a.length);
-                            if (parts[0] && parts[0].length > 5) {
-                                titleText = parts[0];
-                                break;
-                            }
-                        }
-                    }
-                    
-                    if (titleText.length > 5 && titleText.length < 200) {
-                        return titleText;
-                    }
-                }
-                
-                return '';
-            }''')
-            
-            return headline
-            
+            return (await self.extract_page(page)).get('headline', '')
         except Exception as e:
             print(f"제목 추출 오류: {str(e)}")
             return ""
@@ -1376,174 +1745,211 @@ class DynamicCrawler:
     async def crawl_url(self, url: str, content_focus: Optional[str] = None, max_links: int = 1, timeframe_hours_for_filter: int = 48) -> CrawlResult:
         """메인 크롤링 메서드 (개선됨)"""
         result = CrawlResult(url)
-        page = None
         
         try:
-            page = await self.context.new_page()
-            print(f"\n{'='*60}")
-            print(f"크롤링 시작: {url}")
-            print(f"설정 - 최대 링크: {max_links}, 시간 범위: {timeframe_hours_for_filter}시간")
-            print(f"{'='*60}")
-            
-            # 페이지 로드 (더 관대한 오류 처리)
-            try:
-                await page.goto(url, wait_until='domcontentloaded', timeout=90000)
-                print("✅ 페이지 로드 성공")
-            except Exception as nav_error:
-                print(f"⚠️ 초기 로드 실패, 재시도: {nav_error}")
+            # 목록 페이지는 링크 처리 전에 풀에 반환 (기사 페이지가 같은 풀을 사용)
+            async with self._page_cm() as page:
+                print(f"\n{'='*60}")
+                print(f"크롤링 시작: {url}")
+                print(f"설정 - 최대 링크: {max_links}, 시간 범위: {timeframe_hours_for_filter}시간")
+                print(f"{'='*60}")
+            
+                # 페이지 로드 (더 관대한 오류 처리)
                 try:
-                    await page.goto(url, wait_until='load', timeout=60000)
-                    print("✅ 재시도 로드 성공")
-                except Exception as final_error:
-                    print(f"❌ 페이지 로드 최종 실패: {final_error}")
-                    result.error = f"Navigation error: {final_error}"
-                    return result
-            
-            # 초기 렌더링 대기
-            await page.wait_for_timeout(3000)
-            
-            # 팝업 및 오버레이 처리
-            await self.handle_popups_and_overlays(page)
+                    await page.goto(url, wait_until='domcontentloaded', timeout=30000)
+                    print("✅ 페이지 로드 성공")
+                except Exception as nav_error:
+                    print(f"⚠️ 초기 로드 실패, 재시도: {nav_error}")
+                    try:
+                        await page.goto(url, wait_until='load', timeout=60000)
+                        print("✅ 재시도 로드 성공")
+                    except Exception as final_error:
+                        print(f"❌ 페이지 로드 최종 실패: {final_error}")
+                        result.error = f"Navigation error: {final_error}"
+                        return result
+            
+                # 초기 렌더링 대기 (본문 요소 기준)
+                await self._wait_for_content(page)
+            
+                # 팝업 및 오버레이 처리
+                await self.handle_popups_and_overlays(page)
+            
+                # URL 정규화 (동시 크롤링 중 공유 상태를 쓰지 않도록 지역 변수로 유지)
+                parsed_url = urllib.parse.urlparse(url)
+                base_host = f"{parsed_url.scheme}://{parsed_url.netloc}"
+                print(f"Base host 설정: {base_host}")
+
+                # 페이지 구조 분석
+                print("🔍 페이지 구조 분석 중...")
+                structure = await self.analyze_page_structure(page, url)
             
-            # 추가 대기 (동적 콘텐츠 로딩)
-            await page.wait_for_timeout(2000)
+                if not structure['links']:
+                    print("⚠️ 경고: 페이지에서 링크를 찾지 못했습니다.")
+                    result.error = "No links found on the page"
+                    return result
+
+                # 사이트 정보 저장
+                result.site_info = structure['structure'].get('siteType', {})
+
+                # 링크 필터링
+                print("🔗 링크 필터링 중...")
+                links = await self.filter_relevant_links(structure['links'], content_focus, base_host)
             
-            # URL 정규화
-            parsed_url = urllib.parse.urlparse(url)
-            self.base_host = f"{parsed_url.scheme}://{parsed_url.netloc}"
-            print(f"Base host 설정: {self.base_host}")
-
-            # 페이지 구조 분석
-            print("🔍 페이지 구조 분석 중...")
-            structure = await self.analyze_page_structure(page, url)
-            
-            if not structure['links']:
-                print("⚠️ 경고: 페이지에서 링크를 찾지 못했습니다.")
-                result.error = "No links found on the page"
-                return result
-
-            # 사이트 정보 저장
-            result.site_info = structure['structure'].get('siteType', {})
-
-            # 링크 필터링
-            print("🔗 링크 필터링 중...")
-            links = await self.filter_relevant_links(structure['links'], content_focus)
-            
-            if not links:
-                print("⚠️ 경고: 관련 링크를 찾지 못했습니다.")
-                result.error = "No relevant links found after filtering"
-                return result
-
-            # 처리할 링크 선택
-            actual_max_links = min(len(links), max_links)
-            links_to_crawl = links[:actual_max_links]
-            
-            print(f"\n📄 처리할 링크 {len(links_to_crawl)}개:")
-            for i, link in enumerate(links_to_crawl, 1):
-                print(f"  {i}. [{link.get('quality_score', 0)}점] {link.get('text', 'No title')[:60]}...")
-                print(f"     📍 {link.get('href', 'No URL')}")
-
-            # 각 링크 처리
-            for i, link_info in enumerate(links_to_crawl, 1):
-                link_url = link_info.get('href')
-                if not link_url:
-                    print(f"⚠️ 링크 {i}: URL 없음, 건너뜀")
-                    continue
+                if not links:
+                    print("⚠️ 경고: 관련 링크를 찾지 못했습니다.")
+                    result.error = "No relevant links found after filtering"
+                    return result
 
-                print(f"\n🔄 [{i}/{len(links_to_crawl)}] 링크 처리 중...")
-                print(f"📍 URL: {link_url}")
-                
-                link_page = None
-                try:
-                    link_page = await self.context.new_page()
-                    
-                    # 상대 경로를 절대 경로로 변환
-                    if not link_url.startswith(('http://', 'https://')):
-                        link_url = urllib.parse.urljoin(self.base_host, link_url)
-                        print(f"🔗 URL 정규화: {link_url}")
-                    
-                    # 링크 페이지 로드
-                    try:
-                        await link_page.goto(link_url, wait_until='domcontentloaded', timeout=60000)
-                        await link_page.wait_for_timeout(2000)
-                    except Exception as e:
-                        print(f"❌ 링크 페이지 로드 실패: {e}")
-                        continue
-
-                    # 팝업 처리
-                    await self.handle_popups_and_overlays(link_page)
-                    
-                    # 콘텐츠 분석 및 추출
-                    print("📄 콘텐츠 분석 중...")
-                    link_structure = await self.analyze_page_structure(link_page, link_url)
-                    content = await self.extract_content(link_page, link_structure['structure'])
-                    headline = await self.extract_headline(link_page)
-                    
-                    # 날짜 정보 확인
-                    date_str = link_info.get('date', '') or content.get('date', '')
-                    
-                    # 날짜 관련성 확인
-                    if date_str:
-                        date_is_relevant = is_relevant_date(date_str, self.target_date, timeframe_hours_for_filter)
-                        if not date_is_relevant:
-                            print(f"⏰ 날짜 필터링: '{headline[:50]}...' ({date_str}) - {timeframe_hours_for_filter}시간 초과")
-                            continue
-                    
-                    # 콘텐츠 품질 확인 (더 관대한 기준)
-                    content_length = len(content.get('text', ''))
-                    has_headline = bool(headline and headline.strip())
-                    
-                    if not has_headline and content_length < 100:  # 기준을 200자에서 100자로 낮춤
-                        print(f"⚠️ 콘텐츠 품질 부족: 제목 없음, 본문 {content_length}자")
-                        print(f"   링크: {link_url}")
-                        continue
-                    
-                    # 제목이 있거나 본문이 충분하면 포함
-                    if not has_headline:
-                        print(f"⚠️ 제목 없지만 본문 충분({content_length}자) - 포함")
-                    
-                    if content_length < 100:
-                        print(f"⚠️ 본문 짧지만({content_length}자) 제목 있음 - 포함")
+                # 처리할 링크 선택
+                actual_max_links = min(len(links), max_links)
+                links_to_crawl = links[:actual_max_links]
+            
+                print(f"\n📄 처리할 링크 {len(links_to_crawl)}개:")
+                for i, link in enumerate(links_to_crawl, 1):
+                    print(f"  {i}. [{link.get('quality_score', 0)}점] {link.get('text', 'No title')[:60]}...")
+                    print(f"     📍 {link.get('href', 'No URL')}")
 
-                    # Story 객체 생성
-                    story = Story()
-                    story.headline = headline or link_info.get('text', '제목 없음')
-                    story.link = link_url
-                    story.date_posted = parse_date(date_str) if date_str else ''
-                    story.fullContent = content.get('text', '')
-                    story.imageUrls = content.get('images', [])
-                    story.videoUrls = content.get('videos', [])
-                    story.source = self._extract_domain_name(url)  # 소스 사이트 정보 추가
-                    
-                    # 추가 메타데이터
-                    metadata = content.get('metadata', {})
-                    if metadata.get('keywords'):
-                        story.tags = [tag.strip() for tag in metadata['keywords'].split(',') if tag.strip()]
-                    
+            # 각 링크를 동시에 처리 (페이지 풀 크기로 동시 페이지 수 제한, 결과는 링크 순서 유지)
+            stories = await asyncio.gather(*[
+                self._crawl_link(link_info, i, len(links_to_crawl), url, base_host, timeframe_hours_for_filter)
+                for i, link_info in enumerate(links_to_crawl, 1)
+            ], return_exceptions=True)
+            
+            for story in stories:
+                if isinstance(story, Exception):
+                    print(f"❌ 링크 처리 오류: {str(story)}")
+                elif story:
                     result.stories.append(story)
-                    print(f"✅ 콘텐츠 추출 성공: '{story.headline[:50]}...' (출처: {story.source})")
-                    
-                except Exception as e:
-                    print(f"❌ 링크 처리 오류: {str(e)}")
-                finally:
-                    if link_page and not link_page.is_closed():
-                        await link_page.close()
-                    
-                    # 요청 간 대기 (서버 부하 방지)
-                    if i < len(links_to_crawl):
-                        await asyncio.sleep(2)
             
             print(f"\n🎉 크롤링 완료: {len(result.stories)}개 기사 수집")
             
         except Exception as e:
             result.error = str(e)
             print(f"❌ 크롤링 오류: {str(e)}")
-        finally:
-            if page and not page.is_closed():
-                await page.close()
         
         return result
     
+    async def _load_article_content(self, link_url: str) -> Optional[Dict[str, Any]]:
+        """풀 페이지로 기사 페이지를 열어 콘텐츠 추출"""
+        async with self._page_cm() as link_page:
+            # 링크 페이지 로드 (DOMContentLoaded까지만 대기)
+            try:
+                await link_page.goto(link_url, wait_until='domcontentloaded', timeout=30000)
+            except Exception as e:
+                print(f"❌ 링크 페이지 로드 실패: {e}")
+                return None
+            await self._wait_for_content(link_page)
+
+            # 팝업 처리
+            await self.handle_popups_and_overlays(link_page)
+            
+            # 콘텐츠 분석 및 추출 (기사 페이지에서는 링크 목록이 필요 없으므로 구조 분석 생략)
+            print("📄 콘텐츠 분석 중...")
+            return await self.extract_content(link_page)
+    
+    async def _get_article_content(self, link_url: str) -> Optional[Dict[str, Any]]:
+        """정규화된 URL 기준으로 기사 콘텐츠를 캐싱 (동시에 들어온 같은 URL 요청은 하나로 합침)"""
+        key = canonicalize_url(link_url)
+        if key in self._page_cache:
+            print(f"♻️ 이미 처리한 URL 재사용: {key}")
+            return self._page_cache[key]
+        
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            print(f"♻️ 처리 중인 URL 결과 대기: {key}")
+            return await inflight
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            content = None
+            if self.article_cache_hours > 0:
+                content = load_cached_article(key, self.article_cache_hours * 3600)
+                if content is not None:
+                    print(f"♻️ 디스크 캐시의 기사 재사용 (페이지 로드 생략): {key}")
+            if content is None:
+                content = await self._load_article_content(link_url)
+                if content and content.get('text') and self.article_cache_hours > 0:
+                    save_cached_article(key, content)
+            self._page_cache[key] = content
+            future.set_result(content)
+            return content
+        finally:
+            if not future.done():
+                # 실패한 경우 대기 중인 요청은 결과 없음으로 처리
+                future.set_result(None)
+            del self._inflight[key]
+    
+    async def _crawl_link(self, link_info: Dict[str, Any], index: int, total: int, source_url: str, base_host: str, timeframe_hours_for_filter: int = 48) -> Optional[Story]:
+        """목록 페이지에서 찾은 링크 하나를 크롤링하여 Story 생성"""
+        link_url = link_info.get('href')
+        if not link_url:
+            print(f"⚠️ 링크 {index}: URL 없음, 건너뜀")
+            return None
+
+        print(f"\n🔄 [{index}/{total}] 링크 처리 중...")
+        print(f"📍 URL: {link_url}")
+        
+        try:
+            # 상대 경로를 절대 경로로 변환
+            if not link_url.startswith(('http://', 'https://')):
+                link_url = absolute_url(base_host, link_url)
+                print(f"🔗 URL 정규화: {link_url}")
+            
+            # 콘텐츠 추출 (같은 실행에서 이미 방문한 URL은 재사용)
+            content = await self._get_article_content(link_url)
+            if content is None:
+                return None
+            headline = content.get('headline', '')
+            
+            # 날짜 정보 확인
+            date_str = link_info.get('date', '') or content.get('date', '')
+            
+            # 날짜 관련성 확인
+            if date_str:
+                date_is_relevant = is_relevant_date(date_str, self.target_date, timeframe_hours_for_filter)
+                if not date_is_relevant:
+                    print(f"⏰ 날짜 필터링: '{headline[:50]}...' ({date_str}) - {timeframe_hours_for_filter}시간 초과")
+                    return None
+            
+            # 콘텐츠 품질 확인 (더 관대한 기준)
+            content_length = len(content.get('text', ''))
+            has_headline = bool(headline and headline.strip())
+            
+            if not has_headline and content_length < 100:  # 기준을 200자에서 100자로 낮춤
+                print(f"⚠️ 콘텐츠 품질 부족: 제목 없음, 본문 {content_length}자")
+                print(f"   링크: {link_url}")
+                return None
+            
+            # 제목이 있거나 본문이 충분하면 포함
+            if not has_headline:
+                print(f"⚠️ 제목 없지만 본문 충분({content_length}자) - 포함")
+            
+            if content_length < 100:
+                print(f"⚠️ 본문 짧지만({content_length}자) 제목 있음 - 포함")
+
+            # Story 객체 생성
+            story = Story()
+            story.headline = headline or link_info.get('text', '제목 없음')
+            story.link = link_url
+            story.date_posted = parse_date(date_str) if date_str else ''
+            story.fullContent = content.get('text', '')
+            story.imageUrls = content.get('images', [])
+            story.videoUrls = content.get('videos', [])
+            story.source = self._extract_domain_name(source_url)  # 소스 사이트 정보 추가
+            
+            # 추가 메타데이터
+            metadata = content.get('metadata', {})
+            if metadata.get('keywords'):
+                story.tags = [tag.strip() for tag in metadata['keywords'].split(',') if tag.strip()]
+            
+            print(f"✅ 콘텐츠 추출 성공: '{story.headline[:50]}...' (출처: {story.source})")
+            return story
+            
+        except Exception as e:
+            print(f"❌ 링크 처리 오류: {str(e)}")
+            return None
+    
     async def crawl_url_targeted(self, url: str, content_focus: Optional[str] = None, max_links: int = 1, timeframe_hours_for_filter: int = 48) -> CrawlResult:
         """사이트별 특화된 크롤링 메서드"""
         result = CrawlResult(url)
@@ -1589,7 +1995,7 @@ class DynamicCrawler:
             print("📖 Simon Willison 블로그 크롤링 시작")
             
             await page.goto(url, wait_until='domcontentloaded', timeout=60000)
-            await page.wait_for_timeout(2000)
+            await self._wait_for_content(page, 'article h2 a, h2 a[href*="/20"], .entry-title a')
             
             # 최신 블로그 포스트 직접 찾기
             blog_posts = await page.evaluate(r'''() => {
@@ -1624,59 +2030,12 @@ class DynamicCrawler:
             
             print(f"🔍 발견된 포스트: {len(blog_posts)}개")
             
-            for i, post in enumerate(blog_posts[:max_links]):
-                try:
-                    print(f"📄 포스트 {i+1}: {post['title'][:50]}...")
-                    
-                    # 개별 포스트 페이지 방문
-                    post_page = await self.context.new_page()
-                    await post_page.goto(post['url'], wait_until='domcontentloaded', timeout=45000)
-                    await post_page.wait_for_timeout(1500)
-                    
-                    # 포스트 내용 추출
-                    content_data = await post_page.evaluate(r'''() => {
-                        const article = document.querySelector('article') || 
-                                       document.querySelector('.entry-content') ||
-                                       document.querySelector('#content');
-                        
-                        if (!article) return { text: '', date: '', title: '' };
-                        
-                        const title = document.querySelector('h1')?.textContent?.trim() ||
-                                     document.title.split('|')[0].trim();
-                        
-                        const dateEl = document.querySelector('time') ||
-                                      document.querySelector('.published') ||
-                                      document.querySelector('abbr.published');
-                        
-                        const date = dateEl ? (dateEl.getAttribute('datetime') || dateEl.textContent) : '';
-                        
-                        return {
-                            text: article.textContent.trim(),
-                            html: article.innerHTML,
-                            title: title,
-                            date: date
-                        };
-                    }''');
-                    
-                    if content_data['text'] and len(content_data['text']) > 100:
-                        story = Story()
-                        story.headline = content_data['title'] or post['title']
-                        story.link = post['url']
-                        story.date_posted = parse_date(content_data['date']) if content_data['date'] else ''
-                        story.fullContent = content_data['text']
-                        story.imageUrls = []
-                        story.videoUrls = []
-                        story.source = "simonwillison.net"
-                        
-                        result.stories.append(story)
-                        print(f"✅ 포스트 수집 성공: '{story.headline[:50]}...' (출처: {story.source})")
-                    
-                    await post_page.close()
-                    
-                except Exception as e:
-                    print(f"❌ 포스트 처리 오류: {e}")
-                    if 'post_page' in locals():
-                        await post_page.close()
+            # 개별 포스트 페이지를 동시에 처리 (페이지 풀 크기로 제한, 결과는 포스트 순서 유지)
+            posts = await asyncio.gather(*[
+                self._crawl_simon_willison_post(post, i)
+                for i, post in enumerate(blog_posts[:max_links])
+            ])
+            result.stories.extend(story for story in posts if story)
             
             await page.close()
             print(f"🎉 Simon Willison 크롤링 완료: {len(result.stories)}개 포스트")
@@ -1689,6 +2048,60 @@ class DynamicCrawler:
         
         return result
     
+    async def _crawl_simon_willison_post(self, post: Dict[str, Any], index: int) -> Optional[Story]:
+        """Simon Willison 개별 포스트 페이지 크롤링"""
+        print(f"📄 포스트 {index+1}: {post['title'][:50]}...")
+        
+        # 풀 페이지 사용 (동시에 열리는 페이지 수는 풀 크기로 제한)
+        async with self._page_cm() as post_page:
+            try:
+                # 개별 포스트 페이지 방문
+                await post_page.goto(post['url'], wait_until='domcontentloaded', timeout=45000)
+                await self._wait_for_content(post_page)
+                
+                # 포스트 내용 추출
+                content_data = await post_page.evaluate(r'''() => {
+                    const article = document.querySelector('article') || 
+                                   document.querySelector('.entry-content') ||
+                                   document.querySelector('#content');
+                    
+                    if (!article) return { text: '', date: '', title: '' };
+                    
+                    const title = document.querySelector('h1')?.textContent?.trim() ||
+                                 document.title.split('|')[0].trim();
+                    
+                    const dateEl = document.querySelector('time') ||
+                                  document.querySelector('.published') ||
+                                  document.querySelector('abbr.published');
+                    
+                    const date = dateEl ? (dateEl.getAttribute('datetime') || dateEl.textContent) : '';
+                    
+                    return {
+                        text: article.textContent.trim(),
+                        html: article.innerHTML,
+                        title: title,
+                        date: date
+                    };
+                }''');
+                
+                if content_data['text'] and len(content_data['text']) > 100:
+                    story = Story()
+                    story.headline = content_data['title'] or post['title']
+                    story.link = post['url']
+                    story.date_posted = parse_date(content_data['date']) if content_data['date'] else ''
+                    story.fullContent = content_data['text']
+                    story.imageUrls = []
+                    story.videoUrls = []
+                    story.source = "simonwillison.net"
+                    
+                    print(f"✅ 포스트 수집 성공: '{story.headline[:50]}...' (출처: {story.source})")
+                    return story
+                
+            except Exception as e:
+                print(f"❌ 포스트 처리 오류: {e}")
+        
+        return None
+    
     async def _crawl_hacker_news(self, url: str, max_links: int = 1) -> CrawlResult:
         """Hacker News 특화 크롤링 (시간 정보 추출 개선)"""
         result = CrawlResult(url)
@@ -1699,7 +2112,7 @@ class DynamicCrawler:
             print("📰 Hacker News 크롤링 시작")
             
             await page.goto(url, wait_until='domcontentloaded', timeout=60000)
-            await page.wait_for_timeout(2000)
+            await self._wait_for_content(page, '.athing')
             
             # HN 메인 페이지에서 최신 기사들 찾기 (시간 정보 포함)
             stories = await page.evaluate('''() => {
@@ -1784,8 +2197,7 @@ class DynamicCrawler:
                             is_recent = True
                         elif 'day' in age_text:
                             # 일 단위인 경우 숫자 확인
-                            import re
-                            day_match = re.search(r'(\d+)\s*day', age_text)
+                            day_match = _DAYS_AGO_RE.search(age_text)
                             if day_match and int(day_match.group(1)) <= 2:  # 2일 이내
                                 is_recent = True
                         
@@ -1797,7 +2209,7 @@ class DynamicCrawler:
                     if hn_story['url'].startswith('http') and 'news.ycombinator.com' not in hn_story['url']:
                         story_page = await self.context.new_page()
                         await story_page.goto(hn_story['url'], wait_until='domcontentloaded', timeout=45000)
-                        await story_page.wait_for_timeout(2000)
+                        await self._wait_for_content(story_page)
                         
                         # 외부 사이트 내용 추출
                         content_data = await story_page.evaluate('''() => {
@@ -1877,7 +2289,7 @@ class DynamicCrawler:
             print("🧠 DeepMind 블로그 크롤링 시작")
             
             await page.goto(url, wait_until='domcontentloaded', timeout=60000)
-            await page.wait_for_timeout(5000)  # 동적 로딩 대기
+            await self._wait_for_content(page, 'a[href*="/discover/blog/"]', timeout=10000)  # 동적 로딩 대기
             
             # 페이지에서 모든 링크를 수집하고 최신순으로 정렬
             blog_posts = await page.evaluate('''() => {
@@ -1988,7 +2400,7 @@ class DynamicCrawler:
                     
                     post_page = await self.context.new_page()
                     await post_page.goto(post['url'], wait_until='domcontentloaded', timeout=45000)
-                    await post_page.wait_for_timeout(2000)
+                    await self._wait_for_content(post_page)
                     
                     # 포스트 내용 및 날짜 추출
                     content_data = await post_page.evaluate('''() => {
@@ -2099,7 +2511,7 @@ class DynamicCrawler:
             print("📺 Mindstream News 크롤링 시작")
             
             await page.goto(url, wait_until='domcontentloaded', timeout=60000)
-            await page.wait_for_timeout(3000)  # 페이지 로딩 대기
+            await self._wait_for_content(page, 'a[href*="/p/"]')  # 페이지 로딩 대기
             
             # 쿠키 팝업 처리
             await self.handle_popups_and_overlays(page)
@@ -2256,7 +2668,7 @@ class DynamicCrawler:
                     
                     try:
                         await article_page.goto(article['url'], wait_until='domcontentloaded', timeout=45000)
-                        await article_page.wait_for_timeout(3000)
+                        await self._wait_for_content(article_page)
                         
                         # 쿠키 팝업 처리
                         await self.handle_popups_and_overlays(article_page)
@@ -2560,7 +2972,7 @@ class DynamicCrawler:
             print("🤖 AIChief Featured 뉴스 크롤링 시작")
             
             await page.goto(url, wait_until='domcontentloaded', timeout=60000)
-            await page.wait_for_timeout(3000)  # 페이지 로딩 대기
+            await self._wait_for_content(page, 'article a, h2 a, h3 a')  # 페이지 로딩 대기
             
             # AIChief Featured 뉴스 찾기 (최신 우선)
             featured_news = await page.evaluate(r'''() => {
@@ -2587,6 +2999,18 @@ class DynamicCrawler:
                 
                 const processedHrefs = new Set();
                 
+                // Featured 여부는 HTML을 직렬화하지 않고 DOM으로 확인
+                // 1) featured 클래스/ID를 가진 영역 안의 링크, 2) 링크가 속한 카드에 "Featured" 라벨이 있는 링크
+                const isFeaturedLink = (link) => {
+                    if (link.closest('[class*="featured" i], [id*="featured" i]')) return true;
+                    const card = link.closest('article, li, div');
+                    if (!card) return false;
+                    for (const label of card.querySelectorAll('span')) {
+                        if ((label.textContent || '').trim().toLowerCase() === 'featured') return true;
+                    }
+                    return false;
+                };
+                
                 for (const selector of featuredSelectors) {
                     try {
                         const links = document.querySelectorAll(selector);
@@ -2607,20 +3031,8 @@ class DynamicCrawler:
                                 
                                 processedHrefs.add(href);
                                 
-                                // Featured 여부 확인 (더 정교하게)
-                                let isFeatured = false;
-                                let featuredContainer = link.closest('div, article, section');
-                                while (featuredContainer && !isFeatured) {
-                                    const containerHtml = featuredContainer.outerHTML.toLowerCase();
-                                    const containerText = featuredContainer.textContent.toLowerCase();
-                                    
-                                    if (containerHtml.includes('featured') || 
-                                        containerText.includes('featured') ||
-                                        featuredContainer.querySelector('span:contains("Featured")')) {
-                                        isFeatured = true;
-                                    }
-                                    featuredContainer = featuredContainer.parentElement;
-                                }
+                                // Featured 여부 확인
+                                const isFeatured = isFeaturedLink(link);
                                 
                                 // 날짜 추출 (AIChief 특화)
                                 let dateStr = '';
@@ -2715,7 +3127,7 @@ class DynamicCrawler:
                     
                     news_page = await self.context.new_page()
                     await news_page.goto(news['url'], wait_until='domcontentloaded', timeout=45000)
-                    await news_page.wait_for_timeout(2000)
+                    await self._wait_for_content(news_page)
                     
                     # AIChief 뉴스 내용 추출
                     content_data = await news_page.evaluate(r'''() => {
@@ -2808,6 +3220,136 @@ class DynamicCrawler:
         
         return result
 
+# 소스 목록 한 번 크롤링 (초기화된 크롤러를 받아 재사용)
+# URL이 없는 소스는 건너뛰므로 결과는 (소스 설정, 결과) 쌍으로 반환
+async def run_once(crawler: DynamicCrawler, sources_config_list: List[Dict[str, Any]], content_focus: Optional[str] = None, timeframe_hours: int = 48,
+                   on_result: Optional[Callable[[CrawlResult], None]] = None) -> List[Tuple[Dict[str, Any], CrawlResult]]:
+    source_semaphore = asyncio.Semaphore(max(1, crawler.max_concurrency))
+    
+    # 사이트 하나 처리 (세마포어로 동시 처리 사이트 수 제한)
+    async def process_source(i: int, source_config_item: Dict[str, Any]) -> Optional[CrawlResult]:
+        url = source_config_item.get("identifier") or source_config_item.get("url")
+        max_links_for_source = source_config_item.get("max_items", source_config_item.get("maxItems", 1))
+        
+        if not url:
+            print(f"⚠️ 사이트 {i}: URL 누락, 건너뜀 - {source_config_item}")
+            return None
+
+        async with source_semaphore:
+            print(f"""
+📍 사이트 {i}/{len(sources_config_list)} 처리 중
+   • URL: {url}
+   • 최대 링크: {max_links_for_source}개
+   • 시간 범위: {timeframe_hours}시간
+""")
+            
+            try:
+                result_obj = await crawler.crawl_url_targeted(
+                    url=url,
+                    content_focus=content_focus,
+                    max_links=max_links_for_source,
+                    timeframe_hours_for_filter=timeframe_hours 
+                )
+                
+                # 결과 요약
+                stories_count = len(result_obj.stories)
+                if stories_count > 0:
+                    print(f"✅ 사이트 {i} 완료: {stories_count}개 기사 수집")
+                    
+                    # 수집된 기사 간단 요약 (소스 정보 포함)
+                    for j, story in enumerate(result_obj.stories, 1):
+                        print(f"   {j}. {story.headline[:50]}... (출처: {story.source})")
+                else:
+                    print(f"⚠️ 사이트 {i} 완료: 수집된 기사 없음")
+                    if result_obj.error:
+                        print(f"   오류: {result_obj.error}")
+                
+            except Exception as e:
+                print(f"❌ 사이트 {i} 처리 실패: {str(e)}")
+                # 실패한 경우에도 빈 결과 추가
+                result_obj = CrawlResult(url)
+            
+            # 사이트 결과를 완료되는 즉시 전달 (전체 완료를 기다리지 않고 파일에 기록)
+            if on_result is not None:
+                on_result(result_obj)
+            return result_obj
+    
+    # 각 사이트 동시 처리 (결과는 설정 순서 유지)
+    source_results = await asyncio.gather(*[
+        process_source(i, source_config_item)
+        for i, source_config_item in enumerate(sources_config_list, 1)
+    ])
+    return [
+        (source_config_item, result)
+        for source_config_item, result in zip(sources_config_list, source_results)
+        if result is not None
+    ]
+
+# 워커 모드: stdin의 JSONL 작업을 순서대로 처리 (브라우저를 작업 간에 재사용)
+# 작업 예시: {"sources_config": [{"identifier": "URL", "maxItems": 3}], "output": "crawl_results.json"}
+async def serve(args: argparse.Namespace) -> None:
+    # 진행 로그는 stderr로 보내고 stdout에는 작업당 한 줄의 JSON 응답만 출력
+    protocol_out = sys.stdout
+    with redirect_stdout(sys.stderr):
+        crawler = DynamicCrawler(
+            llm_provider=args.llm_provider,
+            headless=args.headless and not args.show_browser,
+            target_date=args.target_date,
+            max_concurrency=args.max_concurrency,
+            user_data_dir=args.user_data_dir,
+            article_cache_hours=args.article_cache_hours,
+            storage_state_path=args.storage_state
+        )
+        await crawler.initialize()
+        print("✅ 크롤러 워커 준비 완료")
+    
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            line = await loop.run_in_executor(None, sys.stdin.readline)
+            if not line:
+                break
+            line = line.strip()
+            if not line:
+                continue
+            
+            start_time = time.time()
+            try:
+                job = json.loads(line)
+                sources_config_list = job.get("sources_config", [])
+                if isinstance(sources_config_list, str):
+                    sources_config_list = json.loads(sources_config_list)
+                if not isinstance(sources_config_list, list):
+                    sources_config_list = [sources_config_list]
+                output_path = job.get("output", args.output)
+                
+                crawler.target_date = job.get("target_date", args.target_date)
+                crawler.reset_run_cache()
+                with redirect_stdout(sys.stderr), ResultWriter(output_path) as writer:
+                    source_results = await run_once(
+                        crawler,
+                        sources_config_list,
+                        job.get("content_focus", args.content_focus),
+                        job.get("timeframe_hours", args.timeframe_hours),
+                        on_result=writer.write
+                    )
+                if writer.error is not None:
+                    raise writer.error
+                response = {
+                    "output": output_path,
+                    "sites": len(source_results),
+                    "stories": sum(len(result.stories) for _, result in source_results),
+                    "duration": round(time.time() - start_time, 1)
+                }
+            except Exception as e:
+                response = {"error": str(e)}
+            
+            protocol_out.write(json.dumps(response, ensure_ascii=False) + "\n")
+            protocol_out.flush()
+    finally:
+        with redirect_stdout(sys.stderr):
+            await crawler.close()
+
 async def main():
     """향상된 메인 함수 - 더 나은 에러 처리와 진행 상황 표시"""
     try:
@@ -2827,7 +3369,7 @@ async def main():
         parser.add_argument(
             "--sources_config",
             type=str,
-            required=True,
+            default=None,
             help='JSON 설정: [{"identifier": "URL", "maxItems": 수}, ...] 또는 [{"url": "URL", "max_items": 수}, ...]'
         )
         parser.add_argument(
@@ -2872,12 +3414,47 @@ async def main():
             action="store_true", 
             help="브라우저 창 표시 (디버깅용)"
         )
+        parser.add_argument(
+            "--max_concurrency", 
+            type=int, 
+            default=3, 
+            help="동시에 처리할 사이트/기사 페이지 수 (기본값: 3)"
+        )
+        parser.add_argument(
+            "--user_data_dir", 
+            type=str, 
+            default=os.environ.get("PLAYWRIGHT_USER_DATA_DIR"), 
+            help="브라우저 캐시/쿠키를 실행 간에 유지할 디렉토리 (기본값: PLAYWRIGHT_USER_DATA_DIR 환경 변수, 없으면 사용 안 함)"
+        )
+        parser.add_argument(
+            "--article_cache_hours", 
+            type=float, 
+            default=0, 
+            help="이 시간 안에 추출한 기사는 페이지를 다시 로드하지 않고 디스크 캐시에서 재사용 (기사 변경 여부는 확인하지 않음, 기본값: 0 = 사용 안 함)"
+        )
+        parser.add_argument(
+            "--storage_state", 
+            type=str, 
+            default=os.environ.get("PLAYWRIGHT_STORAGE_STATE"), 
+            help="쿠키/localStorage 스냅샷 파일: 있으면 복원하고 종료 시 갱신 (기본값: PLAYWRIGHT_STORAGE_STATE 환경 변수)"
+        )
+        parser.add_argument(
+            "--serve", 
+            action="store_true", 
+            help="워커 모드: stdin에서 JSONL 작업을 받아 브라우저를 재사용하며 처리"
+        )
 
         args = parser.parse_args()
         
+        if args.serve:
+            await serve(args)
+            return []
+        if not args.sources_config:
+            parser.error("--sources_config 인자가 필요합니다 (--serve 모드 제외)")
+        
         # 소스 설정 파싱
         try:
-            sources_config_list = json.loads(args.sources_config)
+            sources_config_list = orjson.loads(args.sources_config) if orjson is not None else json.loads(args.sources_config)
             if not isinstance(sources_config_list, list):
                 sources_config_list = [sources_config_list]
             print(f"✅ 소스 설정 로드 완료: {len(sources_config_list)}개 사이트")
@@ -2908,7 +3485,11 @@ async def main():
         crawler = DynamicCrawler(
             llm_provider=args.llm_provider,
             headless=headless_mode,
-            target_date=args.target_date
+            target_date=args.target_date,
+            max_concurrency=args.max_concurrency,
+            user_data_dir=args.user_data_dir,
+            article_cache_hours=args.article_cache_hours,
+            storage_state_path=args.storage_state
         )
         
         try:
@@ -2918,77 +3499,36 @@ async def main():
             print(f"❌ 크롤러 초기화 실패: {e}")
             sys.exit(1)
         
-        all_results = []
-        successful_sites = 0
-        total_stories = 0
+        # 결과 파일 (사이트별로 완료되는 즉시 기록)
+        writer = None
+        try:
+            writer = ResultWriter(args.output)
+        except Exception as e:
+            print(f"❌ 결과 파일 열기 실패: {e}")
         
-        # 각 사이트 처리
-        for i, source_config_item in enumerate(sources_config_list, 1):
-            url = source_config_item.get("identifier") or source_config_item.get("url")
-            max_links_for_source = source_config_item.get("max_items", source_config_item.get("maxItems", 1))
-            
-            if not url:
-                print(f"⚠️ 사이트 {i}: URL 누락, 건너뜀 - {source_config_item}")
-                continue
-
-            print(f"""
-📍 사이트 {i}/{len(sources_config_list)} 처리 중
-   • URL: {url}
-   • 최대 링크: {max_links_for_source}개
-   • 시간 범위: {args.timeframe_hours}시간
-""")
-            
-            try:
-                result_obj = await crawler.crawl_url_targeted(
-                    url=url,
-                    content_focus=args.content_focus,
-                    max_links=max_links_for_source,
-                    timeframe_hours_for_filter=args.timeframe_hours 
-                )
-                
-                all_results.append(result_obj.to_dict())
-                
-                # 결과 요약
-                stories_count = len(result_obj.stories)
-                if stories_count > 0:
-                    successful_sites += 1
-                    total_stories += stories_count
-                    print(f"✅ 사이트 {i} 완료: {stories_count}개 기사 수집")
-                    
-                    # 수집된 기사 간단 요약 (소스 정보 포함)
-                    for j, story in enumerate(result_obj.stories, 1):
-                        print(f"   {j}. {story.headline[:50]}... (출처: {story.source})")
-                else:
-                    print(f"⚠️ 사이트 {i} 완료: 수집된 기사 없음")
-                    if result_obj.error:
-                        print(f"   오류: {result_obj.error}")
-                
-            except Exception as e:
-                print(f"❌ 사이트 {i} 처리 실패: {str(e)}")
-                # 실패한 경우에도 빈 결과 추가
-                all_results.append(CrawlResult(url).to_dict())
-            
-            # 다음 사이트 처리 전 대기 (마지막 사이트가 아닌 경우)
-            if i < len(sources_config_list):
-                delay = min(5, max(2, len(sources_config_list) - i))  # 동적 대기 시간
-                print(f"⏳ {delay}초 대기 후 다음 사이트 처리...")
-                await asyncio.sleep(delay)
+        source_results = await run_once(
+            crawler, sources_config_list, args.content_focus, args.timeframe_hours,
+            on_result=writer.write if writer is not None else None
+        )
+        all_results = [result for _, result in source_results]
+        successful_sites = sum(1 for result in all_results if result.stories)
+        total_stories = sum(len(result.stories) for result in all_results)
         
         await crawler.close()
         print("✅ 크롤러 종료 완료")
         
-        # 결과 저장
-        try:
-            with open(args.output, 'w', encoding='utf-8') as f:
-                json.dump(all_results, f, ensure_ascii=False, indent=2)
+        # 결과 저장 확인
+        if writer is not None:
+            writer.close()
+        if writer is not None and writer.error is None:
             print(f"✅ 결과 저장 완료: {args.output}")
-        except Exception as e:
-            print(f"❌ 결과 저장 실패: {e}")
+        else:
+            if writer is not None:
+                print(f"❌ 결과 저장 실패: {writer.error}")
             # 백업 파일명으로 저장 시도
             backup_file = f"crawl_results_backup_{int(time.time())}.json"
             try:
-                with open(backup_file, 'w', encoding='utf-8') as f:
-                    json.dump(all_results, f, ensure_ascii=False, indent=2)
+                write_results(backup_file, all_results)
                 print(f"✅ 백업 파일로 저장: {backup_file}")
             except Exception as backup_error:
                 print(f"❌ 백업 저장도 실패: {backup_error}")
@@ -3011,19 +3551,19 @@ async def main():
 
 📈 사이트별 상세 결과:""")
         
-        for i, (source_config, result) in enumerate(zip(sources_config_list, all_results), 1):
+        for i, (source_config, result) in enumerate(source_results, 1):
             url = source_config.get("identifier") or source_config.get("url", "Unknown")
-            stories_count = len(result.get('stories', []))
-            site_info = result.get('site_info', {})
+            stories_count = len(result.stories)
+            site_info = result.site_info or {}
             platform = site_info.get('platform', 'unknown')
             cms = site_info.get('cms', 'unknown')
             
-            status = "✅" if stories_count > 0 else ("⚠️" if result.get('error') else "❌")
+            status = "✅" if stories_count > 0 else ("⚠️" if result.error else "❌")
             print(f"   {status} 사이트 {i}: {stories_count}개 기사")
             print(f"      URL: {url}")
             print(f"      유형: {platform}/{cms}")
-            if result.get('error'):
-                print(f"      오류: {result['error']}")
+            if result.error:
+                print(f"      오류: {result.error}")
         
         if total_stories == 0:
             print("\n⚠️ 수집된 기사가 없습니다. 다음을 확인해보세요:")
@@ -0,0 +1,53 @@
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+# 사이트별 크롤링 설정 (전용 크롤러가 없는 사이트의 일반 크롤링 경로에서 사용)
+@dataclass
+class SiteConfig:
+    domain: str = ""
+    article_selectors: List[str] = field(default_factory=list)
+    content_selectors: List[str] = field(default_factory=list)
+    included_url_patterns: List[str] = field(default_factory=list)
+    excluded_url_patterns: List[str] = field(default_factory=list)
+
+# 모든 사이트에 공통으로 시도하는 선택자 (링크 선택자는 href가 있는 a 요소를 가리켜야 함)
+UNIVERSAL_SELECTORS: Dict[str, List[str]] = {
+    'article_selectors': [
+        'article h1 a[href]', 'article h2 a[href]', 'article h3 a[href]',
+        'h2 a[href]', 'h3 a[href]',
+        '.post a[href]', '.entry a[href]', '.news-item a[href]', '.story a[href]',
+        '.card a[href]', 'article a[href]',
+    ],
+    'content_selectors': [
+        'article', 'main', '[role="main"]',
+        '.post-content', '.entry-content', '.article-content', '.article-body',
+    ],
+}
+
+class SiteConfigManager:
+    """도메인별 사이트 설정 관리 (등록되지 않은 도메인은 기본 설정 사용)"""
+
+    def __init__(self):
+        self.configs: Dict[str, SiteConfig] = {}
+
+    @staticmethod
+    def _domain_of(url: str) -> str:
+        """URL 또는 호스트 문자열에서 www.를 뺀 도메인 추출"""
+        domain = url.split('://', 1)[-1].split('/', 1)[0].lower()
+        return domain[4:] if domain.startswith('www.') else domain
+
+    def add_config(self, config: SiteConfig) -> None:
+        self.configs[self._domain_of(config.domain)] = config
+
+    def get_config(self, url: str) -> SiteConfig:
+        """URL의 도메인에 맞는 설정 반환 (없으면 선택자/패턴이 빈 기본 설정)"""
+        domain = self._domain_of(url)
+        config = self.configs.get(domain)
+        if config is None:
+            config = SiteConfig(domain=domain)
+        return config
+
+    def get_universal_selectors(self) -> Dict[str, List[str]]:
+        return UNIVERSAL_SELECTORS
+
+site_config_manager = SiteConfigManager()
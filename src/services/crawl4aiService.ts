@@ -644,6 +644,92 @@ except Exception as e:
   }
 }
 
+/**
+ * analyze_content.py를 --worker 모드로 띄워 여러 분석 요청에 재사용하는 프로세스
+ * (요청마다 인터프리터, OpenAI 클라이언트, 임베딩 캐시를 다시 만들지 않음)
+ */
+class AnalyzeContentWorker {
+  // 일정 시간 요청이 없으면 워커를 종료해 Node 프로세스가 끝날 수 있게 함
+  private static readonly IDLE_TIMEOUT_MS = 10000;
+
+  private shell: PythonShell | null = null;
+  private pending: { resolve: (line: string) => void; reject: (error: Error) => void }[] = [];
+  private idleTimer: NodeJS.Timeout | null = null;
+
+  constructor(private readonly scriptPath: string) {}
+
+  /**
+   * 요청 하나를 보내고 응답 한 줄(JSON)을 받습니다. (워커는 요청을 순서대로 처리)
+   */
+  request(payload: object): Promise<string> {
+    if (this.idleTimer) {
+      clearTimeout(this.idleTimer);
+      this.idleTimer = null;
+    }
+    const shell = this.shell || this.start();
+
+    return new Promise<string>((resolve, reject) => {
+      this.pending.push({ resolve, reject });
+      shell.send(JSON.stringify(payload));
+    });
+  }
+
+  private start(): PythonShell {
+    const shell = new PythonShell(this.scriptPath, {
+      mode: 'text',
+      pythonPath: 'python',
+      pythonOptions: ['-u'],
+      args: ['--worker'],
+      env: {
+        ...process.env,
+        OPENAI_API_KEY: process.env.OPENAI_API_KEY || '',
+        TOGETHER_API_KEY: process.env.TOGETHER_API_KEY || '',
+        DEEPSEEK_API_KEY: process.env.DEEPSEEK_API_KEY || ''
+      }
+    });
+
+    shell.on('message', (line: string) => {
+      const next = this.pending.shift();
+      if (next) {
+        next.resolve(line);
+      }
+      if (this.pending.length === 0) {
+        this.scheduleIdleShutdown();
+      }
+    });
+    shell.on('stderr', (line: string) => console.error(line));
+
+    // 워커가 종료되면 대기 중인 요청을 모두 실패 처리하고 다음 요청에서 다시 시작
+    const fail = (error: Error) => {
+      if (this.shell === shell) {
+        this.shell = null;
+      }
+      const pending = this.pending;
+      this.pending = [];
+      pending.forEach(request => request.reject(error));
+    };
+    shell.on('error', fail);
+    shell.on('close', () => fail(new Error('analyze_content 워커가 종료되었습니다.')));
+
+    this.shell = shell;
+    return shell;
+  }
+
+  private scheduleIdleShutdown(): void {
+    this.idleTimer = setTimeout(() => {
+      this.idleTimer = null;
+      const shell = this.shell;
+      if (shell && this.pending.length === 0) {
+        this.shell = null;
+        // stdin을 닫으면 워커가 요청 루프를 끝내고 종료
+        shell.end(() => {});
+      }
+    }, AnalyzeContentWorker.IDLE_TIMEOUT_MS);
+  }
+}
+
+let analyzeContentWorker: AnalyzeContentWorker | null = null;
+
 /**
  * 임베딩 기반 카테고리 분류를 위한 인터페이스
  */
@@ -686,19 +772,16 @@ export async function analyzeContentWithEmbeddings(
       .replace(/[\u0000-\u001F\u007F-\u009F]/g, '') // 제어 문자 제거
       .replace(/\\"/g, '"') // 이스케이프된 따옴표 정규화
       .replace(/\\\\/g, '\\') // 이스케이프된 백슬래시 정규화
-      .normalize('NFKD') // 유니코드 정규화 (결합 문자 분해)
+      .normalize('NFKC') // 유니코드 정규화 (한글은 조합된 음절로 유지해야 키워드가 일치함)
       .substring(0, 8000); // 길이 제한
     
-    // 카테고리 리스트의 유효성 확인 및 ASCII 문자로 대체
-    const safeCategories = categories.map(category => 
-      category
-        .normalize('NFKD') // 유니코드 정규화
-        .replace(/[^\x00-\x7F]/g, '') // ASCII 문자가 아닌 것 제거
-        .trim() || 'General' // 빈 문자열이면 General로 대체
-    );
+    // 카테고리 이름은 워커에 JSON(UTF-8)으로 전달하므로 한글 이름을 그대로 유지
+    const safeCategories = categories
+      .map(category => category.normalize('NFKC').trim())
+      .filter(Boolean);
     
-    // 중복 제거 및 유효한 카테고리만 필터링
-    const uniqueCategories = [...new Set(safeCategories)].filter(Boolean);
+    // 중복 제거 (유효한 카테고리가 없으면 General 사용)
+    const uniqueCategories = safeCategories.length > 0 ? [...new Set(safeCategories)] : ['General'];
 
     // 별도 Python 스크립트 경로
     const scriptPath = path.join(__dirname, '../scripts/analyze_content.py');
@@ -712,31 +795,19 @@ export async function analyzeContentWithEmbeddings(
       };
     }
     
-    // 환경 변수 설정
-    const env = {
-      ...process.env,
-      OPENAI_API_KEY: process.env.OPENAI_API_KEY || '',
-      TOGETHER_API_KEY: process.env.TOGETHER_API_KEY || '',
-      DEEPSEEK_API_KEY: process.env.DEEPSEEK_API_KEY || ''
-    };
-    
-    // Python 스크립트 옵션 - 인자로 데이터 전달
-    const pythonOptions: PythonShellOptions = {
-      mode: 'text',
-      pythonPath: 'python',
-      pythonOptions: ['-u'],
-      args: [
-        safeContent,
-        JSON.stringify(uniqueCategories),
-        llmProvider,
-        model
-      ],
-      env
-    };
+    // 워커 프로세스는 첫 요청에서 시작하고 이후 요청에 재사용
+    if (!analyzeContentWorker) {
+      analyzeContentWorker = new AnalyzeContentWorker(scriptPath);
+    }
     
     try {
       console.log('임베딩 기반 콘텐츠 분석 시작...');
-      const results = await PythonShell.run(scriptPath, pythonOptions);
+      const results = [await analyzeContentWorker.request({
+        content: safeContent,
+        categories: uniqueCategories,
+        llmProvider,
+        model
+      })];
       
       if (results && results.length > 0) {
         try {
@@ -1,16 +1,58 @@
 import OpenAI from "openai";
 import dotenv from "dotenv";
 import NodeCache from 'node-cache';
+import crypto from 'crypto';
 import { retry as withRetry } from 'ts-retry-promise';
 import type { Story } from './scrapeSources';
 import { retrieveFullContent } from './contentStorage';
 import { getCategoryFromContent } from './sendDraft';
+import { RateLimiter, estimateTokens, isRateLimitError, mapWithConcurrency, withRateLimitRetry } from '../utils/rateLimiter';
 
 dotenv.config();
 
 // 캐시 인스턴스 생성
 const cache = new NodeCache({ stdTTL: 24 * 60 * 60 }); // 24시간 캐시
 
+// 요약 요청 동시 실행 수 (요약 종류별)
+const SUMMARY_CONCURRENCY = 5;
+
+// 시스템 프롬프트 (OpenAI 자동 프롬프트 캐싱이 적용되도록 항상 동일한 문자열을 첫 메시지로 사용)
+const TITLE_TRANSLATION_SYSTEM_PROMPT =
+  "영어 제목을 한국어로 번역해주세요. JSON 형식으로 번역된 내용만 반환합니다. 형식: {\"translated\": \"번역된 텍스트\"}";
+
+const CONTENT_TRANSLATION_SYSTEM_PROMPT =
+  "원문의 모든 마크다운 요소(헤더, 목록, 인용, 코드 블록, 표, 이미지 및 비디오 링크 등)를 그대로 유지하며 한국어로 번역하세요. " +
+  "이미지 및 비디오 태그(`![alt](URL)` 또는 URL 삽입)는 본분에 있는 것을 손상되지 않도록 가져와야 합니다. " +
+  "응답은 JSON 형식으로, 'translation' 필드에 전체 번역 결과(마크다운 포함)를 포함해주세요.";
+
+const BULLET_POINT_SYSTEM_PROMPT =
+  "긴 한국어 텍스트를 정확히 10개의 핵심 불렛포인트로 요약하세요. 각 항목은 한 문장으로 구성되고 명확하게 작성되어야 합니다. 원문의 핵심 정보와 중요한 데이터를 최대한 포함하세요. JSON 형식으로 'bullet_points' 필드에 배열로 응답하세요. 불릿 기호나 번호를 포함하지 마세요.";
+
+const BULLET_POINT_TRANSLATION_SYSTEM_PROMPT = `
+           다음 영어 본문을 분석하고 핵심 내용을 정확히 10개의 간결한 요점으로 요약한 후 한국어로 번역해주세요.
+           각 요점은 하나의 완전한 문장으로 작성하세요.
+           불릿 기호나 번호를 포함하지 마세요.
+           핵심 내용, 주요 주장, 중요한 데이터, 결론 등을 포함해야 합니다.
+           간결하면서도 정보가 풍부하게 작성해주세요.
+           모든 내용은 한국어로 번역되어야 합니다.
+           결과는 10개의 요점으로만 제공하세요.
+         `;
+
+const BRIEF_SUMMARY_SYSTEM_PROMPT =
+  "한국어로 된 텍스트를 3-4개의 문장으로 요약하세요. 핵심 내용을 정확하고 자세하게 포함해야 합니다. 어려운 기술적 용어는 조금 쉽게 표현해주세요. '이 기사는', '이 포스트는' 등의 문구로 시작하지 말고 직접적으로 핵심 내용을 전달하세요. JSON 형식으로 응답하되, 'summary' 필드에 요약된 내용을 포함하세요.";
+
+// 프롬프트가 바뀌면 캐시가 무효화되므로, 캐시 미스 추적을 위해 해시를 기록
+console.log(`System prompt hash: ${crypto.createHash('sha256')
+  .update([
+    TITLE_TRANSLATION_SYSTEM_PROMPT,
+    CONTENT_TRANSLATION_SYSTEM_PROMPT,
+    BULLET_POINT_SYSTEM_PROMPT,
+    BULLET_POINT_TRANSLATION_SYSTEM_PROMPT,
+    BRIEF_SUMMARY_SYSTEM_PROMPT
+  ].join('\0'))
+  .digest('hex')
+  .substring(0, 12)}`);
+
 /**
  * OpenAI API를 사용하여 텍스트를 번역합니다.
  */
@@ -36,7 +78,7 @@ async function translateText(
         messages: [
           {
             role: "system",
-            content: "영어 제목을 한국어로 번역해주세요. JSON 형식으로 번역된 내용만 반환합니다. 형식: {\"translated\": \"번역된 텍스트\"}"
+            content: TITLE_TRANSLATION_SYSTEM_PROMPT
           },
           {
             role: "user", 
@@ -67,10 +109,7 @@ async function translateText(
         messages: [
           {
             role: "system",
-            content: 
-              "원문의 모든 마크다운 요소(헤더, 목록, 인용, 코드 블록, 표, 이미지 및 비디오 링크 등)를 그대로 유지하며 한국어로 번역하세요. " +
-              "이미지 및 비디오 태그(`![alt](URL)` 또는 URL 삽입)는 본분에 있는 것을 손상되지 않도록 가져와야 합니다. " +
-              "응답은 JSON 형식으로, 'translation' 필드에 전체 번역 결과(마크다운 포함)를 포함해주세요."
+            content: CONTENT_TRANSLATION_SYSTEM_PROMPT
           },
           {
             role: "user",
@@ -110,162 +149,131 @@ async function createBulletPointSummary(
     return "";
   }
   
-  // 최대 재시도 횟수 설정
-  const maxRetries = 3;
-  let retries = 0;
-  
-  while (retries <= maxRetries) {
-    try {
-      // OpenAI 클라이언트가 없으면 생성
-      if (!openai) {
-        openai = new OpenAI({ apiKey: process.env.OPENAI_API_KEY });
-      }
-      
-      console.log(`Creating bullet point summary (${alreadyTranslated ? "already translated" : "needs translation"})`);
-      
-      const systemPrompt = alreadyTranslated
-        ? "긴 한국어 텍스트를 정확히 10개의 핵심 불렛포인트로 요약하세요. 각 항목은 한 문장으로 구성되고 명확하게 작성되어야 합니다. 원문의 핵심 정보와 중요한 데이터를 최대한 포함하세요. JSON 형식으로 'bullet_points' 필드에 배열로 응답하세요. 불릿 기호나 번호를 포함하지 마세요."
-        : `
-           다음 영어 본문을 분석하고 핵심 내용을 정확히 10개의 간결한 요점으로 요약한 후 한국어로 번역해주세요.
-           각 요점은 하나의 완전한 문장으로 작성하세요.
-           불릿 기호나 번호를 포함하지 마세요.
-           핵심 내용, 주요 주장, 중요한 데이터, 결론 등을 포함해야 합니다.
-           간결하면서도 정보가 풍부하게 작성해주세요.
-           모든 내용은 한국어로 번역되어야 합니다.
-           결과는 10개의 요점으로만 제공하세요.
-         `;
-         
-      // 이미 번역된 텍스트는 JSON으로 응답 요청, 그렇지 않으면 일반 텍스트 응답
-      const responseFormat = alreadyTranslated
-        ? { type: "json_object" as const }
-        : undefined;
-      
-      const userPrompt = alreadyTranslated
-        ? `다음 텍스트를 10개의 불렛포인트로 요약하세요:\n\n${text.substring(0, 15000)}`
-        : text.substring(0, 15000);
-      
-      const bulletSummaryCompletion = await openai.chat.completions.create({
-        model: model,
-        temperature: 0.5,
-        max_tokens: 2000,
-        response_format: responseFormat,
-        messages: [
-          {
-            role: "system",
-            content: systemPrompt
-          },
-          {
-            role: "user",
-            content: userPrompt
-          }
-        ]
-      });
-      
-      const bulletContent = bulletSummaryCompletion.choices[0].message.content?.trim() || '';
-      
-      if (alreadyTranslated) {
-        try {
-          const bulletData = JSON.parse(bulletContent);
-          if (Array.isArray(bulletData.bullet_points) && bulletData.bullet_points.length > 0) {
+  try {
+    // OpenAI 클라이언트가 없으면 생성
+    if (!openai) {
+      openai = new OpenAI({ apiKey: process.env.OPENAI_API_KEY });
+    }
+    
+    console.log(`Creating bullet point summary (${alreadyTranslated ? "already translated" : "needs translation"})`);
+    
+    const systemPrompt = alreadyTranslated
+      ? BULLET_POINT_SYSTEM_PROMPT
+      : BULLET_POINT_TRANSLATION_SYSTEM_PROMPT;
+       
+    // 이미 번역된 텍스트는 JSON으로 응답 요청, 그렇지 않으면 일반 텍스트 응답
+    const responseFormat = alreadyTranslated
+      ? { type: "json_object" as const }
+      : undefined;
+    
+    const userPrompt = alreadyTranslated
+      ? `다음 텍스트를 10개의 불렛포인트로 요약하세요:\n\n${text.substring(0, 15000)}`
+      : text.substring(0, 15000);
+    
+    const bulletSummaryCompletion = await openai.chat.completions.create({
+      model: model,
+      temperature: 0.5,
+      max_tokens: 2000,
+      response_format: responseFormat,
+      messages: [
+        {
+          role: "system",
+          content: systemPrompt
+        },
+        {
+          role: "user",
+          content: userPrompt
+        }
+      ]
+    });
+    
+    const bulletContent = bulletSummaryCompletion.choices[0].message.content?.trim() || '';
+    
+    if (alreadyTranslated) {
+      try {
+        const bulletData = JSON.parse(bulletContent);
+        if (Array.isArray(bulletData.bullet_points) && bulletData.bullet_points.length > 0) {
+          // HTML 태그 제거 및 마크다운 링크 정리
+          const cleanedPoints = bulletData.bullet_points.map((point: string) => {
+            // HTML 태그 제거
+            let cleaned = point.replace(/<[^>]*>/g, '');
+            // 마크다운 링크 정리 (예: [텍스트](링크) -> 텍스트)
+            cleaned = cleaned.replace(/\[([^\]]+)\]\([^)]+\)/g, '$1');
+            // 기존 불릿이나 번호 제거
+            cleaned = cleaned.replace(/^[\d\-•*\s\.]+/, '').trim();
+            return cleaned;
+          });
+          
+          // 불릿포인트 형식으로 변환하고 줄바꿈으로 구분
+          const formattedPoints = cleanedPoints.map((point: string) => {
+            // 각 문장이 마침표로 끝나는지 확인하고 추가
+            const sentence = point.trim();
+            const formattedSentence = sentence.endsWith('.') ? sentence : sentence + '.';
+            return `• ${formattedSentence}`;
+          });
+          
+          console.log(`${formattedPoints.length}개의 불릿 포인트 생성 완료`);
+          
+          // 일관된 개행을 사용하여 반환
+          return formattedPoints.join('\n\n');
+        }
+      } catch (parseError) {
+        console.error("Error parsing bullet point summary response:", parseError);
+        
+        // JSON 파싱 실패 시 정규식으로 추출 시도
+        if (bulletContent.includes('bullet_points')) {
+          const points = bulletContent.match(/"[^"]+"/g);
+          if (points && points.length > 0) {
             // HTML 태그 제거 및 마크다운 링크 정리
-            const cleanedPoints = bulletData.bullet_points.map((point: string) => {
-              // HTML 태그 제거
-              let cleaned = point.replace(/<[^>]*>/g, '');
-              // 마크다운 링크 정리 (예: [텍스트](링크) -> 텍스트)
+            const cleanedPoints = points.map(p => {
+              let cleaned = p.replace(/"/g, '').replace(/<[^>]*>/g, '');
               cleaned = cleaned.replace(/\[([^\]]+)\]\([^)]+\)/g, '$1');
               // 기존 불릿이나 번호 제거
               cleaned = cleaned.replace(/^[\d\-•*\s\.]+/, '').trim();
-              return cleaned;
-            });
-            
-            // 불릿포인트 형식으로 변환하고 줄바꿈으로 구분
-            const formattedPoints = cleanedPoints.map((point: string) => {
+              
               // 각 문장이 마침표로 끝나는지 확인하고 추가
-              const sentence = point.trim();
-              const formattedSentence = sentence.endsWith('.') ? sentence : sentence + '.';
-              return `• ${formattedSentence}`;
+              return cleaned.endsWith('.') ? cleaned : cleaned + '.';
             });
             
-            console.log(`${formattedPoints.length}개의 불릿 포인트 생성 완료`);
-            
-            // 일관된 개행을 사용하여 반환
+            const formattedPoints = cleanedPoints.map(p => `• ${p}`);
             return formattedPoints.join('\n\n');
           }
-        } catch (parseError) {
-          console.error("Error parsing bullet point summary response:", parseError);
-          
-          // JSON 파싱 실패 시 정규식으로 추출 시도
-          if (bulletContent.includes('bullet_points')) {
-            const points = bulletContent.match(/"[^"]+"/g);
-            if (points && points.length > 0) {
-              // HTML 태그 제거 및 마크다운 링크 정리
-              const cleanedPoints = points.map(p => {
-                let cleaned = p.replace(/"/g, '').replace(/<[^>]*>/g, '');
-                cleaned = cleaned.replace(/\[([^\]]+)\]\([^)]+\)/g, '$1');
-                // 기존 불릿이나 번호 제거
-                cleaned = cleaned.replace(/^[\d\-•*\s\.]+/, '').trim();
-                
-                // 각 문장이 마침표로 끝나는지 확인하고 추가
-                return cleaned.endsWith('.') ? cleaned : cleaned + '.';
-              });
-              
-              const formattedPoints = cleanedPoints.map(p => `• ${p}`);
-              return formattedPoints.join('\n\n');
-            }
-          }
-        }
-      } else {
-        // 이미 불렛포인트 형식으로 응답된 경우
-        // HTML 태그 제거
-        let cleanedContent = bulletContent.replace(/<[^>]*>/g, '');
-        // 마크다운 링크 정리
-        cleanedContent = cleanedContent.replace(/\[([^\]]+)\]\([^)]+\)/g, '$1');
-        
-        // 각 불렛포인트 항목 사이에 빈 줄 추가하고 불릿 포인트 형식 통일
-        const lines = cleanedContent.split('\n').map(line => line.trim()).filter(line => line);
-        const formattedLines = lines.map(line => {
-          // 기존 불릿이나 번호 제거
-          const cleanLine = line.replace(/^[\d\-•*\s\.]+/, '').trim();
-          // 각 문장이 마침표로 끝나는지 확인하고 추가
-          const formattedLine = cleanLine.endsWith('.') ? cleanLine : cleanLine + '.';
-          return `• ${formattedLine}`;
-        });
-        
-        return formattedLines.join('\n\n');
-      }
-      
-      // 여기까지 왔다면 요약 실패로 간주하고 재시도
-      throw new Error("불릿 포인트 생성 실패");
-      
-    } catch (error: any) {
-      console.error("Error creating bullet point summary:", error);
-      
-      // Rate Limit 오류인 경우 대기 후 재시도
-      if (error.status === 429) {
-        retries++;
-        if (retries <= maxRetries) {
-          // 재시도 대기 시간 - retry-after-ms 헤더가 있으면 사용, 없으면 기본값 사용
-          const retryAfterMs = error.headers?.['retry-after-ms'] 
-            ? parseInt(error.headers['retry-after-ms']) 
-            : (5000 * retries); // 점점 대기 시간 증가
-          
-          console.log(`Rate limit 도달, ${retryAfterMs}ms 후 재시도 (${retries}/${maxRetries})...`);
-          await new Promise(resolve => setTimeout(resolve, retryAfterMs + 1000)); // 여유 있게 1초 추가
-          continue;
         }
       }
+    } else {
+      // 이미 불렛포인트 형식으로 응답된 경우
+      // HTML 태그 제거
+      let cleanedContent = bulletContent.replace(/<[^>]*>/g, '');
+      // 마크다운 링크 정리
+      cleanedContent = cleanedContent.replace(/\[([^\]]+)\]\([^)]+\)/g, '$1');
       
-      // 최대 재시도 횟수 초과 또는 다른 종류의 오류
-      if (retries >= maxRetries) {
-        console.error(`최대 재시도 횟수(${maxRetries}) 초과. 요약 생성 실패.`);
-      }
+      // 각 불렛포인트 항목 사이에 빈 줄 추가하고 불릿 포인트 형식 통일
+      const lines = cleanedContent.split('\n').map(line => line.trim()).filter(line => line);
+      const formattedLines = lines.map(line => {
+        // 기존 불릿이나 번호 제거
+        const cleanLine = line.replace(/^[\d\-•*\s\.]+/, '').trim();
+        // 각 문장이 마침표로 끝나는지 확인하고 추가
+        const formattedLine = cleanLine.endsWith('.') ? cleanLine : cleanLine + '.';
+        return `• ${formattedLine}`;
+      });
       
-      // 기본 응답 반환
-      return "• 요약을 생성할 수 없습니다.";
+      return formattedLines.join('\n\n');
+    }
+    
+    // 여기까지 왔다면 요약 실패로 간주
+    throw new Error("불릿 포인트 생성 실패");
+    
+  } catch (error: any) {
+    console.error("Error creating bullet point summary:", error);
+    
+    // Rate Limit 오류는 호출한 쪽에서 대기 후 재시도
+    if (isRateLimitError(error)) {
+      throw error;
     }
+    
+    // 기본 응답 반환
+    return "• 요약을 생성할 수 없습니다.";
   }
-  
-  return "• 요약을 생성할 수 없습니다.";
 }
 
 /**
@@ -302,7 +310,7 @@ async function createBriefSummary(
         messages: [
           {
             role: "system",
-            content: "한국어로 된 텍스트를 3-4개의 문장으로 요약하세요. 핵심 내용을 정확하고 자세하게 포함해야 합니다. 어려운 기술적 용어는 조금 쉽게 표현해주세요. '이 기사는', '이 포스트는' 등의 문구로 시작하지 말고 직접적으로 핵심 내용을 전달하세요. JSON 형식으로 응답하되, 'summary' 필드에 요약된 내용을 포함하세요."
+            content: BRIEF_SUMMARY_SYSTEM_PROMPT
           },
           {
             role: "user",
@@ -336,8 +344,15 @@ async function createBriefSummary(
       }
     } catch (error) {
       console.error("Summary creation failed:", error);
+      // Rate Limit 오류는 호출한 쪽에서 대기 후 재시도
+      if (isRateLimitError(error)) {
+        throw error;
+      }
     }
   } catch (error) {
+    if (isRateLimitError(error)) {
+      throw error;
+    }
     console.error("Error creating brief summary:", error);
   }
   
@@ -868,99 +883,48 @@ async function processSummaries(openai: OpenAI, stories: any[], model: string) {
     }
   }
   
-  // 배치 요약 처리 - 순차적으로 처리하여 Rate Limit 방지
-  const briefSummaries: string[] = [];
-  
-  for (let i = 0; i < briefSummaryItems.length; i++) {
+  // 고정 대기 대신 분당 요청/토큰 한도에 맞춰 동시에 요약 요청
+  const limiter = new RateLimiter();
+
+  const briefSummaryPromise = mapWithConcurrency(briefSummaryItems, SUMMARY_CONCURRENCY, async (text, i) => {
     try {
       console.log(`Creating brief summary... (${i+1}/${briefSummaryItems.length})`);
-      console.log(`요약할 텍스트 길이: ${briefSummaryItems[i].length}바이트`);
-      
-      // 각 요약을 개별적으로 생성
-      const summary = await createBriefSummary(briefSummaryItems[i], model, openai);
-      briefSummaries.push(summary);
+      console.log(`요약할 텍스트 길이: ${text.length}바이트`);
       
-      // Rate Limit 방지를 위한 딜레이 (7~10초)
-      if (i < briefSummaryItems.length - 1) {
-        const delay = Math.floor(Math.random() * 3000) + 7000;
-        console.log(`Brief Summary 요청 간 ${delay}ms 대기 중...`);
-        await new Promise(resolve => setTimeout(resolve, delay));
-      }
+      // Rate Limit 오류는 retry-after 또는 지수 백오프(지터 포함)만큼 대기 후 재시도
+      return await withRateLimitRetry(async () => {
+        await limiter.acquire(estimateTokens(text.substring(0, 6000)) + 500);
+        return await createBriefSummary(text, model, openai);
+      });
     } catch (error) {
       console.error("Brief summary creation error:", error);
       
-      // Rate Limit 오류인 경우
-      if (error && typeof error === 'object' && 'status' in error && error.status === 429) {
-        console.log("Rate Limit 오류 발생, 30초 대기 후 재시도...");
-        await new Promise(resolve => setTimeout(resolve, 30000)); // 30초 대기
-        
-        try {
-          // 재시도
-          const summary = await createBriefSummary(briefSummaryItems[i], model, openai);
-          briefSummaries.push(summary);
-        } catch (retryError) {
-          console.error("재시도 후에도 오류 발생:", retryError);
-          // 실패 시 첫 200자 사용
-          briefSummaries.push(briefSummaryItems[i].substring(0, 200) + "...");
-          console.log("모든 요약 시도 실패, 원본 텍스트 앞부분을 사용합니다.");
-        }
-      } else {
-        // 다른 오류인 경우 - 첫 200자 사용
-        briefSummaries.push(briefSummaryItems[i].substring(0, 200) + "...");
-        console.log("요약 생성 오류, 원본 텍스트 앞부분을 사용합니다.");
-      }
-      
-      // 오류 후 더 길게 대기 (15초)
-      console.log("오류 발생 후 15초 대기 중...");
-      await new Promise(resolve => setTimeout(resolve, 15000));
+      // 실패 시 첫 200자 사용
+      console.log("요약 생성 오류, 원본 텍스트 앞부분을 사용합니다.");
+      return text.substring(0, 200) + "...";
     }
-  }
+  });
 
-  // Rate Limit 방지를 위해 순차적으로 불릿 포인트 요약 처리
-  const bulletPointSummaries: string[] = [];
-  for (let i = 0; i < bulletPointItems.length; i++) {
+  const bulletPointSummaryPromise = mapWithConcurrency(bulletPointItems, SUMMARY_CONCURRENCY, async (item, i) => {
     try {
       console.log(`Creating bullet point summary (already translated) (${i+1}/${bulletPointItems.length})`);
-      const summary = await createBulletPointSummary(bulletPointItems[i].text, model, bulletPointItems[i].isTranslated, openai);
-      bulletPointSummaries.push(summary);
+      const summary = await withRateLimitRetry(async () => {
+        await limiter.acquire(estimateTokens(item.text.substring(0, 15000)) + 2000);
+        return await createBulletPointSummary(item.text, model, item.isTranslated, openai);
+      });
       
       // 성공 메시지 출력
       console.log(`${i+1}번째 불릿 포인트 생성 완료`);
-      
-      // Rate Limit 방지를 위한 딜레이 (8~12초)
-      if (i < bulletPointItems.length - 1) {
-        const delay = Math.floor(Math.random() * 4000) + 8000;
-        console.log(`Rate Limit 방지를 위해 ${delay}ms 대기 중...`);
-        await new Promise(resolve => setTimeout(resolve, delay));
-      }
+      return summary;
     } catch (error) {
       console.error("Bullet point creation error:", error);
       
-      // Rate Limit 오류인 경우
-      if (error && typeof error === 'object' && 'status' in error && error.status === 429) {
-        console.log("Rate Limit 오류 발생, 45초 대기 후 재시도...");
-        await new Promise(resolve => setTimeout(resolve, 45000)); // 45초 대기
-        
-        try {
-          // 재시도
-          const summary = await createBulletPointSummary(bulletPointItems[i].text, model, bulletPointItems[i].isTranslated, openai);
-          bulletPointSummaries.push(summary);
-          console.log(`${i+1}번째 불릿 포인트 재시도 후 생성 완료`);
-        } catch (retryError) {
-          console.error("재시도 후에도 오류 발생:", retryError);
-          // 기본 불릿 포인트 10개 생성
-          bulletPointSummaries.push(generateFallbackBulletPoints(bulletPointItems[i].text));
-        }
-      } else {
-        // 다른 오류인 경우 - 기본 불릿 포인트 생성
-        bulletPointSummaries.push(generateFallbackBulletPoints(bulletPointItems[i].text));
-      }
-      
-      // 오류 후 더 길게 대기 (20초)
-      console.log("오류 발생 후 20초 대기 중...");
-      await new Promise(resolve => setTimeout(resolve, 20000));
+      // 기본 불릿 포인트 10개 생성
+      return generateFallbackBulletPoints(item.text);
     }
-  }
+  });
+
+  const [briefSummaries, bulletPointSummaries] = await Promise.all([briefSummaryPromise, bulletPointSummaryPromise]);
   
   return { briefSummaries, bulletPointSummaries };
 }
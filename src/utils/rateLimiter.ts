@@ -0,0 +1,134 @@
+/**
+ * 분당 요청 수/토큰 수 한도를 지키도록 요청 시작 시점을 조절하는 토큰 버킷
+ * (고정 대기 대신 남은 용량이 있으면 바로 요청을 보냄)
+ */
+export class RateLimiter {
+  private availableRequests: number;
+  private availableTokens: number;
+  private lastRefill: number = Date.now();
+
+  // 기본값은 OpenAI 계정 한도 (OPENAI_RPM / OPENAI_TPM 환경 변수로 조정 가능)
+  constructor(
+    private readonly requestsPerMinute: number = Number(process.env.OPENAI_RPM) || 500,
+    private readonly tokensPerMinute: number = Number(process.env.OPENAI_TPM) || 30000
+  ) {
+    this.availableRequests = requestsPerMinute;
+    this.availableTokens = tokensPerMinute;
+  }
+
+  /**
+   * 경과 시간만큼 용량을 채웁니다.
+   */
+  private refill(): void {
+    const now = Date.now();
+    const elapsedMinutes = (now - this.lastRefill) / 60000;
+    this.availableRequests = Math.min(this.requestsPerMinute, this.availableRequests + elapsedMinutes * this.requestsPerMinute);
+    this.availableTokens = Math.min(this.tokensPerMinute, this.availableTokens + elapsedMinutes * this.tokensPerMinute);
+    this.lastRefill = now;
+  }
+
+  /**
+   * 요청 하나와 예상 토큰 수만큼의 용량을 확보할 때까지 기다립니다.
+   * @param estimatedTokens 요청의 예상 토큰 수 (입력 + 최대 출력)
+   */
+  async acquire(estimatedTokens: number): Promise<void> {
+    // 한 요청이 분당 한도보다 크면 가득 찬 버킷 하나를 쓰도록 제한
+    const tokens = Math.min(estimatedTokens, this.tokensPerMinute);
+
+    while (true) {
+      this.refill();
+      if (this.availableRequests >= 1 && this.availableTokens >= tokens) {
+        this.availableRequests -= 1;
+        this.availableTokens -= tokens;
+        return;
+      }
+
+      // 부족한 용량이 채워질 때까지 필요한 시간만큼만 대기
+      const requestWaitMs = Math.max(0, (1 - this.availableRequests) / this.requestsPerMinute) * 60000;
+      const tokenWaitMs = Math.max(0, (tokens - this.availableTokens) / this.tokensPerMinute) * 60000;
+      await new Promise(resolve => setTimeout(resolve, Math.ceil(Math.max(requestWaitMs, tokenWaitMs, 50))));
+    }
+  }
+}
+
+/**
+ * 텍스트의 대략적인 토큰 수를 추정합니다. (한국어는 글자당 토큰이 많으므로 보수적으로 계산)
+ */
+export function estimateTokens(text: string): number {
+  return Math.ceil(text.length / 2);
+}
+
+/**
+ * 최대 limit개씩 동시에 실행하며, 결과는 입력 순서대로 반환합니다.
+ */
+export async function mapWithConcurrency<T, R>(
+  items: T[],
+  limit: number,
+  fn: (item: T, index: number) => Promise<R>
+): Promise<R[]> {
+  const results: R[] = new Array(items.length);
+  let nextIndex = 0;
+
+  const worker = async () => {
+    while (nextIndex < items.length) {
+      const index = nextIndex++;
+      results[index] = await fn(items[index], index);
+    }
+  };
+
+  await Promise.all(Array.from({ length: Math.min(limit, items.length) }, worker));
+  return results;
+}
+
+/**
+ * OpenAI Rate Limit(429) 오류인지 확인합니다.
+ */
+export function isRateLimitError(error: unknown): boolean {
+  return !!error && typeof error === 'object' && 'status' in error && (error as { status?: number }).status === 429;
+}
+
+/**
+ * 429 응답 후 다시 요청하기까지 기다릴 시간을 계산합니다.
+ * retry-after-ms / retry-after 헤더가 있으면 따르고, 없으면 지수 백오프에 지터를 더합니다.
+ * @param attempt 0부터 시작하는 재시도 순번
+ */
+export function rateLimitDelayMs(error: unknown, attempt: number, baseMs: number = 2000, maxMs: number = 60000): number {
+  const headers = (error as { headers?: Record<string, string | null | undefined> } | null)?.headers;
+
+  const retryAfterMs = Number(headers?.['retry-after-ms']);
+  if (retryAfterMs > 0) {
+    return Math.min(retryAfterMs, maxMs);
+  }
+
+  // retry-after는 초 단위 숫자 또는 HTTP 날짜
+  const retryAfter = headers?.['retry-after'];
+  if (retryAfter) {
+    const seconds = Number(retryAfter);
+    const ms = Number.isFinite(seconds) ? seconds * 1000 : Date.parse(retryAfter) - Date.now();
+    if (ms > 0) {
+      return Math.min(ms, maxMs);
+    }
+  }
+
+  // 동시에 실패한 요청들이 같은 시점에 다시 몰리지 않도록 무작위 지터 추가
+  const backoffMs = Math.min(baseMs * 2 ** attempt, maxMs);
+  return backoffMs / 2 + Math.random() * (backoffMs / 2);
+}
+
+/**
+ * Rate Limit 오류가 나면 대기 후 최대 maxRetries번 다시 시도합니다. (다른 오류는 그대로 전달)
+ */
+export async function withRateLimitRetry<T>(fn: () => Promise<T>, maxRetries: number = 4): Promise<T> {
+  for (let attempt = 0; ; attempt++) {
+    try {
+      return await fn();
+    } catch (error) {
+      if (!isRateLimitError(error) || attempt >= maxRetries) {
+        throw error;
+      }
+      const delayMs = rateLimitDelayMs(error, attempt);
+      console.log(`Rate limit 도달, ${Math.round(delayMs)}ms 후 재시도 (${attempt + 1}/${maxRetries})...`);
+      await new Promise(resolve => setTimeout(resolve, delayMs));
+    }
+  }
+}
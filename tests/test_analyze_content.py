@@ -0,0 +1,150 @@
+import asyncio
+import io
+import os
+import sys
+
+import pytest
+
+# analyze_content는 임포트 시 누락된 패키지를 설치하므로 의존성이 없으면 건너뜀
+pytest.importorskip("openai")
+pytest.importorskip("numpy")
+pytest.importorskip("orjson")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "scripts"))
+
+import analyze_content  # noqa: E402
+
+
+def baseline_keyword_matches(content, keyword_map):
+    """기존 구현과 같은 키워드별 str.count 집계"""
+    content_lower = content.lower()
+    results = {}
+    for category, keywords in keyword_map.items():
+        category_matches = {}
+        for keyword in keywords:
+            count = content_lower.count(keyword.lower())
+            if count > 0:
+                category_matches[keyword] = count
+        if category_matches:
+            results[category] = category_matches
+    return results
+
+
+@pytest.fixture(autouse=True, params=["python", "ahocorasick"])
+def keyword_backend(request, monkeypatch):
+    # requirements.txt 설치 환경과 같은 순수 Python 경로와 선택적 Aho-Corasick 경로를 모두 검증
+    if request.param == "python":
+        monkeypatch.setattr(analyze_content, "ahocorasick", None)
+    else:
+        monkeypatch.setattr(analyze_content, "ahocorasick", pytest.importorskip("ahocorasick"))
+    return request.param
+
+
+def test_nested_keywords_are_counted_separately():
+    categories = ("Machine Learning", "AI 윤리")
+    content = "Machine Learning and machine learning systems prompt AI 윤리 questions. AI models, 윤리 reviews."
+
+    matches = analyze_content.get_keyword_matches(content, categories)
+
+    keyword_map, _ = analyze_content.get_category_index(categories)
+    assert matches == baseline_keyword_matches(content, keyword_map)
+    assert matches["Machine Learning"]["Machine"] == 2
+    assert matches["Machine Learning"]["Learning"] == 2
+    assert matches["AI 윤리"]["AI"] == 2
+    assert matches["AI 윤리"]["윤리"] == 2
+
+
+def test_overlapping_occurrences_are_counted_like_str_count():
+    categories = ("AA",)
+    content = "aaa AAAA"
+
+    matches = analyze_content.get_keyword_matches(content, categories)
+
+    keyword_map, _ = analyze_content.get_category_index(categories)
+    assert matches == baseline_keyword_matches(content, keyword_map)
+    assert matches["AA"]["aa"] == 3
+
+
+def test_default_categories_match_baseline():
+    categories = tuple(analyze_content.category_keywords)
+    content = "OpenAI released a new GPT model update; the 연구 paper covers LLM 벤치마크 and AI 규제."
+
+    assert analyze_content.get_keyword_matches(content, categories) == baseline_keyword_matches(
+        content, analyze_content.category_keywords
+    )
+
+
+def test_custom_categories_do_not_leak_between_requests():
+    content = "Robotics news: robotics labs and AI 기술"
+
+    analyze_content.get_keyword_matches(content, ("Robotics",))
+    matches = analyze_content.get_keyword_matches(content, ("General",))
+
+    assert "Robotics" not in matches
+    assert "Robotics" not in analyze_content.category_keywords
+
+
+@pytest.fixture
+def offline_analysis(monkeypatch):
+    """임베딩/LLM 호출 없이 analyze_content를 실행"""
+    async def similarities(content, categories, model="text-embedding-3-small"):
+        return {category: 0.5 for category in categories}
+
+    async def llm_analysis(content, categories, model="gpt-4o-mini"):
+        return {"mainCategory": categories[0], "confidence": 0.8, "reasoning": "stub"}
+
+    monkeypatch.setattr(analyze_content, "calculate_semantic_similarity", similarities)
+    monkeypatch.setattr(analyze_content, "run_llm_analysis", llm_analysis)
+
+
+def test_keyword_matches_cover_default_and_requested_categories(offline_analysis):
+    result = asyncio.run(analyze_content.analyze_content({
+        "content": "Robotics labs ship new AI models and open source tools.",
+        "categories": ["Robotics"],
+    }))
+
+    assert "Robotics" in result["keywordMatches"]
+    assert "General" in result["keywordMatches"]
+
+
+def test_worker_writes_one_stdout_line_per_request(offline_analysis, monkeypatch, capsys):
+    async def noisy_analyze(input_data):
+        print("analysis log line")
+        return {"category": input_data["categories"][0]}
+
+    monkeypatch.setattr(analyze_content, "analyze_content", noisy_analyze)
+    monkeypatch.setattr(sys, "stdin", io.StringIO(
+        '{"content": "a", "categories": ["A"]}\n{"content": "b", "categories": ["B"]}\n'
+    ))
+
+    asyncio.run(analyze_content.run_worker())
+
+    out, err = capsys.readouterr()
+    assert out.splitlines() == ['{"category":"A"}', '{"category":"B"}']
+    assert "analysis log line" in err
+
+
+# crawl4aiService.ts가 워커에 보내는 기본 카테고리 (한글 이름 그대로)
+NODE_DEFAULT_CATEGORIES = [
+    "모델 업데이트", "연구 동향", "시장 동향", "개발자 도구",
+    "산업 응용", "윤리 및 규제", "오픈 소스", "기초 연구",
+]
+
+
+def test_agreement_gate_skips_llm_for_node_categories(monkeypatch):
+    async def similarities(content, categories, model="text-embedding-3-small"):
+        return {category: 0.6 if category == "오픈 소스" else 0.3 for category in categories}
+
+    async def llm_analysis(content, categories, model="gpt-4o-mini"):
+        raise AssertionError("키워드와 임베딩이 일치하면 LLM을 호출하지 않아야 함")
+
+    monkeypatch.setattr(analyze_content, "calculate_semantic_similarity", similarities)
+    monkeypatch.setattr(analyze_content, "run_llm_analysis", llm_analysis)
+
+    result = asyncio.run(analyze_content.analyze_content({
+        "content": "새 오픈소스 프로젝트가 깃허브에 공개되었고 라이선스와 풀 리퀘스트 규칙을 정리했다.",
+        "categories": NODE_DEFAULT_CATEGORIES,
+    }))
+
+    assert result["category"] == "오픈 소스"
+    assert result["reasoning"] == "keyword+embedding agreement"
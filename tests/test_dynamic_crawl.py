@@ -0,0 +1,351 @@
+import argparse
+import asyncio
+import io
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "scripts"))
+
+# dynamic_crawl은 임포트 시 sys.stdout을 UTF-8 래퍼로 교체하므로 pytest 출력 캡처를 위해 복원
+# (래퍼가 회수되면 pytest의 캡처 파일까지 닫히므로 참조를 유지)
+_stdout = sys.stdout
+import dynamic_crawl  # noqa: E402
+_utf8_stdout, sys.stdout = sys.stdout, _stdout
+
+
+@pytest.fixture
+def article_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(dynamic_crawl, "ARTICLE_CACHE_PATH", str(tmp_path / "article_cache.db"))
+    monkeypatch.setattr(dynamic_crawl, "article_cache_db", None)
+    yield
+    if dynamic_crawl.article_cache_db is not None:
+        dynamic_crawl.article_cache_db.close()
+
+
+def test_article_cache_is_opt_in():
+    assert dynamic_crawl.DynamicCrawler().article_cache_hours == 0
+
+
+def test_cached_article_omits_raw_html(article_cache):
+    content = {'text': 'body', 'html': '<p>body</p>', 'images': [], 'videos': [], 'date': '2024-01-01'}
+
+    dynamic_crawl.save_cached_article('https://example.com/a', content)
+
+    cached = dynamic_crawl.load_cached_article('https://example.com/a', 3600)
+    assert cached == {'text': 'body', 'images': [], 'videos': [], 'date': '2024-01-01'}
+    assert 'html' in content
+
+
+@pytest.mark.parametrize("date_str", ["   ", "\t", "\n"])
+def test_whitespace_only_date_returns_empty(date_str):
+    assert dynamic_crawl.parse_date(date_str) == ""
+
+
+def test_date_formats_for_empty_string():
+    assert dynamic_crawl._date_formats_for("") == ()
+
+
+class FakeListingPage:
+    """사이트 감지와 링크 추출 evaluate 결과를 돌려주는 목록 페이지 대역"""
+
+    def __init__(self, link_arrays):
+        self.link_arrays = link_arrays
+        self.selectors = None
+
+    async def evaluate(self, script, arg=None):
+        if arg is None:
+            return {'platform': 'blog', 'cms': 'unknown', 'structure': 'unknown', 'features': [],
+                    'selectors': {'articles': [], 'content': [], 'dates': []}}
+        self.selectors = arg[0]
+        return self.link_arrays
+
+
+def test_generic_path_returns_links():
+    crawler = dynamic_crawl.DynamicCrawler()
+    page = FakeListingPage({
+        'hrefs': ['/blog/new-model', 'https://example.com/news/chips'],
+        'texts': ['A new model ships', 'Chip news'],
+        'dates': ['2024-01-02', ''],
+        'scores': [10, 5],
+    })
+
+    structure = asyncio.run(crawler.analyze_page_structure(page, 'https://www.example.com/blog'))
+
+    assert [link['href'] for link in structure['links']] == ['/blog/new-model', 'https://example.com/news/chips']
+    assert structure['structure']['hasContent']
+    assert 'article' in structure['structure']['contentSelector']
+    assert 'h2 a[href]' in page.selectors
+    assert crawler.current_site_config.domain == 'example.com'
+
+
+def test_filter_relevant_links_on_extracted_links():
+    crawler = dynamic_crawl.DynamicCrawler()
+    links = [
+        {'href': '/blog/new-model', 'text': 'A new model ships', 'date': '', 'quality_score': 5},
+        {'href': '/login', 'text': 'Sign in to your account', 'date': '', 'quality_score': 9},
+        {'href': 'javascript:void(0)', 'text': 'Open menu', 'date': '', 'quality_score': 9},
+        {'href': '/news/x', 'text': 'x', 'date': '', 'quality_score': 9},
+        {'href': 'https://example.com/news/chips', 'text': 'Chip news today', 'date': '', 'quality_score': 7},
+    ]
+
+    filtered = asyncio.run(crawler.filter_relevant_links(links, None, 'https://example.com'))
+
+    assert [link['href'] for link in filtered] == [
+        'https://example.com/news/chips',
+        'https://example.com/blog/new-model',
+    ]
+
+
+def test_generic_path_extracts_links_in_browser():
+    async_api = pytest.importorskip("playwright.async_api")
+    html = '''<html><body><main>
+        <article><h2><a href="/blog/first-post">First post about models</a></h2><time datetime="2024-01-02">Jan 2</time></article>
+        <article><h2><a href="/blog/second-post">Second post about chips</a></h2></article>
+        <a href="/login">Sign in</a>
+    </main></body></html>'''
+
+    async def run():
+        async with async_api.async_playwright() as playwright:
+            try:
+                browser = await playwright.chromium.launch()
+            except Exception as e:
+                pytest.skip(f"Chromium을 실행할 수 없음: {e}")
+            try:
+                page = await browser.new_page()
+                await page.set_content(html)
+                crawler = dynamic_crawl.DynamicCrawler()
+                structure = await crawler.analyze_page_structure(page, 'https://example.com/blog')
+                return await crawler.filter_relevant_links(structure['links'], None, 'https://example.com')
+            finally:
+                await browser.close()
+
+    hrefs = [link['href'] for link in asyncio.run(run())]
+    assert hrefs[:2] == ['https://example.com/blog/first-post', 'https://example.com/blog/second-post']
+    assert 'https://example.com/login' not in hrefs
+
+
+class FakePopupPage:
+    """팝업 처리 횟수를 기록하는 페이지 대역 (첫 처리는 선택적으로 실패)"""
+
+    def __init__(self, url, calls, fail=False):
+        self.url = url
+        self.calls = calls
+        self.fail = fail
+        self.keyboard = self
+
+    async def press(self, key):
+        await asyncio.sleep(0.01)
+
+    async def evaluate(self, script, arg=None):
+        self.calls.append(self.url)
+        if self.fail:
+            raise RuntimeError("evaluate failed")
+        return []
+
+
+def test_concurrent_pages_share_one_popup_sweep_per_host():
+    crawler = dynamic_crawl.DynamicCrawler()
+    calls = []
+    pages = [FakePopupPage(f"https://example.com/{i}", calls) for i in range(3)]
+    pages.append(FakePopupPage("https://other.com/", calls))
+
+    async def run():
+        await asyncio.gather(*(crawler.handle_popups_and_overlays(page) for page in pages))
+
+    asyncio.run(run())
+
+    assert calls == ["https://example.com/0", "https://other.com/"]
+
+
+def test_failed_popup_sweep_is_retried_by_waiting_page():
+    crawler = dynamic_crawl.DynamicCrawler()
+    calls = []
+    pages = [
+        FakePopupPage("https://example.com/0", calls, fail=True),
+        FakePopupPage("https://example.com/1", calls),
+        FakePopupPage("https://example.com/2", calls),
+    ]
+
+    async def run():
+        await asyncio.gather(*(crawler.handle_popups_and_overlays(page) for page in pages))
+
+    asyncio.run(run())
+
+    assert calls == ["https://example.com/0", "https://example.com/1"]
+
+
+@pytest.mark.parametrize("date_str", ["N/A", "posted by staff", "x" * 65])
+def test_non_date_strings_are_kept_without_parsing(date_str, monkeypatch):
+    def fail_parse(value):
+        raise AssertionError("parse_date should not be called")
+
+    monkeypatch.setattr(dynamic_crawl, "parse_date", fail_parse)
+
+    assert dynamic_crawl.is_relevant_date(date_str) is True
+
+
+async def fake_crawl_url_targeted(self, url, content_focus=None, max_links=1, timeframe_hours_for_filter=48):
+    print(f"crawling {url}")
+    return dynamic_crawl.CrawlResult(url, stories=[dynamic_crawl.Story(headline=f"story from {url}")])
+
+
+def test_run_once_pairs_results_with_sources(monkeypatch):
+    monkeypatch.setattr(dynamic_crawl.DynamicCrawler, "crawl_url_targeted", fake_crawl_url_targeted)
+    sources = [{"maxItems": 1}, {"identifier": "https://a.example/"}, {"url": "https://b.example/"}]
+
+    source_results = asyncio.run(dynamic_crawl.run_once(dynamic_crawl.DynamicCrawler(), sources))
+
+    assert [(source, result.source) for source, result in source_results] == [
+        (sources[1], "https://a.example/"),
+        (sources[2], "https://b.example/"),
+    ]
+
+
+def test_serve_writes_one_stdout_line_per_job(tmp_path, monkeypatch, capsys):
+    async def noop(self):
+        print("browser log line")
+
+    monkeypatch.setattr(dynamic_crawl.DynamicCrawler, "initialize", noop)
+    monkeypatch.setattr(dynamic_crawl.DynamicCrawler, "close", noop)
+    monkeypatch.setattr(dynamic_crawl.DynamicCrawler, "crawl_url_targeted", fake_crawl_url_targeted)
+    first, second = tmp_path / "first.json", tmp_path / "second.json"
+    jobs = [
+        {"sources_config": [{"identifier": "https://a.example/"}], "output": str(first)},
+        {"sources_config": [{"maxItems": 1}, {"url": "https://b.example/"}, {"url": "https://c.example/"}], "output": str(second)},
+    ]
+    monkeypatch.setattr(sys, "stdin", io.StringIO("".join(json.dumps(job) + "\n" for job in jobs)))
+    args = argparse.Namespace(
+        llm_provider="openai", headless=True, show_browser=False, target_date=None, max_concurrency=2,
+        user_data_dir=None, article_cache_hours=0, storage_state=None, output="crawl_results.json",
+        content_focus=None, timeframe_hours=48,
+    )
+
+    asyncio.run(dynamic_crawl.serve(args))
+
+    out, err = capsys.readouterr()
+    responses = [json.loads(line) for line in out.splitlines()]
+    assert [(response["output"], response["sites"], response["stories"]) for response in responses] == [
+        (str(first), 1, 1),
+        (str(second), 2, 2),
+    ]
+    assert "crawling https://a.example/" in err
+    assert len(json.loads(second.read_text(encoding="utf-8"))) == 2
+
+
+def make_result(url, headline):
+    return dynamic_crawl.CrawlResult(url, stories=[dynamic_crawl.Story(headline=headline, link=url)])
+
+
+def test_result_writer_empty_run(tmp_path):
+    output = tmp_path / "results.json"
+
+    with dynamic_crawl.ResultWriter(str(output)) as writer:
+        pass
+
+    assert writer.count == 0
+    assert json.loads(output.read_text(encoding="utf-8")) == []
+
+
+def test_result_writer_appends_results_as_valid_json(tmp_path):
+    output = tmp_path / "results.json"
+
+    with dynamic_crawl.ResultWriter(str(output)) as writer:
+        for i in range(3):
+            writer.write(make_result(f"https://example.com/{i}", f"story {i}"))
+            # 기록할 때마다 파일 전체가 유효한 JSON 배열이어야 함
+            assert len(json.loads(output.read_text(encoding="utf-8"))) == i + 1
+
+    results = json.loads(output.read_text(encoding="utf-8"))
+    assert [result["source"] for result in results] == [f"https://example.com/{i}" for i in range(3)]
+    assert results[2]["stories"][0]["headline"] == "story 2"
+    assert writer.error is None
+
+
+def test_result_writer_failure_keeps_written_results_and_skips_later_writes(tmp_path):
+    output = tmp_path / "results.json"
+    unserializable = dynamic_crawl.CrawlResult("https://example.com/bad", site_info={"value": object()})
+
+    with dynamic_crawl.ResultWriter(str(output)) as writer:
+        writer.write(make_result("https://example.com/0", "story 0"))
+        writer.write(unserializable)
+        writer.write(make_result("https://example.com/2", "story 2"))
+
+    assert isinstance(writer.error, TypeError)
+    assert writer.count == 1
+    assert [result["source"] for result in json.loads(output.read_text(encoding="utf-8"))] == ["https://example.com/0"]
+
+
+def test_main_falls_back_to_backup_file_when_result_writing_fails(tmp_path, monkeypatch):
+    async def noop(self):
+        pass
+
+    output = tmp_path / "results.json"
+    original_write = dynamic_crawl.ResultWriter.write
+
+    def failing_write(self, result):
+        # 지정한 결과 파일에만 기록 실패를 발생시키고 백업 파일은 정상 기록
+        if self.output_path == str(output):
+            self.error = OSError("disk full")
+            return
+        original_write(self, result)
+
+    monkeypatch.setattr(dynamic_crawl.DynamicCrawler, "initialize", noop)
+    monkeypatch.setattr(dynamic_crawl.DynamicCrawler, "close", noop)
+    monkeypatch.setattr(dynamic_crawl.DynamicCrawler, "crawl_url_targeted", fake_crawl_url_targeted)
+    monkeypatch.setattr(dynamic_crawl.ResultWriter, "write", failing_write)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, "argv", [
+        "dynamic_crawl.py", "--output", str(output),
+        "--sources_config", json.dumps([{"identifier": "https://a.example/"}, {"url": "https://b.example/"}]),
+    ])
+
+    asyncio.run(dynamic_crawl.main())
+
+    backups = list(tmp_path.glob("crawl_results_backup_*.json"))
+    assert len(backups) == 1
+    results = json.loads(backups[0].read_text(encoding="utf-8"))
+    assert [result["source"] for result in results] == ["https://a.example/", "https://b.example/"]
+
+
+class StrptimeOnlyDateParser:
+    """dateutil의 관대한 parse 단계까지 가지 않았는지 확인하는 대역 (isoparse는 그대로 사용)"""
+
+    def __init__(self, real_parser):
+        self.isoparse = real_parser.isoparse
+
+    def parse(self, *args, **kwargs):
+        raise AssertionError("shape-matched strptime formats should have handled this date")
+
+
+@pytest.fixture
+def strptime_only(monkeypatch):
+    monkeypatch.setattr(dynamic_crawl, "get_date_parser", lambda: StrptimeOnlyDateParser(pytest.importorskip("dateutil.parser")))
+    dynamic_crawl._parse_absolute_date.cache_clear()
+    yield
+    dynamic_crawl._parse_absolute_date.cache_clear()
+
+
+@pytest.mark.parametrize("date_str", [
+    "15.01.2024", "01/15/2024", "15/01/2024", "15-Jan-2024", "15 Jan 2024",
+    "Jan 15, 2024", "January 15 2024", "Mon, 15 Jan 2024", "2024년 1월 15일", "20240115",
+])
+def test_shape_matched_formats_parse_dates(date_str, strptime_only):
+    assert dynamic_crawl.parse_date(date_str) == "2024-01-15"
+
+
+@pytest.mark.parametrize("date_str, separator", [
+    ("15.01.2024", "."), ("01/15/2024", "/"), ("15-Jan-2024", "-"), ("15 Jan 2024", " "),
+])
+def test_date_formats_for_numeric_start_uses_first_separator(date_str, separator):
+    formats = dynamic_crawl._date_formats_for(date_str)
+
+    assert formats
+    assert all(fmt[1] not in "aAbB" and fmt[2] == separator for fmt in formats)
+
+
+def test_date_formats_for_alpha_and_digit_only_strings():
+    assert all(fmt[1] in "aAbB" for fmt in dynamic_crawl._date_formats_for("Jan 15, 2024"))
+    assert set(dynamic_crawl._date_formats_for("20240115")) == {"%Y%m%d", "%Y%m%d%H%M%S", "%Y%m%d%H%M"}